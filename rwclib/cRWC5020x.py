@@ -20,6 +20,8 @@
 ##############################################################################
 
 # Built-in imports
+import contextlib
+import datetime
 import sys
 import time
 import ipaddress
@@ -28,6 +30,28 @@ import ipaddress
 import serial
 
 from rwclib.cRWCSerialSetup import RwcSerialSetup
+from rwclib import cRWCCapabilities
+from rwclib import cRWCIdentity
+from rwclib import cRWCLinkMsg
+from rwclib import cRWCMatcher
+from rwclib import cRWCParamTable
+from rwclib import cRWCProfile
+from rwclib import cRWCRegion
+from rwclib import cRWCShadowState
+from rwclib import cRWCValidator
+from rwclib.cRWCAirtime import RwcDutyCycle
+from rwclib.cRWCCapabilities import RwcCapabilities
+from rwclib.cRWCCollector import RwcMsgCollector
+from rwclib.cRWCIdentity import RwcIdentity
+from rwclib.cRWCLatency import RwcLatencyStats
+from rwclib.cRWCLinkMsg import RwcMsgParser
+from rwclib.cRWCMacCorrelator import RwcMacCorrelator
+from rwclib.cRWCMacScenario import RwcMacScenario
+from rwclib.cRWCProfile import RwcProfile
+from rwclib.cRWCShadowState import RwcShadowState
+from rwclib.cRWCSnapshot import RwcSnapshot
+from rwclib.cRWCTransaction import RwcTransaction
+from rwclib.cRWCTransaction import RwcTransactionError
 
 class RWCTesterApi(RwcSerialSetup):
     '''
@@ -52,6 +76,12 @@ class RWCTesterApi(RwcSerialSetup):
         '''
         RwcSerialSetup.__init__(self, port, addr)
 
+        # RwcCapabilities found by discover(), used to gate commands
+        self.capabilities = None
+
+        # Mode switch times, per firmware version
+        self.latency = RwcLatencyStats()
+
     # Common Command Methods
     def query_identification(self):
         '''
@@ -163,39 +193,46 @@ class RWCTesterApi(RwcSerialSetup):
             raise Exception('Command not supported in current version')
             
     # System Configuration Command Methods
-    def set_mode(self, mode):
+    def set_mode(self, mode, wait = False, timeout = 5):
         '''
         Configure an operating mode (or Main Menu) of RWC5020A
 
-        :param mode: Testing mode (EDT, GWT, NST)
+        :param mode: Testing mode (EDT, GWT, NST_TX, NST_RX, NST_MFG)
+        :param wait: True to return only once the tester runs the new
+                     mode, see wait_mode(); the time taken is recorded 
+                     only when the mode changed
+        :param timeout: longest wait in seconds
 
         :return: ACK on success, NAK on failure
 
         '''
+        if self.capabilities:
+            self.capabilities.require_mode(mode)
+
+        previous = None
+        suppressed = 0
+        if wait and self.txn is None:
+            previous = self.query_mode()
+            if self.shadow:
+                suppressed = self.shadow.suppressed
+
         cmdTestModeParam = mode
-        if cmdTestModeParam == 'EDT':
-            cmdTestMode = 'CONF:TESTER_MODE EDT' + '\n'
+        if cmdTestModeParam in ('EDT', 'GWT', 'NST_TX', 'NST_RX', 
+                                'NST_MFG'):
+            cmdTestMode = 'CONF:TESTER_MODE ' + cmdTestModeParam + '\n'
             result = RwcSerialSetup.transceive(self, cmdTestMode)
-            return result
-        elif cmdTestModeParam == 'GWT':
-            cmdTestMode = 'CONF:TESTER_MODE GWT' + '\n'
-            result = RwcSerialSetup.transceive(self, cmdTestMode)
-            return result
-        elif cmdTestModeParam == 'NST_TX':
-            cmdTestMode = 'CONF:TESTER_MODE NST_TX' + '\n'
-            result = RwcSerialSetup.transceive(self, cmdTestMode)
-            return result
-        elif cmdTestModeParam == 'NST_RX':
-            cmdTestMode = 'CONF:TESTER_MODE NST_RX' + '\n'
-            result = RwcSerialSetup.transceive(self, cmdTestMode)
-            return result
-        elif cmdTestModeParam == 'NST_MFG':
-            cmdTestMode = 'CONF:TESTER_MODE NST_MFG' + '\n'
-            result = RwcSerialSetup.transceive(self, cmdTestMode)
-            return result
         else:
             raise Exception('Invalid parameter received.')
 
+        if wait and result == 'ACK':
+            switched = str(previous).strip() != mode
+            if self.shadow and self.shadow.suppressed != suppressed:
+                switched = False
+            if self.wait_mode(mode, timeout, switched) is None:
+                raise Exception('Tester mode did not change to {} in {} s'
+                                .format(mode, timeout))
+        return result
+
     def query_mode(self):
         '''
         Read the operating mode (or Main Menu) of RWC5020A
@@ -641,96 +678,10 @@ class RWCTesterApi(RwcSerialSetup):
         '''
         chgroupnum = int(chgrouprange)
         chregion = self.protocol_getregion()
-        if (chregion == 'US_915' 
-            or chregion == 'AU_915' or chregion == 'CN_470'):
-            if chgroupnum == 0:
-                if chregion == 'CN_470':
-                    cmdSetChGroup = 'CONF:RF:CH_GROUP 00~07' + '\n'
-                else:
-                    cmdSetChGroup = 'CONF:RF:CH_GROUP 00~07,64' + '\n'
-                result = RwcSerialSetup.transceive(self, cmdSetChGroup)
-                return result
-            elif chgroupnum == 8:
-                if chregion == 'CN_470':
-                    cmdSetChGroup = 'CONF:RF:CH_GROUP 08~15' + '\n'
-                else:
-                    cmdSetChGroup = 'CONF:RF:CH_GROUP 08~15,65' + '\n'
-                result = RwcSerialSetup.transceive(self, cmdSetChGroup)
-                return result
-            elif chgroupnum == 16:
-                if chregion == 'CN_470':
-                    cmdSetChGroup = 'CONF:RF:CH_GROUP 16~23' + '\n'
-                else:
-                    cmdSetChGroup = 'CONF:RF:CH_GROUP 16~23,66' + '\n'
-                result = RwcSerialSetup.transceive(self, cmdSetChGroup)
-                return result
-            elif chgroupnum == 24:
-                if chregion == 'CN_470':
-                    cmdSetChGroup = 'CONF:RF:CH_GROUP 24~31' + '\n'
-                else:
-                    cmdSetChGroup = 'CONF:RF:CH_GROUP 24~31,67' + '\n'
-                result = RwcSerialSetup.transceive(self, cmdSetChGroup)
-                return result
-            elif chgroupnum == 32:
-                if chregion == 'CN_470':
-                    cmdSetChGroup = 'CONF:RF:CH_GROUP 32~39' + '\n'
-                else:
-                    cmdSetChGroup = 'CONF:RF:CH_GROUP 32~39,68' + '\n'
-                result = RwcSerialSetup.transceive(self, cmdSetChGroup)
-                return result
-            elif chgroupnum == 40:
-                if chregion == 'CN_470':
-                    cmdSetChGroup = 'CONF:RF:CH_GROUP 40~47' + '\n'
-                else:
-                    cmdSetChGroup = 'CONF:RF:CH_GROUP 40~47,69' + '\n'
-                result = RwcSerialSetup.transceive(self, cmdSetChGroup)
-                return result
-            elif chgroupnum == 48:
-                if chregion == 'CN_470':
-                    cmdSetChGroup = 'CONF:RF:CH_GROUP 48~55' + '\n'
-                else:
-                    cmdSetChGroup = 'CONF:RF:CH_GROUP 48~55,70' + '\n'
-                result = RwcSerialSetup.transceive(self, cmdSetChGroup)
-                return result
-            elif chgroupnum == 56:
-                if chregion == 'CN_470':
-                    cmdSetChGroup = 'CONF:RF:CH_GROUP 56~63' + '\n'
-                else:
-                    cmdSetChGroup = 'CONF:RF:CH_GROUP 56~63,71' + '\n'
-                result = RwcSerialSetup.transceive(self, cmdSetChGroup)
-                return result
-            elif chgroupnum == 64:
-                if chregion == 'CN_470':
-                    cmdSetChGroup = 'CONF:RF:CH_GROUP 64~71' + '\n'
-                else:
-                    raise Exception('Invalid Channel Group Region received.')
-                result = RwcSerialSetup.transceive(self, cmdSetChGroup)
-                return result
-            elif chgroupnum == 72:
-                if chregion == 'CN_470':
-                    cmdSetChGroup = 'CONF:RF:CH_GROUP 72~79' + '\n'
-                else:
-                    raise Exception('Invalid Channel Group Region received.')
-                result = RwcSerialSetup.transceive(self, cmdSetChGroup)
-                return result
-            elif chgroupnum == 80:
-                if chregion == 'CN_470':
-                    cmdSetChGroup = 'CONF:RF:CH_GROUP 80~87' + '\n'
-                else:
-                    raise Exception('Invalid Channel Group Region received.')
-                result = RwcSerialSetup.transceive(self, cmdSetChGroup)
-                return result
-            elif chgroupnum == 88:
-                if chregion == 'CN_470':
-                    cmdSetChGroup = 'CONF:RF:CH_GROUP 88~95' + '\n'
-                else:
-                    raise Exception('Invalid Channel Group Region received.')
-                result = RwcSerialSetup.transceive(self, cmdSetChGroup)
-                return result
-            else:
-                raise Exception('Invalid Channel Group Parameter received.')
-        else:
-            raise Exception('Invalid Channel Group Region received.')
+        cmdChGroup = cRWCRegion.channel_group(chregion, chgroupnum)
+        cmdSetChGroup = 'CONF:RF:CH_GROUP ' + cmdChGroup + '\n'
+        result = RwcSerialSetup.transceive(self, cmdSetChGroup)
+        return result
 
     def rf_getchannelgroup(self):
         '''
@@ -760,8 +711,7 @@ class RWCTesterApi(RwcSerialSetup):
 
         '''
         freqnum = int(ulchfreqrange)
-        if (freqnum >= 400 and freqnum <= 510
-        ) or (freqnum >= 862 and freqnum <= 960):
+        if cRWCRegion.in_tester_band(freqnum):
             cmdUlChFreqRange = str(freqnum)
             cmdSetUplinkChannel = 'CONF:RF:UL_CH ' + cmdUlChFreqRange + '\n'
             result = RwcSerialSetup.transceive(self, cmdSetUplinkChannel)
@@ -777,6 +727,9 @@ class RWCTesterApi(RwcSerialSetup):
         * param=0,1,...,95 (CN)
         * param=0,1,...,7 (others)
 
+        The channels and frequencies of a region are known without the
+        tester, see query_regioninfo().
+
         :Parameters: N/A (Query only)
 
         :return: -
@@ -995,13 +948,12 @@ class RWCTesterApi(RwcSerialSetup):
         :return: ACK on success, NAK on failure
 
         '''
-        chModeList = ['AS920-923', 'AS923-925']
         cmdSupportedVersion = [
             '1.200', '1.203', '1.204', '1.206', 
             '1.210', '1.220', '1.221', '1.222']
         verStatus = self.validate_sys_swversion(cmdSupportedVersion)
 
-        if verStatus and mode in chModeList:
+        if verStatus and mode in cRWCRegion.AS923_CHANNEL_MODES:
             cmdSetAsChMode = 'CONF:RF:AS923_CH_MODE ' + mode + '\n'
             result = RwcSerialSetup.transceive(self, cmdSetAsChMode)
             return result
@@ -1035,17 +987,8 @@ class RWCTesterApi(RwcSerialSetup):
         :return: ACK on success, NAK on failure
 
         '''
-        cmdAsChannelGroup = mode
-        if cmdAsChannelGroup == 'AS_923-1':
-            cmdSetAsChGroup = 'CONF:RF:AS923_CH_GROUP AS_923-1' + '\n'
-            result = RwcSerialSetup.transceive(self, cmdSetAsChGroup)
-            return result
-        elif cmdAsChannelGroup == 'AS_923-2':
-            cmdSetAsChGroup = 'CONF:RF:AS923_CH_GROUP AS_923-2' + '\n'
-            result = RwcSerialSetup.transceive(self, cmdSetAsChGroup)
-            return result
-        elif cmdAsChannelGroup == 'AS_923-3':
-            cmdSetAsChGroup = 'CONF:RF:AS923_CH_GROUP AS_923-3' + '\n'
+        if mode in cRWCRegion.AS923_CHANNEL_GROUPS:
+            cmdSetAsChGroup = 'CONF:RF:AS923_CH_GROUP ' + mode + '\n'
             result = RwcSerialSetup.transceive(self, cmdSetAsChGroup)
             return result
         else:
@@ -1109,8 +1052,7 @@ class RWCTesterApi(RwcSerialSetup):
         :return: ACK on success, NAK on failure
         
         '''
-        planTypelist = ['20M_A', '20M_B', '26M_A', '26M_B']
-        if planType in planTypelist:
+        if planType in cRWCRegion.CN470_CHANNEL_PLANS:
             cmdSetChPlan = 'CONF:RF:CN470_CH_PLAN ' + planType + '\n'
             result = RwcSerialSetup.transceive(self, cmdSetChPlan)
             return result
@@ -2099,6 +2041,104 @@ class RWCTesterApi(RwcSerialSetup):
         result = RwcSerialSetup.transceive(self, cmdGetSecond)
         return result
 
+    def protocol_setdatetime(self, dt = None):
+        '''
+        Configure the date and time for TIME information in one 
+        pipelined burst, instead of six round trips.
+
+        The round trip time is measured first and the burst is sent 
+        when the time it carries, corrected by half a round trip, 
+        falls on a whole second; the tester clock only counts seconds.
+        The clock is then read back to report the remaining offset.
+
+        :param dt: datetime object; None for the current local time.
+                   It stands for the moment of the call, the time spent
+                   in this method is added. The hour must be 1 ~ 23, 
+                   see protocol_sethour(); a time that reaches hour 0 
+                   before it is written (e.g. 23:59:59) raises an 
+                   exception and nothing is sent.
+
+        :return: dictionary with the datetime written (target), the 
+                 measured round trip time (rtt), the datetime read back
+                 (tester) and its offset in seconds (offset; tester 
+                 behind is negative). RwcTransactionError lists every 
+                 field not acknowledged.
+
+        '''
+        startTime = time.time()
+        if dt is None:
+            dt = datetime.datetime.now()
+        earliest = (dt.replace(microsecond = 0) 
+                    + datetime.timedelta(seconds = 1))
+        if dt.hour == 0 or earliest.hour == 0:
+            raise Exception('Invalid parameter received: {} reaches hour 0,'
+                            ' the tester hour is 1 ~ 23.'.format(dt))
+
+        cmdGetSecond = 'READ:PROTOCOL:SECOND?' + '\n'
+        rtt = None
+        for count in range(3):
+            sendTime = time.time()
+            self.transceive_port(cmdGetSecond)
+            elapsed = time.time() - sendTime
+            if rtt is None or elapsed < rtt:
+                rtt = elapsed
+
+        # Time the tester holds when the burst arrives
+        arrival = dt + datetime.timedelta(
+            seconds = time.time() - startTime + rtt / 2)
+        wait = (1000000 - arrival.microsecond) % 1000000 / 1000000.0
+        time.sleep(wait)
+        arrival += datetime.timedelta(seconds = wait)
+        target = arrival.replace(microsecond = 0)
+        if arrival.microsecond >= 500000:
+            target += datetime.timedelta(seconds = 1)
+        if target.hour == 0:
+            raise Exception('Invalid parameter received: {} reaches hour 0,'
+                            ' the tester hour is 1 ~ 23.'.format(target))
+
+        config = [('PROTOCOL:YEAR', target.year),
+                  ('PROTOCOL:MONTH', target.month),
+                  ('PROTOCOL:DAY', target.day),
+                  ('PROTOCOL:HOUR', target.hour),
+                  ('PROTOCOL:MINUTE', target.minute),
+                  ('PROTOCOL:SECOND', target.second)]
+        cmdList = [cRWCParamTable.set_command(key, value) 
+                   for key, value in config]
+        results = self.transceive_batch(cmdList)
+        failed = [(rwccmd, result) for rwccmd, result 
+                  in zip(cmdList, results) if result != 'ACK']
+        if failed:
+            raise RwcTransactionError(failed)
+
+        readTime = time.time()
+        tester = self.protocol_getdatetime()
+        offset = None
+        if tester is not None:
+            readTime = (readTime + time.time()) / 2
+            expected = dt + datetime.timedelta(seconds = readTime - startTime)
+            offset = (tester - expected).total_seconds()
+        return {'target': target, 'rtt': rtt, 'tester': tester, 
+                'offset': offset}
+
+    def protocol_getdatetime(self):
+        '''
+        Read the date and time for TIME information, the six fields in 
+        one pipelined batch
+
+        :Parameters: N/A (Query only)
+
+        :return: datetime object; None on failure
+
+        '''
+        cmdList = ['READ:PROTOCOL:' + name + '?' + '\n' for name in 
+                   ('YEAR', 'MONTH', 'DAY', 'HOUR', 'MINUTE', 'SECOND')]
+        results = self.transceive_batch(cmdList)
+        try:
+            return datetime.datetime(*[int(float(str(result))) 
+                                       for result in results])
+        except (TypeError, ValueError):
+            return None
+
     def protocol_setlinkmargin(self, linkmargin):
         '''
         Configure the link margin value in dB for LinkCheckAns
@@ -3524,6 +3564,198 @@ class RWCTesterApi(RwcSerialSetup):
         result = RwcSerialSetup.transceive(self, cmdGetReadMsg)
         return result
 
+    def link_msgparser(self):
+        '''
+        Build the parser of the link messages for the current display
+        flags; the flags are read in one pipelined batch
+
+        :Parameters: N/A
+
+        :return: RwcMsgParser object, see cRWCLinkMsg
+
+        '''
+        cmdList = [cRWCShadowState.query_command(flag) 
+                   for flag in cRWCLinkMsg.DISPLAY_FLAGS]
+        results = self.transceive_batch(cmdList)
+        return RwcMsgParser(dict(zip(cRWCLinkMsg.DISPLAY_FLAGS, results)))
+
+    def link_setfieldprofile(self, profile):
+        '''
+        Set every link message display flag in one pipelined batch, so
+        READ:LINK:MSG? only sends the fields a test needs. Flags already
+        set are skipped when the shadow state is enabled. The running
+        link message collector switches to the new layout.
+
+        E.g.
+            parser = rwc.link_setfieldprofile('LEAN')
+            parser = rwc.link_setfieldprofile(['fcnt', 'dr', 'power'])
+
+        :param profile: FULL, LEAN, MAC, RADIO (see
+                        cRWCLinkMsg.FIELD_PROFILES), or list of field
+                        names of RwcLinkMsg
+
+        :return: RwcMsgParser object for the new layout
+
+        '''
+        flags = cRWCLinkMsg.display_flags(profile)
+        cmdList = [cRWCParamTable.set_command(flag, value)
+                   for flag, value in flags.items()]
+        with self.port_lock:
+            results = self.transceive_batch(cmdList)
+            failed = [(rwccmd, result) for rwccmd, result
+                      in zip(cmdList, results) if result != 'ACK']
+            if failed:
+                raise RwcTransactionError(failed)
+            parser = RwcMsgParser(flags)
+            if self.collector:
+                self.collector.parser = parser
+        return parser
+
+    def link_readmsgrecord(self, parser = None):
+        '''
+        Read a link message and parse it into a record
+
+        :param parser: RwcMsgParser from link_msgparser(); None to read
+                       the display flags first. Pass it when reading
+                       many messages, the flags are then read once.
+
+        :return: RwcLinkMsg object with time, direction, msg_type, 
+                 fcnt, port, dr, power, mac, payload, ...; None when 
+                 no message is available. While the collector runs the
+                 message is taken from its buffer.
+
+        '''
+        if self.collector and self.collector.is_running():
+            return self.collector.get(0)
+        if parser is None:
+            parser = self.link_msgparser()
+        cmdGetReadMsg = 'READ:LINK:MSG?' + '\n'
+        result = RwcSerialSetup.transceive(self, cmdGetReadMsg)
+        return parser.parse(result)
+
+    def iter_link_messages(self, timeout = None, cancel = None, 
+                           parser = None, min_interval = .0500, 
+                           max_interval = 1.0000):
+        '''
+        Generator of the link messages, read as they arrive. Queued 
+        messages are read back to back; while none is available the 
+        poll interval doubles from min_interval up to max_interval, and
+        drops back as soon as a message arrives.
+
+        E.g.
+            for msg in rwc.iter_link_messages(timeout = 30):
+                if msg.mac == 'EchoResponse':
+                    break
+
+        :param timeout: seconds after which the generator stops; None 
+                        to run until cancelled
+        :param cancel: optional threading.Event; the generator stops 
+                       once it is set
+        :param parser: RwcMsgParser; None to read the display flags 
+                       first, see link_msgparser()
+        :param min_interval: shortest poll interval in seconds
+        :param max_interval: longest poll interval in seconds
+
+        :return: yields RwcLinkMsg objects; while the collector runs 
+                 they are taken from its buffer
+
+        '''
+        deadline = None
+        if timeout is not None:
+            deadline = time.time() + timeout
+
+        collector = self.collector
+        while collector and collector.is_running():
+            if cancel is not None and cancel.is_set():
+                return
+            wait = max_interval
+            if deadline is not None:
+                wait = min(wait, deadline - time.time())
+                if wait <= 0:
+                    return
+            record = collector.get(wait)
+            if record is not None:
+                yield record
+
+        if parser is None:
+            parser = self.link_msgparser()
+        cmdGetReadMsg = 'READ:LINK:MSG?' + '\n'
+        interval = min_interval
+        while cancel is None or not cancel.is_set():
+            if deadline is not None and time.time() >= deadline:
+                return
+            record = parser.parse(
+                RwcSerialSetup.transceive(self, cmdGetReadMsg))
+            if record is not None:
+                interval = min_interval
+                yield record
+                continue
+
+            wait = interval
+            if deadline is not None:
+                wait = max(0, min(wait, deadline - time.time()))
+            if cancel is None:
+                time.sleep(wait)
+            else:
+                cancel.wait(wait)
+            interval = min(interval * 2, max_interval)
+
+    def wait_for(self, match, timeout = 10, cancel = None, parser = None):
+        '''
+        Wait for a link message matching a condition; returns as soon
+        as it is read, other messages are skipped
+
+        E.g.
+            rwc.wait_for('DlCounter', timeout = 10)
+            rwc.wait_for({'msg_type': 'ConfUp', 'fcnt': 3})
+
+        :param match: condition, see cRWCMatcher.compile_matcher(); a
+                      str is a MAC command name
+        :param timeout: seconds to wait; None to wait until cancelled
+        :param cancel: optional threading.Event stopping the wait
+        :param parser: RwcMsgParser; None to read the display flags
+                       first, see link_msgparser()
+
+        :return: matching RwcLinkMsg object; None on timeout
+
+        '''
+        records = self.wait_for_sequence([match], timeout, cancel, parser)
+        if records is None:
+            return None
+        return records[0]
+
+    def wait_for_sequence(self, matches, timeout = 10, cancel = None,
+                          parser = None):
+        '''
+        Wait for link messages matching conditions in order, e.g. a MAC
+        request and then its answer:
+            rwc.wait_for_sequence(['ActivateTM', 'DlCounter'])
+
+        Messages not matching the next condition are skipped.
+
+        :param matches: list of conditions, see wait_for()
+        :param timeout: seconds to wait for the whole sequence; None to
+                        wait until cancelled
+        :param cancel: optional threading.Event stopping the wait
+        :param parser: RwcMsgParser; None to read the display flags
+                       first, see link_msgparser()
+
+        :return: list of the matching RwcLinkMsg objects; None on
+                 timeout
+
+        '''
+        predicates = [cRWCMatcher.compile_matcher(match)
+                      for match in matches]
+        records = []
+        if not predicates:
+            return records
+        for record in self.iter_link_messages(timeout, cancel, parser):
+            if predicates[len(records)](record):
+                records.append(record)
+                if len(records) == len(predicates):
+                    return records
+        return None
+
     def link_sendmac(self):
         '''
         Force RWC5020A to send the defined MAC command
@@ -10759,4 +10991,656 @@ class RWCTesterApi(RwcSerialSetup):
             return True
         else:
             raise Exception('Command not supported in current version')
-        
\ No newline at end of file
+
+    # Capability Discovery Methods
+    def discover(self):
+        '''
+        Read the identification, software version, serial number, 
+        tester mode and the eight option flags in one pipelined batch.
+        The result is kept in capabilities: set_mode() and apply() 
+        refuse a mode whose option the tester reports OFF, and the 
+        version and option getters are answered from memory afterwards.
+
+        :Parameters: N/A
+
+        :return: RwcCapabilities object
+
+        '''
+        keys = cRWCIdentity.IDENTITY_KEYS + ('TESTER_MODE',)
+        cmdList = [cRWCIdentity.IDN_COMMAND]
+        cmdList.extend(cRWCShadowState.query_command(key) for key in keys)
+        results = self.transceive_port_batch(cmdList)
+
+        idn = results[0]
+        values = dict(zip(keys, results[1:]))
+        if idn is None or idn == 'NAK':
+            raise Exception('Unable to read the tester identification')
+
+        options = dict((name, cRWCCapabilities.option_state(
+                            values['SYSTEM:OPTION_' + name]))
+                       for name in cRWCCapabilities.OPTION_NAMES)
+        self.capabilities = RwcCapabilities(
+            idn, values['SYSTEM:SW_VERSION'], values['SYSTEM:SERIAL_NUM'],
+            values['TESTER_MODE'], options)
+
+        identityValues = dict((key, values[key]) 
+                              for key in cRWCIdentity.IDENTITY_KEYS)
+        if None not in identityValues.values():
+            if self.identity:
+                self.identity.store(idn, identityValues)
+            else:
+                self.identity = RwcIdentity()
+                self.identity.idn = idn
+                self.identity.values = identityValues
+
+        if self.shadow and values['TESTER_MODE'] not in (None, 'NAK'):
+            self.shadow.seed('TESTER_MODE', values['TESTER_MODE'])
+        return self.capabilities
+
+    # Link Message Collector Methods
+    def start_collector(self, capacity = 4096, capture = None, 
+                        trace = None, correlator = None):
+        '''
+        Start a background thread reading the link messages into a ring
+        buffer, see cRWCCollector. link_readmsgrecord() and 
+        iter_link_messages() then read the buffer instead of the port;
+        other commands share the port with the thread.
+
+        :param capacity: number of messages kept; the oldest message is
+                         dropped and counted when the buffer is full
+        :param capture: optional RwcCapture keeping every message of 
+                        a long capture for analysis, see cRWCCapture
+        :param trace: optional RwcTraceWriter keeping every message in 
+                      a binary trace file, see cRWCTrace, or 
+                      RwcPcapWriter writing them for Wireshark, see 
+                      cRWCPcap
+        :param correlator: optional RwcMacCorrelator pairing the MAC 
+                           requests with the DUT answers, see 
+                           mac_correlator()
+
+        :return: RwcMsgCollector object
+
+        '''
+        if self.collector and self.collector.is_running():
+            return self.collector
+        self.collector = RwcMsgCollector(self, self.link_msgparser(), 
+                                         capacity, capture, trace, 
+                                         correlator)
+        self.collector.start()
+        return self.collector
+
+    def stop_collector(self):
+        '''
+        Stop the link message collector; messages still buffered are 
+        returned. The last error of the collector thread, if any, is
+        logged.
+
+        :Parameters: N/A
+
+        :return: list of RwcLinkMsg objects, oldest first
+
+        '''
+        if self.collector is None:
+            return []
+        self.collector.stop()
+        if self.collector.last_error is not None:
+            self.logger.error('Link message collector: {} errors, last: {!r}'
+                              .format(self.collector.errors,
+                                      self.collector.last_error))
+        records = self.collector.drain()
+        self.collector = None
+        return records
+
+    def mac_correlator(self, timeout = 120, limit = 16, on_pair = None):
+        '''
+        Create a correlator pairing the MAC requests sent to the DUT 
+        (link_setinstantmaccmd(), link_sendmac()) with its answers, to
+        pass to start_collector(). Its stats() give the answer latency 
+        and FCnt distance of every request, see cRWCMacCorrelator.
+
+        E.g.
+            correlator = rwc.mac_correlator()
+            rwc.start_collector(correlator = correlator)
+
+        :param timeout: seconds after which an unanswered request is 
+                        counted as missed
+        :param limit: pending requests kept per MAC command
+        :param on_pair: optional callable(request, answer, latency, 
+                        distance) called for every answered request
+
+        :return: RwcMacCorrelator object
+
+        '''
+        version = None
+        if self.capabilities:
+            version = self.capabilities.version
+        elif self.identity:
+            version = self.identity.values.get('SYSTEM:SW_VERSION')
+        return RwcMacCorrelator(timeout, limit, version = version, 
+                                on_pair = on_pair)
+
+    def duty_cycle_monitor(self, window = 3600, region = None):
+        '''
+        Create a sliding window duty cycle of the DUT uplinks, computed
+        on the host per channel and regulatory sub-band from the time on
+        air of each message, unlike the single value of 
+        link_getdutycycle(). Feed it a capture with update(), see 
+        cRWCAirtime.
+
+        E.g.
+            capture = RwcCapture()
+            rwc.start_collector(capture = capture)
+            monitor = rwc.duty_cycle_monitor()
+            monitor.update(capture)
+            print(monitor.violations())
+
+        :param window: window length in seconds
+        :param region: region name; None for the region of the tester
+
+        :return: RwcDutyCycle object
+
+        '''
+        return RwcDutyCycle(self.query_regioninfo(region), window)
+
+    # Regional Parameter Methods
+    def query_regioninfo(self, region = None):
+        '''
+        Return the regional parameters (channel frequencies, channel 
+        groups, data rates, RX2 defaults) of a region, without talking 
+        to the tester when the region is given
+
+        :param region: region name; None for the region of the tester
+
+        :return: RwcRegion object, see cRWCRegion
+
+        '''
+        if region is None:
+            region = self.protocol_getregion()
+        return cRWCRegion.get_region(region)
+
+    # Mode Switch Methods
+    def wait_mode(self, mode, timeout = 5, record = True):
+        '''
+        Wait until the tester runs a mode, after a mode change. The 
+        mode is polled with a short, growing interval; polls known to 
+        be too early from the switches seen before on the same firmware
+        are skipped. The time taken is recorded in latency.
+
+        :param mode: expected mode (EDT, GWT, NST_TX, NST_RX, NST_MFG)
+        :param timeout: longest wait in seconds
+        :param record: False when no mode change was sent (the mode was
+                       already active or the setting was suppressed);
+                       the time is neither recorded nor used to skip 
+                       polls
+
+        :return: time taken in seconds; None on timeout
+
+        '''
+        version = None
+        if self.capabilities:
+            version = self.capabilities.version
+        elif self.identity:
+            version = self.identity.values.get('SYSTEM:SW_VERSION')
+
+        event = 'TESTER_MODE ' + mode
+        cmdGetMode = 'READ:TESTER_MODE?' + '\n'
+        startTime = time.time()
+        expected = None
+        if record:
+            expected = self.latency.minimum(event, version)
+        if expected:
+            time.sleep(expected * .9000)
+
+        delay = .0100
+        while True:
+            result = self.transceive_port(cmdGetMode)
+            elapsed = time.time() - startTime
+            if result is not None and result.strip() == mode:
+                if record:
+                    self.latency.record(event, version, elapsed)
+                return elapsed
+            if elapsed >= timeout:
+                self.logger.info('Mode Switch Timeout: {} {}'
+                                 .format(mode, result))
+                return None
+            time.sleep(delay)
+            delay = min(delay * 1.5, .1000)
+
+    def mode_latency(self):
+        '''
+        Return the statistics of the mode switches waited for
+
+        :Parameters: N/A
+
+        :return: dictionary of (event, firmware version) and a 
+                 dictionary with count, min, max and mean time in 
+                 seconds, see RwcLatencyStats.summary()
+
+        '''
+        return self.latency.summary()
+
+    # Identity Cache Methods
+    def load_identity(self, filename = None, refresh = False):
+        '''
+        Answer the identification, version, serial number and option
+        queries from a cache file. The cache is checked with a single
+        *IDN?; when it has no entry for this tester, or the firmware 
+        changed, the values are read again in one pipelined batch and 
+        written to the file.
+
+        :param filename: cache file; None for ~/.rwcapi/identity.json
+        :param refresh: read the values from the tester in any case, 
+                        e.g. after installing an option
+
+        :return: dictionary of parameter key and value
+
+        '''
+        identity = RwcIdentity(filename)
+        self.identity = None
+
+        idn = self.transceive_port(cRWCIdentity.IDN_COMMAND)
+        if idn is None or idn == 'NAK':
+            raise Exception('Unable to read the tester identification')
+
+        if refresh or not identity.load(idn):
+            keys = cRWCIdentity.IDENTITY_KEYS
+            results = self.transceive_port_batch(
+                [cRWCShadowState.query_command(key) for key in keys])
+            values = dict(zip(keys, results))
+            if None in results:
+                identity.idn = idn
+                identity.values = dict((key, value) 
+                                       for key, value in values.items() 
+                                       if value is not None)
+            else:
+                identity.store(idn, values)
+
+        self.identity = identity
+        return dict(identity.values)
+
+    def clear_identity(self):
+        '''
+        Stop answering identity queries from the cache
+
+        :Parameters: N/A
+
+        :return: None
+
+        '''
+        self.identity = None
+
+    # Shadow State Methods
+    def enable_shadow(self):
+        '''
+        Keep a write-through shadow of the tester configuration.
+        Acknowledged settings are remembered and their getters are
+        answered without talking to the tester. Reset, recall, mode and
+        region changes drop the parameters they affect.
+
+        :Parameters: N/A
+
+        :return: RwcShadowState object in use
+
+        '''
+        if not self.shadow:
+            self.shadow = RwcShadowState(cRWCParamTable.answer_value)
+        return self.shadow
+
+    def disable_shadow(self):
+        '''
+        Stop using the shadow state; every getter goes to the tester
+
+        :Parameters: N/A
+
+        :return: None
+
+        '''
+        self.shadow = None
+
+    def verify_shadow(self):
+        '''
+        Read every parameter held by the shadow state from the tester
+        and compare. Every entry takes the value read from the tester,
+        in its format; unanswered ones are dropped.
+
+        :Parameters: N/A
+
+        :return: dictionary of mismatches, 
+                 {key: (shadow value, tester value)}
+
+        '''
+        mismatch = {}
+        if not self.shadow:
+            return mismatch
+
+        for key in list(self.shadow.entries):
+            shadowVal = self.shadow.get(key)
+            cmdGetParam = cRWCShadowState.query_command(key)
+            result = self.transceive_port(cmdGetParam)
+            if result is None or result == 'NAK':
+                self.shadow.entries.pop(key, None)
+                mismatch[key] = (shadowVal, result)
+            else:
+                if not cRWCShadowState.values_match(shadowVal, result):
+                    mismatch[key] = (shadowVal, result)
+                self.shadow.seed(key, result)
+        return mismatch
+
+    def enable_set_suppression(self, ttl = 60):
+        '''
+        Skip a setting when the shadow state holds the same value, 
+        acknowledged or read less than ttl seconds ago; the setter
+        returns ACK without talking to the tester. Enables the shadow
+        state if needed. The number of skipped settings is counted in
+        shadow.suppressed.
+
+        :param ttl: seconds a remembered value is trusted
+
+        :return: RwcShadowState object in use
+
+        '''
+        if float(ttl) <= 0:
+            raise Exception('Invalid TTL received: {}'.format(ttl))
+        shadow = self.enable_shadow()
+        shadow.ttl = float(ttl)
+        return shadow
+
+    def disable_set_suppression(self):
+        '''
+        Send every setting to the tester again
+
+        :Parameters: N/A
+
+        :return: number of settings suppressed so far
+
+        '''
+        if not self.shadow:
+            return 0
+        self.shadow.ttl = None
+        return self.shadow.suppressed
+
+    # Typed Response Methods
+    def enable_typed(self):
+        '''
+        Return query responses as RwcValue objects: value holds the 
+        response decoded by the parser of its command (float, int, 
+        enum, hex, bool, list), raw the string sent by the tester. 
+        ACK, NAK and missing responses are returned unchanged.
+
+        :Parameters: N/A
+
+        :return: None
+
+        '''
+        self.typed = True
+
+    def disable_typed(self):
+        '''
+        Return query responses as plain strings
+
+        :Parameters: N/A
+
+        :return: None
+
+        '''
+        self.typed = False
+
+    # Transaction Methods
+    @contextlib.contextmanager
+    def transaction(self):
+        '''
+        Queue every setting written inside the with block and send them
+        when the block ends, in one pipelined burst. Setting the same 
+        parameter again replaces the queued value, so only the last one
+        is sent, unless a setting in between resets it. Setters return
+        QUEUED, getters of a queued parameter return the queued value
+        and other getters read the tester.
+
+        A mode change is followed by the same pause as in apply() 
+        before the rest of the burst is sent. Nothing is sent when the
+        block raises an exception; a nested transaction joins the 
+        outer one.
+
+        E.g.
+            with rwc.transaction():
+                rwc.link_setnumofmaccmd(2)
+                rwc.link_setinstantmaccmd(1, 'LINK_ADR')
+
+        :Parameters: N/A
+
+        :return: context manager giving the RwcTransaction object; its 
+                 results hold the (command, response) pairs sent. 
+                 RwcTransactionError lists every command not 
+                 acknowledged.
+
+        '''
+        if self.txn is not None:
+            yield self.txn
+            return
+
+        txn = RwcTransaction()
+        self.txn = txn
+        try:
+            yield txn
+        finally:
+            self.txn = None
+
+        cmdList = txn.pending()
+        while cmdList:
+            count = len(cmdList)
+            for index, rwccmd in enumerate(cmdList):
+                if rwccmd.startswith('CONF:TESTER_MODE '):
+                    count = index + 1
+                    break
+            mode = None
+            if count < len(cmdList):
+                mode = cmdList[count - 1].split()[-1]
+                previous = self.query_mode()
+                suppressed = 0
+                if self.shadow:
+                    suppressed = self.shadow.suppressed
+            results = self.transceive_batch(cmdList[:count])
+            txn.results.extend(zip(cmdList[:count], results))
+            if mode is not None and results[-1] == 'ACK':
+                switched = str(previous).strip() != mode
+                if self.shadow and self.shadow.suppressed != suppressed:
+                    switched = False
+                # Let the tester switch its menu
+                self.wait_mode(mode, record = switched)
+            cmdList = cmdList[count:]
+        txn.clear()
+
+        failed = [(rwccmd, result) for rwccmd, result in txn.results
+                  if result != 'ACK']
+        if failed:
+            raise RwcTransactionError(failed)
+
+    # Bulk Configuration Methods
+    def apply(self, desired_config):
+        '''
+        Bring the tester to the desired configuration, sending only the
+        parameters which differ from the current values.
+
+        The current values are read in one pipelined batch (or taken 
+        from the shadow state) and the changes are sent in dependency
+        order: mode, region, channel plan, keys, the remaining 
+        parameters and finally the MAC command slots. Parameters that
+        follow a changed mode, region or channel plan are read again 
+        before they are compared. With the shadow state enabled the 
+        values read are remembered, so a repeated apply of the same 
+        configuration costs no round trip.
+
+        :param desired_config: dictionary of parameter key and value, 
+                               the key is the command path with the 
+                               index if any, e.g.
+                               {'PROTOCOL:REGION': 'EU_868', 
+                               'LINK:ADR_DR 1': 'DR0_SF12BW125'}
+
+        :return: dictionary of parameter key and report; the report is
+                 a dictionary with status (UNCHANGED, CHANGED, FAILED),
+                 old value, new value and tester response
+
+        The whole configuration is checked before anything is sent,
+        including the rules between parameters (see 
+        cRWCValidator.validate_config(), values not in the 
+        configuration are taken from the shadow state); an 
+        RwcConfigError lists every invalid entry.
+
+        '''
+        current = {}
+        if self.shadow:
+            current = self.shadow.values()
+        cRWCValidator.check_config(desired_config, current)
+        if self.capabilities and 'TESTER_MODE' in desired_config:
+            self.capabilities.require_mode(desired_config['TESTER_MODE'])
+
+        stages = {}
+        for key, value in desired_config.items():
+            param, index = cRWCParamTable.split_key(key)
+            cmdKey = cRWCParamTable.command_key(key)
+            cmdSetParam = cRWCParamTable.set_command(key, value)
+            stage = cRWCParamTable.stage_order(key)
+            stages.setdefault(stage[:2], []).append(
+                (stage, key, cmdKey, param.format_value(value), 
+                 cmdSetParam))
+
+        readable = cRWCParamTable.is_readable
+        readKeys = [entry[2] for stage in stages.values() 
+                    for entry in stage if readable(entry[2])]
+        current = dict(zip(readKeys, self.transceive_batch(
+            [cRWCShadowState.query_command(k) for k in readKeys])))
+
+        report = {}
+        stale = False
+        for stageKey in sorted(stages):
+            entries = sorted(stages[stageKey])
+            if stale:
+                stageKeys = [entry[2] for entry in entries 
+                             if readable(entry[2])]
+                current.update(zip(stageKeys, self.transceive_batch(
+                    [cRWCShadowState.query_command(k) 
+                     for k in stageKeys])))
+
+            pending = []
+            for stage, key, cmdKey, newVal, cmdSetParam in entries:
+                oldVal = current.get(cmdKey)
+                if oldVal == 'NAK':
+                    oldVal = None
+                if self.shadow and oldVal is not None:
+                    self.shadow.seed(cmdKey, oldVal)
+                report[key] = {'status': 'UNCHANGED', 'old': oldVal,
+                               'new': newVal, 'response': None}
+                if (oldVal is None 
+                        or not cRWCShadowState.values_match(oldVal, newVal)):
+                    pending.append((key, cmdKey, cmdSetParam))
+
+            responses = self.transceive_batch(
+                [entry[2] for entry in pending])
+            for (key, cmdKey, cmdSetParam), result in zip(pending, 
+                                                          responses):
+                report[key]['response'] = result
+                if result == 'ACK':
+                    report[key]['status'] = 'CHANGED'
+                    if cmdKey in cRWCParamTable.RESET_TRIGGERS:
+                        stale = True
+                    if cmdKey == 'TESTER_MODE':
+                        # Let the tester switch its menu; the setting 
+                        # is only sent when the mode differs
+                        self.wait_mode(
+                            report[key]['new'], 
+                            record = report[key]['old'] is not None)
+                else:
+                    report[key]['status'] = 'FAILED'
+        return report
+
+    def apply_profile(self, profile):
+        '''
+        Apply a tester profile, see apply()
+
+        :param profile: RwcProfile object or the name of a .json or 
+                        .toml profile file
+
+        :return: dictionary of parameter key and report
+
+        '''
+        if not isinstance(profile, RwcProfile):
+            profile = cRWCProfile.load_profile(profile)
+        return self.apply(profile.config)
+
+    # Snapshot Methods
+    def snapshot(self, subsystems = None):
+        '''
+        Read every queryable parameter, settings and read-only status,
+        of the given subsystems. All getters are pipelined in one batch
+        and always go to the tester, the shadow state is not used.
+
+        Message queues (LINK:MSG, INFO_MSG) are not read, reading them
+        would remove the message from the tester.
+
+        :param subsystems: list of subsystem names, SYSTEM, RF, 
+                           PROTOCOL, LINK, POWER, SENSITIVITY or NST;
+                           None for all of them
+
+        :return: RwcSnapshot object; a parameter the tester does not
+                 provide in its current mode reads 'NAK'
+
+        '''
+        keys = cRWCParamTable.query_keys(subsystems)
+        if subsystems is None:
+            subsystems = cRWCParamTable.SUBSYSTEMS
+
+        startTime = time.time()
+        cmdList = ['*IDN?\n']
+        cmdList.extend(cRWCShadowState.query_command(key) for key in keys)
+        results = self.transceive_port_batch(cmdList)
+        duration = time.time() - startTime
+
+        return RwcSnapshot(startTime, duration, 
+                           [name.upper() for name in subsystems],
+                           results[0], zip(keys, results[1:]))
+
+    # MAC Scenario Methods
+    def run_scenario(self, scenario, send = False):
+        '''
+        Set up a MAC command scenario in one pipelined burst: the 
+        number of commands, the command of each slot and its 
+        parameters. The scenario is checked before anything is sent 
+        (see RwcMacScenario.validate(), the region and other values are
+        taken from the shadow state and the firmware version from 
+        discover()); an RwcConfigError lists every problem.
+
+        E.g.
+            scenario = RwcMacScenario()
+            scenario.add('LINK_ADR', ADR_DR='DR5_SF7BW125', ADR_TXPOW=2)
+            scenario.add('RX_TIMING_SETUP', RECEIVE_DELAY=1)
+            rwc.run_scenario(scenario, send=True)
+
+        :param scenario: RwcMacScenario object
+        :param send: True to send the MAC commands to the DUT at the 
+                     end of the burst (EXEC:LINK:MAC_SEND)
+
+        :return: list of (command, response) pairs sent. 
+                 RwcTransactionError lists every command not 
+                 acknowledged.
+
+        '''
+        if not isinstance(scenario, RwcMacScenario):
+            raise Exception('Invalid MAC scenario received')
+
+        current = {}
+        if self.shadow:
+            current = self.shadow.values()
+        version = None
+        if self.capabilities:
+            version = self.capabilities.version
+
+        cmdList = scenario.compile(current, version)
+        if send:
+            cmdList.append('EXEC:LINK:MAC_SEND' + '\n')
+        results = list(zip(cmdList, self.transceive_batch(cmdList)))
+
+        failed = [(rwccmd, result) for rwccmd, result in results
+                  if result != 'ACK']
+        if failed:
+            raise RwcTransactionError(failed)
+        return results
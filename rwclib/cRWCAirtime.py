@@ -0,0 +1,328 @@
+##############################################################################
+#
+# Module: cRWCAirtime.py
+#
+# Description:
+#     Time on air and sliding window duty cycle of captured messages
+#
+# Copyright notice:
+#     This file copyright (c) 2026 by
+#
+#         MCCI Corporation
+#         3520 Krums Corners Road
+#         Ithaca, NY  14850
+#
+#     See accompanying LICENSE file for copyright and license information.
+#
+# Author:
+#     Sivaprakash Veluthambi, MCCI   October, 2026
+#
+##############################################################################
+
+# Built-in imports
+import collections
+import math
+import threading
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Lib imports
+from rwclib.cRWCValidator import dr_number
+
+# LoRaWAN frame around the application payload: MHDR, DevAddr, FCtrl,
+# FCnt and MIC; FPort is added when present. FOpts are not shown by the
+# link analyzer and not counted.
+FRAME_OVERHEAD = 12
+
+# LoRa modulation of LoRaWAN: preamble symbols, coding rate 4/5
+PREAMBLE_SYMBOLS = 8
+CODING_RATE = 1
+
+# FSK data rate of LoRaWAN (50 kbps): preamble, sync word, length and
+# CRC bytes
+FSK_BITRATE = 50000.0
+FSK_OVERHEAD = 5 + 3 + 1 + 2
+
+# Regulatory sub-bands as (name, lowest MHz, highest MHz, duty cycle);
+# regions not listed have no duty cycle limit
+DUTY_CYCLE_BANDS = {
+    'EU_868': (
+        ('863.0-865.0', 863.0, 865.0, 0.001),
+        ('865.0-868.0', 865.0, 868.0, 0.01),
+        ('868.0-868.6', 868.0, 868.6, 0.01),
+        ('868.7-869.2', 868.7, 869.2, 0.001),
+        ('869.4-869.65', 869.4, 869.65, 0.1),
+        ('869.7-870.0', 869.7, 870.0, 0.01),
+        ),
+    'EU_433': (
+        ('433.05-434.79', 433.05, 434.79, 0.1),
+        ),
+    }
+
+
+def time_on_air(sf, bw, length, crc = True):
+    '''
+    Return the time on air of a LoRa or FSK frame (Semtech AN1200.13)
+
+    :param sf: spreading factor; 0 for FSK
+    :param bw: bandwidth in kHz
+    :param length: PHY payload length in bytes
+    :param crc: True when the frame has a payload CRC (uplinks)
+
+    :return: time in seconds
+
+    '''
+    if not sf:
+        return (FSK_OVERHEAD + length) * 8 / FSK_BITRATE
+    symbol = (1 << sf) / (bw * 1000.0)
+    ldro = 1 if symbol > .016 else 0
+    symbols = 8 + max(math.ceil(
+        (8 * length - 4 * sf + 28 + 16 * crc)
+        / (4.0 * (sf - 2 * ldro))) * (CODING_RATE + 4), 0)
+    return (PREAMBLE_SYMBOLS + 4.25 + symbols) * symbol
+
+
+def time_on_air_array(sf, bw, length, crc = True):
+    '''
+    Return the time on air of many frames; computed on whole arrays
+    when NumPy is installed
+
+    :param sf: spreading factors; 0 for FSK
+    :param bw: bandwidths in kHz
+    :param length: PHY payload lengths in bytes
+    :param crc: True when the frames have a payload CRC (uplinks)
+
+    :return: NumPy array of times in seconds; list without NumPy
+
+    '''
+    if numpy is None:
+        return [time_on_air(s, b, n, crc) for s, b, n in zip(sf, bw, length)]
+    sf = numpy.asarray(sf, dtype = 'f8')
+    bw = numpy.asarray(bw, dtype = 'f8')
+    length = numpy.asarray(length, dtype = 'f8')
+    lora = sf > 0
+    safeSf = numpy.where(lora, sf, 7)
+    safeBw = numpy.where(bw > 0, bw, 125)
+    symbol = numpy.exp2(safeSf) / (safeBw * 1000.0)
+    ldro = (symbol > .016).astype('f8')
+    symbols = 8 + numpy.maximum(numpy.ceil(
+        (8 * length - 4 * safeSf + 28 + 16 * int(crc))
+        / (4.0 * (safeSf - 2 * ldro))) * (CODING_RATE + 4), 0)
+    return numpy.where(lora, (PREAMBLE_SYMBOLS + 4.25 + symbols) * symbol,
+                       (FSK_OVERHEAD + length) * 8 / FSK_BITRATE)
+
+
+def frame_length(payload, port):
+    '''
+    Return the PHY payload length of a data frame
+
+    :param payload: application payload as hex text; None if empty
+    :param port: FPort; None when the frame has none
+
+    :return: length in bytes
+
+    '''
+    length = FRAME_OVERHEAD
+    if port is not None and port >= 0:
+        length += 1
+    if payload:
+        length += len(str(payload).replace(' ', '')) // 2
+    return length
+
+
+class RwcDutyCycle:
+    '''
+    .. class:: RwcDutyCycle
+
+    Duty cycle of the DUT transmissions over a sliding window, per
+    channel frequency and per regulatory sub-band of the region. Each
+    transmission is added once with its time on air and leaves the
+    running sums when it falls out of the window, so checking the duty
+    cycle during a soak test never scans the capture again.
+
+    '''
+
+    def __init__(self, region, window = 3600, uplink = True):
+        '''
+        Class constructor creates empty windows
+
+        :param region: RwcRegion, for the data rates and sub-bands
+        :param window: window length in seconds
+        :param uplink: True to count the uplinks (DUT), False for the
+                       downlinks (tester)
+
+        '''
+        self.region = region
+        self.window = window
+        self.uplink = uplink
+        self.bands = DUTY_CYCLE_BANDS.get(region.name, ())
+        self.lock = threading.Lock()
+        # key -> deque of (time, airtime), and the sum of airtime
+        self.events = collections.defaultdict(collections.deque)
+        self.sums = collections.defaultdict(float)
+        # frequency -> keys of its channel and sub-band
+        self.keys = {}
+        self.latest = None
+        self.position = 0
+
+    def add(self, timestamp, freq, airtime):
+        '''
+        Add one transmission
+
+        :param timestamp: start time of the transmission
+        :param freq: frequency in MHz
+        :param airtime: time on air in seconds
+
+        :return: None
+
+        '''
+        with self.lock:
+            self._add(timestamp, freq, airtime)
+            self._expire()
+
+    def feed(self, record, timestamp):
+        '''
+        Add a link message; messages of the other direction are skipped
+
+        :param record: RwcLinkMsg object
+        :param timestamp: time the message was received
+
+        :return: time on air in seconds; None when skipped
+
+        '''
+        if record.is_uplink() != self.uplink or record.freq is None:
+            return None
+        modulation = None
+        if record.dr is not None:
+            modulation = self._modulation(dr_number(record.dr))
+        if modulation is None:
+            return None
+        sf, bw = modulation
+        airtime = time_on_air(sf, bw, frame_length(record.payload,
+                                                   record.port),
+                              self.uplink)
+        self.add(timestamp, record.freq, airtime)
+        return airtime
+
+    def update(self, capture):
+        '''
+        Add the messages appended to a capture since the last update;
+        the time on air is computed on whole columns
+
+        :param capture: RwcCapture object, see cRWCCapture
+
+        :return: number of transmissions added
+
+        '''
+        start = self.position
+        with capture.lock:
+            end = len(capture.times)
+            columns = dict((name, capture.columns[name][start:end])
+                           for name in ('timestamp', 'uplink', 'dr',
+                                        'freq', 'port'))
+            payloads = capture.payloads[start:end]
+        self.position = end
+
+        if numpy is not None:
+            rows, sf, bw = self._select_numpy(columns)
+        else:
+            rows = [row for row in range(end - start)
+                    if columns['uplink'][row] == int(self.uplink)
+                    and not math.isnan(columns['freq'][row])
+                    and self._modulation(columns['dr'][row])]
+            sf = [self._modulation(columns['dr'][row])[0] for row in rows]
+            bw = [self._modulation(columns['dr'][row])[1] for row in rows]
+        airtimes = time_on_air_array(
+            sf, bw, [frame_length(payloads[row], columns['port'][row])
+                     for row in rows], self.uplink)
+
+        with self.lock:
+            for row, airtime in zip(rows, airtimes):
+                self._add(columns['timestamp'][row], columns['freq'][row],
+                          float(airtime))
+            self._expire()
+        return len(rows)
+
+    def channels(self):
+        '''
+        Return the duty cycle of every channel frequency in the window
+
+        :Parameters: N/A
+
+        :return: dictionary of frequency in MHz and duty cycle (0 ~ 1)
+
+        '''
+        with self.lock:
+            return dict((key[1], self.sums[key] / self.window)
+                        for key in self.events if key[0] == 'freq')
+
+    def sub_bands(self):
+        '''
+        Return the duty cycle of every sub-band in the window
+
+        :Parameters: N/A
+
+        :return: dictionary of sub-band name and (duty cycle, limit)
+
+        '''
+        with self.lock:
+            return dict((name, (self.sums[('band', name)] / self.window,
+                                limit))
+                        for name, low, high, limit in self.bands)
+
+    def violations(self):
+        '''
+        Return the sub-bands used above their duty cycle limit
+
+        :Parameters: N/A
+
+        :return: dictionary of sub-band name and (duty cycle, limit)
+
+        '''
+        return dict((name, usage) for name, usage
+                    in self.sub_bands().items() if usage[0] > usage[1])
+
+    def _select_numpy(self, columns):
+        uplink = numpy.frombuffer(columns['uplink'], dtype = 'i1')
+        dr = numpy.frombuffer(columns['dr'], dtype = 'i1').astype('i8')
+        freq = numpy.frombuffer(columns['freq'], dtype = 'f8')
+        modulations = [rate or (-1, 0) for rate in self.region.data_rates]
+        sfTable = numpy.array([rate[0] for rate in modulations] + [-1])
+        bwTable = numpy.array([rate[1] for rate in modulations] + [0])
+        dr = numpy.where((dr >= 0) & (dr < len(modulations)), dr, -1)
+        mask = ((uplink == int(self.uplink)) & ~numpy.isnan(freq)
+                & (sfTable[dr] >= 0))
+        rows = numpy.nonzero(mask)[0]
+        return (rows.tolist(), sfTable[dr[rows]], bwTable[dr[rows]])
+
+    def _modulation(self, dr):
+        if dr is None or not 0 <= dr < len(self.region.data_rates):
+            return None
+        return self.region.data_rates[dr]
+
+    def _add(self, timestamp, freq, airtime):
+        keys = self.keys.get(freq)
+        if keys is None:
+            keys = [('freq', round(float(freq), 4))]
+            for name, low, high, limit in self.bands:
+                if low <= freq < high:
+                    keys.append(('band', name))
+            self.keys[freq] = keys
+        for key in keys:
+            self.events[key].append((timestamp, airtime))
+            self.sums[key] += airtime
+        if self.latest is None or timestamp > self.latest:
+            self.latest = timestamp
+
+    def _expire(self):
+        if self.latest is None:
+            return
+        oldest = self.latest - self.window
+        for key, events in self.events.items():
+            while events and events[0][0] < oldest:
+                self.sums[key] -= events.popleft()[1]
+            if not events:
+                self.sums[key] = 0.0
@@ -0,0 +1,142 @@
+##############################################################################
+#
+# Module: cRWCCapabilities.py
+#
+# Description:
+#     Capabilities of a tester found by RWCTesterApi.discover()
+#
+# Copyright notice:
+#     This file copyright (c) 2026 by
+#
+#         MCCI Corporation
+#         3520 Krums Corners Road
+#         Ithaca, NY  14850
+#
+#     See accompanying LICENSE file for copyright and license information.
+#
+# Author:
+#     Sivaprakash Veluthambi, MCCI   October, 2026
+#
+##############################################################################
+
+# Built-in imports
+import types
+
+# Software options of the tester
+OPTION_NAMES = (
+    'GWT', 'EDT', 'NST', 'CERTI_EU', 'CERTI_SKT', 'CERTI_US',
+    'CERTI_AS', 'CERTI_KR')
+
+# Option needed by each tester mode
+MODE_OPTIONS = {
+    'EDT': 'EDT',
+    'GWT': 'GWT',
+    'NST_TX': 'NST',
+    'NST_RX': 'NST',
+    'NST_MFG': 'NST',
+    }
+
+
+class RwcCapabilities:
+    '''
+    .. class:: RwcCapabilities
+
+    Identity, firmware version, current mode and installed options of
+    a tester. The record is read-only; options maps each name of
+    OPTION_NAMES to True (installed), False, or None when the firmware
+    does not report it.
+
+    '''
+    __slots__ = ('idn', 'version', 'serial', 'mode', 'options')
+
+    def __init__(self, idn, version, serial, mode, options):
+        '''
+        Class constructor stores the capabilities
+
+        :param idn: response of *IDN?
+        :param version: software version, e.g. '1.310'
+        :param serial: serial number
+        :param mode: tester mode at discovery (EDT, GWT, NST_TX, ...)
+        :param options: dictionary of option name and True/False/None
+
+        '''
+        setField = object.__setattr__
+        setField(self, 'idn', idn)
+        setField(self, 'version', version)
+        setField(self, 'serial', serial)
+        setField(self, 'mode', mode)
+        setField(self, 'options', types.MappingProxyType(dict(options)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('RwcCapabilities is read-only')
+
+    def __repr__(self):
+        return 'RwcCapabilities({}, Ver={}, options={})'.format(
+            self.serial, self.version,
+            ','.join(name for name in OPTION_NAMES if self.options.get(name)))
+
+    def has_option(self, name):
+        '''
+        Check whether a software option is installed
+
+        :param name: option name, e.g. 'GWT' or 'CERTI_EU'
+
+        :return: True when installed
+
+        '''
+        return bool(self.options.get(name.upper()))
+
+    def supports_mode(self, mode):
+        '''
+        Check whether the tester can run a mode
+
+        :param mode: EDT, GWT, NST_TX, NST_RX or NST_MFG
+
+        :return: True when the option of the mode is installed or was
+                 not reported; False when it is reported OFF
+
+        '''
+        option = MODE_OPTIONS.get(mode)
+        return option is not None and self.options.get(option) is not False
+
+    def version_at_least(self, version):
+        '''
+        Compare the software version of the tester
+
+        :param version: minimum version, e.g. '1.310' or 1.31
+
+        :return: True when the tester runs this version or a later one
+
+        '''
+        try:
+            return float(self.version) >= float(version)
+        except (TypeError, ValueError):
+            return False
+
+    def require_mode(self, mode):
+        '''
+        Raise when the tester reports the option of a mode as not
+        installed; an option left unreported does not raise
+
+        :param mode: EDT, GWT, NST_TX, NST_RX or NST_MFG
+
+        :return: None
+
+        '''
+        if mode in MODE_OPTIONS and not self.supports_mode(mode):
+            raise Exception('Option {} not installed on the tester'
+                            .format(MODE_OPTIONS[mode]))
+
+
+def option_state(result):
+    '''
+    Convert the answer of an option query
+
+    :param result: response of READ:SYSTEM:OPTION_xxx?
+
+    :return: True (ON), False (OFF) or None when not reported
+
+    '''
+    if result is None or result == 'NAK':
+        return None
+    return str(result).strip().upper() in ('ON', 'YES', 'TRUE', '1')
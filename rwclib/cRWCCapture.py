@@ -0,0 +1,435 @@
+##############################################################################
+#
+# Module: cRWCCapture.py
+#
+# Description:
+#     Columnar store of captured link messages
+#
+# Copyright notice:
+#     This file copyright (c) 2026 by
+#
+#         MCCI Corporation
+#         3520 Krums Corners Road
+#         Ithaca, NY  14850
+#
+#     See accompanying LICENSE file for copyright and license information.
+#
+# Author:
+#     Sivaprakash Veluthambi, MCCI   October, 2026
+#
+##############################################################################
+
+# Built-in imports
+import array
+import collections
+import math
+import threading
+import time
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Lib imports
+from rwclib.cRWCLinkMsg import RwcLinkMsg
+from rwclib.cRWCValidator import dr_number
+
+# Numeric columns as (name, array typecode, missing value)
+NUMERIC_COLUMNS = (
+    ('timestamp', 'd', math.nan),
+    ('uplink', 'b', -1),
+    ('fcnt', 'q', -1),
+    ('port', 'h', -1),
+    ('dr', 'b', -1),
+    ('power', 'f', math.nan),
+    ('delay', 'f', math.nan),
+    ('freq', 'd', math.nan),
+    ('channel', 'h', -1),
+    )
+
+# Text columns stored as codes into a table of their distinct values
+CODED_COLUMNS = ('direction', 'msg_type', 'dev_addr', 'mac', 'dr_name')
+
+# Message field of a coded column named otherwise; the dr column holds
+# the data rate number
+CODED_FIELDS = {'dr_name': 'dr'}
+
+# NumPy type of each array typecode
+NUMPY_TYPES = {'d': 'f8', 'f': 'f4', 'q': 'i8', 'h': 'i2', 'b': 'i1',
+               'I': 'u4'}
+
+
+def _number(value, convert, missing):
+    if value is None:
+        return missing
+    try:
+        return convert(value)
+    except (TypeError, ValueError):
+        return missing
+
+
+class RwcTextColumn:
+    '''
+    .. class:: RwcTextColumn
+
+    Texts stored one after another in a single bytearray, with the end
+    offset of each in an array, instead of one str object per message.
+    Indexing and slicing give the texts back; None is stored as an
+    empty text.
+
+    '''
+
+    def __init__(self):
+        '''
+        Class constructor creates an empty column
+
+        :Parameters: N/A
+
+        '''
+        self.data = bytearray()
+        self.ends = array.array('Q')
+
+    def __len__(self):
+        return len(self.ends)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._text(i) for i in range(*index.indices(
+                len(self.ends)))]
+        if index < 0:
+            index += len(self.ends)
+        if not 0 <= index < len(self.ends):
+            raise IndexError('text column index out of range')
+        return self._text(index)
+
+    def append(self, text):
+        '''
+        Add a text
+
+        :param text: text; None if missing
+
+        :return: None
+
+        '''
+        if text:
+            self.data.extend(str(text).encode('utf-8'))
+        self.ends.append(len(self.data))
+
+    def _text(self, index):
+        start = self.ends[index - 1] if index else 0
+        end = self.ends[index]
+        if start == end:
+            return None
+        return self.data[start:end].decode('utf-8')
+
+
+class RwcCapture:
+    '''
+    .. class:: RwcCapture
+
+    Link messages stored column by column: numbers in typed arrays,
+    repeated texts (direction, message type, device address, MAC
+    commands, data rate) as codes into a table of their values, and the
+    time and payload texts packed in one buffer each, so hundreds of
+    thousands of messages take a few tens of bytes each plus their
+    payload. Queries filter whole columns at once, with NumPy when it
+    is installed.
+
+    Appending is safe while another thread (e.g. the link message
+    collector) queries the store.
+
+    '''
+
+    def __init__(self, region = None):
+        '''
+        Class constructor creates an empty store
+
+        :param region: optional RwcRegion, used to find the channel of
+                       each message from its frequency
+
+        '''
+        self.region = region
+        self.lock = threading.Lock()
+        self.columns = collections.OrderedDict(
+            (name, array.array(typecode))
+            for name, typecode, missing in NUMERIC_COLUMNS)
+        for name in CODED_COLUMNS:
+            self.columns[name] = array.array('I')
+        self.values = dict((name, []) for name in CODED_COLUMNS)
+        self.codes = dict((name, {}) for name in CODED_COLUMNS)
+        self.times = RwcTextColumn()
+        self.payloads = RwcTextColumn()
+
+    def __len__(self):
+        return len(self.times)
+
+    def append(self, record, timestamp = None):
+        '''
+        Add a link message
+
+        :param record: RwcLinkMsg object
+        :param timestamp: time the message was received; None for now
+
+        :return: index of the message in the store
+
+        '''
+        if timestamp is None:
+            timestamp = time.time()
+        freq = _number(record.freq, float, math.nan)
+        channel = None
+        if self.region is not None and not math.isnan(freq):
+            channel = self.region.channel_of(freq)
+        row = {
+            'timestamp': timestamp,
+            'uplink': int(record.is_uplink()) if record.direction else -1,
+            'fcnt': _number(record.fcnt, int, -1),
+            'port': _number(record.port, int, -1),
+            'dr': _number(record.dr, dr_number, None),
+            'power': _number(record.power, float, math.nan),
+            'delay': _number(record.delay, float, math.nan),
+            'freq': freq,
+            'channel': channel,
+            }
+
+        with self.lock:
+            for name, typecode, missing in NUMERIC_COLUMNS:
+                value = row[name]
+                self.columns[name].append(missing if value is None
+                                          else value)
+            for name in CODED_COLUMNS:
+                self.columns[name].append(self._code(
+                    name, getattr(record, CODED_FIELDS.get(name, name))))
+            self.times.append(record.time)
+            self.payloads.append(record.payload)
+            return len(self.times) - 1
+
+    def extend(self, records):
+        '''
+        Add link messages received now
+
+        :param records: iterable of RwcLinkMsg objects
+
+        :return: None
+
+        '''
+        for record in records:
+            self.append(record)
+
+    def record(self, index):
+        '''
+        Rebuild one stored message
+
+        :param index: index of the message
+
+        :return: RwcLinkMsg object; the numbers are those stored
+
+        '''
+        with self.lock:
+            fields = {'time': self.times[index],
+                      'payload': self.payloads[index]}
+            for name in CODED_COLUMNS:
+                fields[CODED_FIELDS.get(name, name)] = \
+                    self.values[name][self.columns[name][index]]
+            for name in ('fcnt', 'port', 'power', 'delay', 'freq'):
+                value = self.columns[name][index]
+                if value != -1 and not (isinstance(value, float)
+                                        and math.isnan(value)):
+                    fields[name] = value
+        return RwcLinkMsg(**fields)
+
+    def column(self, name):
+        '''
+        Return a copy of a column
+
+        :param name: column name, see NUMERIC_COLUMNS and CODED_COLUMNS;
+                     a coded column is returned as its texts
+
+        :return: NumPy array when NumPy is installed, else array.array
+                 (list for a coded column)
+
+        '''
+        with self.lock:
+            if name in CODED_COLUMNS:
+                values = self.values[name]
+                return [values[code] for code in self.columns[name]]
+            if name not in self.columns:
+                raise Exception('Invalid column received: {}'.format(name))
+            if numpy is not None:
+                return numpy.array(self.columns[name])
+            return array.array(self.columns[name].typecode,
+                               self.columns[name])
+
+    def select(self, uplink = None, channel = None, t0 = None, t1 = None,
+               msg_type = None, mac = None, dr = None, port = None):
+        '''
+        Find the messages matching every given condition, e.g. the
+        uplinks on channel 3 between t0 and t1:
+        capture.select(uplink = True, channel = 3, t0 = t0, t1 = t1)
+
+        :param uplink: True for uplinks, False for downlinks
+        :param channel: uplink channel number
+        :param t0: earliest receive time (time.time() seconds)
+        :param t1: latest receive time
+        :param msg_type: message type, e.g. 'ConfUp'
+        :param mac: MAC command text, e.g. 'LinkADRAns'
+        :param dr: data rate number
+        :param port: FPort
+
+        :return: list of message indexes, oldest first
+
+        '''
+        tests = []
+        if uplink is not None:
+            tests.append(('uplink', '==', int(bool(uplink))))
+        if channel is not None:
+            tests.append(('channel', '==', int(channel)))
+        if t0 is not None:
+            tests.append(('timestamp', '>=', float(t0)))
+        if t1 is not None:
+            tests.append(('timestamp', '<=', float(t1)))
+        if dr is not None:
+            tests.append(('dr', '==', int(dr)))
+        if port is not None:
+            tests.append(('port', '==', int(port)))
+
+        with self.lock:
+            for name, value in (('msg_type', msg_type), ('mac', mac)):
+                if value is not None:
+                    code = self.codes[name].get(value)
+                    if code is None:
+                        return []
+                    tests.append((name, '==', code))
+
+            count = len(self.times)
+            if numpy is not None:
+                return self._select_numpy(tests, count)
+
+            indexes = range(count)
+            for name, op, value in tests:
+                column = self.columns[name]
+                if op == '==':
+                    indexes = [i for i in indexes if column[i] == value]
+                elif op == '>=':
+                    indexes = [i for i in indexes if column[i] >= value]
+                else:
+                    indexes = [i for i in indexes if column[i] <= value]
+            return list(indexes)
+
+    def to_numpy(self):
+        '''
+        Return the numeric and coded columns as a NumPy structured array
+
+        :Parameters: N/A
+
+        :return: numpy.ndarray with one field per column; coded columns
+                 hold the codes, see values for their texts
+
+        '''
+        if numpy is None:
+            raise Exception('to_numpy() needs NumPy')
+        with self.lock:
+            dtype = [(name, NUMPY_TYPES[column.typecode])
+                     for name, column in self.columns.items()]
+            table = numpy.empty(len(self.times), dtype = dtype)
+            for name, column in self.columns.items():
+                table[name] = numpy.frombuffer(
+                    column, dtype = NUMPY_TYPES[column.typecode])
+            return table
+
+    def fcnt_gaps(self):
+        '''
+        Find the uplink frame counters skipped by the DUT
+
+        :Parameters: N/A
+
+        :return: list of (message index, expected FCnt, received FCnt)
+
+        '''
+        gaps = []
+        last = None
+        for index in self.select(uplink = True):
+            fcnt = self.columns['fcnt'][index]
+            if fcnt < 0:
+                continue
+            if last is not None and fcnt > last + 1:
+                gaps.append((index, last + 1, fcnt))
+            last = fcnt
+        return gaps
+
+    def retransmissions(self):
+        '''
+        Find the uplinks repeating the frame counter of the previous
+        uplink
+
+        :Parameters: N/A
+
+        :return: list of message indexes
+
+        '''
+        repeats = []
+        last = None
+        for index in self.select(uplink = True):
+            fcnt = self.columns['fcnt'][index]
+            if fcnt >= 0 and fcnt == last:
+                repeats.append(index)
+            last = fcnt
+        return repeats
+
+    def dr_distribution(self, uplink = True):
+        '''
+        Count the messages per data rate
+
+        :param uplink: True for uplinks, False for downlinks, None for
+                       both
+
+        :return: dictionary of data rate number and count
+
+        '''
+        counts = collections.Counter(
+            self.columns['dr'][index] for index in self.select(uplink))
+        counts.pop(-1, None)
+        return dict(counts)
+
+    def power_by_channel(self):
+        '''
+        Return the power statistics of the uplinks per channel
+
+        :Parameters: N/A
+
+        :return: dictionary of channel and (count, mean, min, max) power
+
+        '''
+        powers = collections.defaultdict(list)
+        for index in self.select(uplink = True):
+            channel = self.columns['channel'][index]
+            power = self.columns['power'][index]
+            if channel >= 0 and not math.isnan(power):
+                powers[channel].append(power)
+        return dict((channel, (len(values), sum(values) / len(values),
+                               min(values), max(values)))
+                    for channel, values in powers.items())
+
+    def _code(self, name, value):
+        codes = self.codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = len(self.values[name])
+            codes[value] = code
+            self.values[name].append(value)
+        return code
+
+    def _select_numpy(self, tests, count):
+        mask = numpy.ones(count, dtype = bool)
+        for name, op, value in tests:
+            column = self.columns[name]
+            view = numpy.frombuffer(column, dtype =
+                                    NUMPY_TYPES[column.typecode])[:count]
+            if op == '==':
+                mask &= view == value
+            elif op == '>=':
+                mask &= view >= value
+            else:
+                mask &= view <= value
+            del view
+        return numpy.nonzero(mask)[0].tolist()
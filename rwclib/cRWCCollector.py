@@ -0,0 +1,230 @@
+##############################################################################
+#
+# Module: cRWCCollector.py
+#
+# Description:
+#     Background collector of the link messages
+#
+# Copyright notice:
+#     This file copyright (c) 2026 by
+#
+#         MCCI Corporation
+#         3520 Krums Corners Road
+#         Ithaca, NY  14850
+#
+#     See accompanying LICENSE file for copyright and license information.
+#
+# Author:
+#     Sivaprakash Veluthambi, MCCI   October, 2026
+#
+##############################################################################
+
+# Built-in imports
+import collections
+import threading
+import time
+
+READ_MSG_COMMAND = 'READ:LINK:MSG?\n'
+
+
+class RwcMsgCollector:
+    '''
+    .. class:: RwcMsgCollector
+
+    Thread reading the link messages of a tester into a ring buffer of
+    fixed capacity, so no message is lost while the test script is busy
+    or after the tester list is cleared. The tester is polled back to
+    back while messages arrive and with a growing interval while it has
+    none. When the buffer is full the oldest message is dropped and
+    counted in overflows. An exception raised while polling is counted
+    in errors and kept in last_error; the thread backs off and keeps
+    polling.
+
+    '''
+
+    def __init__(self, tester, parser, capacity = 4096, capture = None,
+                 trace = None, correlator = None, min_interval = .0500,
+                 max_interval = .5000):
+        '''
+        Class constructor creates a stopped collector
+
+        :param tester: RWCTesterApi object
+        :param parser: RwcMsgParser for the display flags of the tester
+        :param capacity: number of messages kept
+        :param capture: optional RwcCapture every message is also
+                        appended to, with its receive time
+        :param trace: optional RwcTraceWriter (cRWCTrace) or
+                      RwcPcapWriter (cRWCPcap) every message is also
+                      written to
+        :param correlator: optional RwcMacCorrelator every message is
+                           also fed to, see cRWCMacCorrelator
+        :param min_interval: shortest poll interval in seconds
+        :param max_interval: longest poll interval in seconds
+
+        '''
+        self.tester = tester
+        self.parser = parser
+        self.capacity = capacity
+        self.capture = capture
+        self.trace = trace
+        self.correlator = correlator
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+        self.buffer = collections.deque(maxlen = capacity)
+        self.received = 0
+        self.overflows = 0
+        self.errors = 0
+        self.last_error = None
+
+        self.cond = threading.Condition()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def __len__(self):
+        with self.cond:
+            return len(self.buffer)
+
+    def start(self):
+        '''
+        Start the collector thread
+
+        :Parameters: N/A
+
+        :return: None
+
+        '''
+        if self.is_running():
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target = self._run,
+                                       name = 'RwcMsgCollector')
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self, timeout = 5):
+        '''
+        Stop the collector thread; the buffered messages are kept
+
+        :param timeout: longest wait in seconds for the thread to end
+
+        :return: None
+
+        '''
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout)
+        with self.cond:
+            self.cond.notify_all()
+
+    def is_running(self):
+        '''
+        Check whether the collector thread runs
+
+        :Parameters: N/A
+
+        :return: True while collecting
+
+        '''
+        return self.thread is not None and self.thread.is_alive()
+
+    def get(self, timeout = None):
+        '''
+        Take the oldest buffered message
+
+        :param timeout: seconds to wait for a message; None to wait
+                        while the collector runs, 0 not to wait
+
+        :return: RwcLinkMsg object; None when no message arrived
+
+        '''
+        deadline = None
+        if timeout is not None:
+            deadline = time.time() + timeout
+        with self.cond:
+            while not self.buffer:
+                if not self.is_running():
+                    return None
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        return None
+                self.cond.wait(remaining)
+            return self.buffer.popleft()
+
+    def drain(self):
+        '''
+        Take every buffered message
+
+        :Parameters: N/A
+
+        :return: list of RwcLinkMsg objects, oldest first
+
+        '''
+        with self.cond:
+            records = list(self.buffer)
+            self.buffer.clear()
+            return records
+
+    def stats(self):
+        '''
+        Return the counters of the collector
+
+        :Parameters: N/A
+
+        :return: dictionary with received, buffered, overflows, errors
+                 (unanswered or failed polls) and last_error (the last
+                 exception raised while polling, None if none)
+
+        '''
+        with self.cond:
+            return {'received': self.received,
+                    'buffered': len(self.buffer),
+                    'overflows': self.overflows,
+                    'errors': self.errors,
+                    'last_error': self.last_error}
+
+    def _run(self):
+        interval = self.min_interval
+        while not self.stop_event.is_set():
+            try:
+                if self._poll():
+                    interval = self.min_interval
+                    continue
+            except Exception as err:
+                # keep polling; a failing port or sink must not end
+                # the thread
+                with self.cond:
+                    self.errors += 1
+                    self.last_error = err
+
+            self.stop_event.wait(interval)
+            interval = min(interval * 2, self.max_interval)
+
+    def _poll(self):
+        # the parser is taken with the message, so a layout change
+        # (link_setfieldprofile) lands before or after both
+        with self.tester.port_lock:
+            result = self.tester.transceive_port(READ_MSG_COMMAND)
+            parser = self.parser
+        if result is None:
+            self.errors += 1
+        record = parser.parse(result)
+        if record is None:
+            return False
+
+        timestamp = time.time()
+        with self.cond:
+            if len(self.buffer) == self.capacity:
+                self.overflows += 1
+            self.buffer.append(record)
+            self.received += 1
+            self.cond.notify_all()
+        if self.capture is not None:
+            self.capture.append(record, timestamp)
+        if self.trace is not None:
+            self.trace.append(record, timestamp)
+        if self.correlator is not None:
+            self.correlator.feed(record, timestamp)
+        return True
@@ -0,0 +1,179 @@
+##############################################################################
+#
+# Module: cRWCDecoder.py
+#
+# Description:
+#     Typed decoding of the RWC5020x query responses
+#
+# Copyright notice:
+#     This file copyright (c) 2026 by
+#
+#         MCCI Corporation
+#         3520 Krums Corners Road
+#         Ithaca, NY  14850
+#
+#     See accompanying LICENSE file for copyright and license information.
+#
+# Author:
+#     Sivaprakash Veluthambi, MCCI   October, 2026
+#
+##############################################################################
+
+# Lib imports
+from rwclib import cRWCParamTable
+from rwclib.cRWCShadowState import parse_command
+
+TRUE_WORDS = ('ON', 'YES', 'TRUE')
+FALSE_WORDS = ('OFF', 'NO', 'FALSE')
+
+# Enumerations decoded as bool
+BOOL_DOMAINS = (cRWCParamTable.OFF_ON, ('NO', 'YES'))
+
+
+class RwcValue:
+    '''
+    .. class:: RwcValue
+
+    A decoded query response. value holds the typed value, raw the
+    string sent by the tester. The object compares equal to its raw
+    string and converts with str(), float() and int(), so code written
+    for plain string responses keeps working.
+
+    '''
+    __slots__ = ('raw', 'value', 'kind')
+
+    def __init__(self, raw, value, kind):
+        '''
+        Class constructor stores the decoded response
+
+        :param raw: response string as sent by the tester
+        :param value: decoded value
+        :param kind: decoder used (float, int, enum, hex, bool, list,
+                     str)
+
+        '''
+        self.raw = raw
+        self.value = value
+        self.kind = kind
+
+    def __str__(self):
+        return self.raw
+
+    def __repr__(self):
+        return 'RwcValue({!r}, {!r})'.format(self.raw, self.value)
+
+    def __eq__(self, other):
+        if isinstance(other, RwcValue):
+            return self.raw == other.raw
+        if isinstance(other, str):
+            return self.raw == other
+        return self.value == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.raw)
+
+    def __float__(self):
+        if self.kind in ('float', 'int', 'hex'):
+            return float(self.value)
+        return float(self.raw)
+
+    def __int__(self):
+        if self.kind in ('int', 'hex'):
+            return self.value
+        return int(float(self))
+
+
+def _decode_float(raw):
+    return float(raw)
+
+
+def _decode_int(raw):
+    # integer settings are often answered as '-50.0'
+    number = float(raw)
+    if number != int(number):
+        raise ValueError(raw)
+    return int(number)
+
+
+def _decode_hex(raw):
+    return int(raw, 16)
+
+
+def _decode_bool(raw):
+    word = raw.strip().upper()
+    if word in TRUE_WORDS:
+        return True
+    if word in FALSE_WORDS:
+        return False
+    raise ValueError(raw)
+
+
+def _decode_list(raw):
+    return [field.strip() for field in raw.split(',')]
+
+
+def _decode_str(raw):
+    return raw.strip()
+
+
+DECODERS = {
+    'float': _decode_float,
+    'freq': _decode_float,
+    'int': _decode_int,
+    'hex': _decode_hex,
+    'bool': _decode_bool,
+    'list': _decode_list,
+    'enum': _decode_str,
+    'str': _decode_str,
+    }
+
+
+def _build_parsers():
+    parsers = {'*IDN?': ('list', _decode_list)}
+    for param in cRWCParamTable.PARAMS.values():
+        kind = param.kind
+        if kind == 'enum' and param.domain in BOOL_DOMAINS:
+            kind = 'bool'
+        if kind == 'freq':
+            kind = 'float'
+        path = cRWCParamTable.QUERY_ALIASES.get(param.path, param.path)
+        parsers[path] = (kind, DECODERS[kind])
+    for path, kind, index in cRWCParamTable.STATUS_TABLE:
+        parsers[path] = (kind, DECODERS[kind])
+    return parsers
+
+
+# Getter path -> (kind, decoder), built once at import
+PARSERS = _build_parsers()
+
+
+def decode(rwccmd, result):
+    '''
+    Decode the response of a query command
+
+    :param rwccmd: RWC5020A remote command
+    :param result: response string of the tester
+
+    :return: RwcValue object for an answered query; any other response
+             (ACK, NAK, None) is returned unchanged
+
+    '''
+    if result is None or result == 'NAK' or isinstance(result, RwcValue):
+        return result
+
+    verb, key, value = parse_command(rwccmd)
+    if verb == 'QUERY':
+        path = key.split(' ')[0]
+    elif verb == '*IDN?':
+        path = verb
+    else:
+        return result
+
+    kind, decoder = PARSERS.get(path, ('str', _decode_str))
+    try:
+        return RwcValue(result, decoder(result), kind)
+    except ValueError:
+        return RwcValue(result, result.strip(), 'str')
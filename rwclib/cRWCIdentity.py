@@ -0,0 +1,160 @@
+##############################################################################
+#
+# Module: cRWCIdentity.py
+#
+# Description:
+#     Persistent cache of the tester identity and options
+#
+# Copyright notice:
+#     This file copyright (c) 2026 by
+#
+#         MCCI Corporation
+#         3520 Krums Corners Road
+#         Ithaca, NY  14850
+#
+#     See accompanying LICENSE file for copyright and license information.
+#
+# Author:
+#     Sivaprakash Veluthambi, MCCI   October, 2026
+#
+##############################################################################
+
+# Built-in imports
+import json
+import os
+import time
+
+# Lib imports
+from rwclib.cRWCShadowState import parse_command
+
+# Parameters which only change with a firmware or license update
+IDENTITY_KEYS = (
+    'SYSTEM:SW_VERSION',
+    'SYSTEM:SERIAL_NUM',
+    'SYSTEM:OPTION_GWT',
+    'SYSTEM:OPTION_EDT',
+    'SYSTEM:OPTION_NST',
+    'SYSTEM:OPTION_CERTI_EU',
+    'SYSTEM:OPTION_CERTI_SKT',
+    'SYSTEM:OPTION_CERTI_US',
+    'SYSTEM:OPTION_CERTI_AS',
+    'SYSTEM:OPTION_CERTI_KR',
+    )
+
+IDN_COMMAND = '*IDN?\n'
+
+DEFAULT_FILE = os.path.join(os.path.expanduser('~'), '.rwcapi',
+                            'identity.json')
+
+
+def tester_key(idn):
+    '''
+    Return the key of a tester in the cache: its serial number taken
+    from the *IDN? response, or the whole response if it has none
+
+    :param idn: response of *IDN?, e.g.
+                'RWC5020A LoRaWAN Tester, Ver=1.310,SN=RWC50201760009'
+
+    :return: key string
+
+    '''
+    for field in idn.split(','):
+        name, sep, value = field.strip().partition('=')
+        if sep and name.upper() == 'SN':
+            return value.strip()
+    return idn.strip()
+
+
+class RwcIdentity:
+    '''
+    .. class:: RwcIdentity
+
+    Identity and option values of one tester, answered without talking
+    to it. A cache file holds the values of every tester seen, keyed by
+    serial number; an entry is only used while the *IDN? response of
+    the tester (model, firmware version and serial) is unchanged.
+    Options answered NAK by an older firmware are remembered as NAK.
+
+    '''
+
+    def __init__(self, filename = None):
+        '''
+        Class constructor creates an empty identity
+
+        :param filename: cache file; None for ~/.rwcapi/identity.json
+
+        '''
+        self.filename = filename or DEFAULT_FILE
+        self.idn = None
+        self.values = {}
+
+    def lookup(self, rwccmd):
+        '''
+        Answer an identity query from memory
+
+        :param rwccmd: RWC5020A remote command
+
+        :return: the known value; None when the command has to go to
+                 the tester
+
+        '''
+        verb, key, value = parse_command(rwccmd)
+        if verb == '*IDN?':
+            return self.idn
+        if verb != 'QUERY':
+            return None
+        return self.values.get(key)
+
+    def load(self, idn):
+        '''
+        Take the values of a tester from the cache file
+
+        :param idn: current *IDN? response of the tester
+
+        :return: True when the cache holds a valid entry
+
+        '''
+        entry = self._read().get(tester_key(idn))
+        if entry is None or entry.get('idn') != idn:
+            return False
+        values = entry.get('values', {})
+        if any(values.get(key) is None for key in IDENTITY_KEYS):
+            return False
+        self.idn = idn
+        self.values = dict((key, values[key]) for key in IDENTITY_KEYS)
+        return True
+
+    def store(self, idn, values):
+        '''
+        Remember the values of a tester and write them to the cache
+        file
+
+        :param idn: *IDN? response of the tester
+        :param values: dictionary of IDENTITY_KEYS and value
+
+        :return: None
+
+        '''
+        self.idn = idn
+        self.values = dict(values)
+
+        data = self._read()
+        data[tester_key(idn)] = {'idn': idn, 'values': self.values,
+                                 'time': time.time()}
+        directory = os.path.dirname(self.filename)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        tmpName = self.filename + '.tmp'
+        with open(tmpName, 'w') as cacheFile:
+            json.dump(data, cacheFile, indent = 4)
+        os.replace(tmpName, self.filename)
+
+    def _read(self):
+        try:
+            with open(self.filename, 'r') as cacheFile:
+                data = json.load(cacheFile)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return data
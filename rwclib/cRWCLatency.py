@@ -0,0 +1,142 @@
+##############################################################################
+#
+# Module: cRWCLatency.py
+#
+# Description:
+#     Latency histograms of tester operations, per firmware version
+#
+# Copyright notice:
+#     This file copyright (c) 2026 by
+#
+#         MCCI Corporation
+#         3520 Krums Corners Road
+#         Ithaca, NY  14850
+#
+#     See accompanying LICENSE file for copyright and license information.
+#
+# Author:
+#     Sivaprakash Veluthambi, MCCI   October, 2026
+#
+##############################################################################
+
+# Upper bounds of the histogram buckets, in seconds; the last bucket
+# holds everything above
+BUCKET_LIMITS = (
+    0.010, 0.020, 0.050, 0.100, 0.200, 0.300, 0.500, 0.750, 1.000,
+    2.000, 5.000)
+
+# Version recorded when the firmware of the tester is not known
+UNKNOWN_VERSION = 'unknown'
+
+
+class RwcLatencyStats:
+    '''
+    .. class:: RwcLatencyStats
+
+    Histograms of the time taken by tester operations (e.g. a mode
+    switch), kept per operation and firmware version. Besides the
+    bucket counts the smallest, largest and total time are kept, so
+    the expected time of the next operation can be guessed.
+
+    '''
+
+    def __init__(self, limits = BUCKET_LIMITS):
+        '''
+        Class constructor creates empty histograms
+
+        :param limits: upper bounds of the histogram buckets, in
+                       seconds; the last bucket holds everything above
+
+        '''
+        self.limits = tuple(limits)
+        # (event, version) -> {'counts', 'count', 'min', 'max', 'total'}
+        self.entries = {}
+
+    def record(self, event, version, seconds):
+        '''
+        Add one measured time
+
+        :param event: operation name, e.g. 'TESTER_MODE NST_TX'
+        :param version: software version of the tester; None if unknown
+        :param seconds: time taken
+
+        :return: None
+
+        '''
+        key = (event, str(version or UNKNOWN_VERSION))
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = {'counts': [0] * (len(self.limits) + 1),
+                     'count': 0, 'min': seconds, 'max': seconds,
+                     'total': 0.0}
+            self.entries[key] = entry
+
+        bucket = len(self.limits)
+        for index, limit in enumerate(self.limits):
+            if seconds <= limit:
+                bucket = index
+                break
+        entry['counts'][bucket] += 1
+        entry['count'] += 1
+        entry['min'] = min(entry['min'], seconds)
+        entry['max'] = max(entry['max'], seconds)
+        entry['total'] += seconds
+
+    def histogram(self, event, version):
+        '''
+        Return the histogram of an operation
+
+        :param event: operation name
+        :param version: software version of the tester; None if unknown
+
+        :return: list of (upper bound in seconds, count); the bound of
+                 the last bucket is None. None when nothing is recorded.
+
+        '''
+        entry = self.entries.get((event, str(version or UNKNOWN_VERSION)))
+        if entry is None:
+            return None
+        return list(zip(self.limits + (None,), entry['counts']))
+
+    def minimum(self, event, version):
+        '''
+        Return the shortest time recorded for an operation
+
+        :param event: operation name
+        :param version: software version of the tester; None if unknown
+
+        :return: time in seconds; None when nothing is recorded
+
+        '''
+        entry = self.entries.get((event, str(version or UNKNOWN_VERSION)))
+        if entry is None:
+            return None
+        return entry['min']
+
+    def summary(self):
+        '''
+        Return the statistics of every operation
+
+        :Parameters: N/A
+
+        :return: dictionary of (event, version) and a dictionary with
+                 count, min, max and mean time in seconds
+
+        '''
+        result = {}
+        for key, entry in self.entries.items():
+            result[key] = {'count': entry['count'], 'min': entry['min'],
+                           'max': entry['max'],
+                           'mean': entry['total'] / entry['count']}
+        return result
+
+    def clear(self):
+        '''
+        Drop every recorded time
+
+        :Parameters: N/A
+
+        :return: None
+
+        '''
+        self.entries.clear()
@@ -0,0 +1,230 @@
+##############################################################################
+#
+# Module: cRWCLinkMsg.py
+#
+# Description:
+#     Parsed records of the link analyzer messages (READ:LINK:MSG?)
+#
+# Copyright notice:
+#     This file copyright (c) 2026 by
+#
+#         MCCI Corporation
+#         3520 Krums Corners Road
+#         Ithaca, NY  14850
+#
+#     See accompanying LICENSE file for copyright and license information.
+#
+# Author:
+#     Sivaprakash Veluthambi, MCCI   October, 2026
+#
+##############################################################################
+
+# Built-in imports
+import sys
+
+# Columns of a link message in the order sent by the tester, as
+# (field, display flag, kind); a column with a display flag is only
+# sent while the flag is ON. With every flag ON the MAC commands are in
+# column 17, as used by the certification examples.
+MSG_COLUMNS = (
+    ('direction', None, 'name'),
+    ('time', 'LINK:TIME_DISPLAY', 'str'),
+    ('msg_type', 'LINK:MSG_TYPE_DISPLAY', 'name'),
+    ('dev_addr', None, 'name'),
+    ('fcnt', 'LINK:FCNT_DISPLAY', 'int'),
+    ('port', 'LINK:PORT_DISPLAY', 'int'),
+    ('adr', 'LINK:ADR_DISPLAY', 'name'),
+    ('adr_ack_req', 'LINK:ADRACKREQ_DISPLAY', 'name'),
+    ('ack', 'LINK:ACK_DISPLAY', 'name'),
+    ('fpending', 'LINK:FPENDING_DISPLAY', 'name'),
+    ('class_b', 'LINK:CLASS_B_DISPLAY', 'name'),
+    ('dr', 'LINK:DR_DISPLAY', 'name'),
+    ('power', 'LINK:POW_DISPLAY', 'float'),
+    ('delay', 'LINK:DELAY_DISPLAY', 'float'),
+    ('dwell', 'LINK:DWELL_DISPLAY', 'name'),
+    ('mic_err', 'LINK:MIC_ERR_DISPLAY', 'name'),
+    ('freq', None, 'float'),
+    ('mac', None, 'str'),
+    ('payload', None, 'str'),
+    )
+
+# Display flags deciding the columns of a link message
+DISPLAY_FLAGS = tuple(flag for field, flag, kind in MSG_COLUMNS if flag)
+
+# Responses which carry no message
+EMPTY_RESPONSES = (None, '', 'NA', 'NAK')
+
+# Fields shown by the named field profiles; the columns without a
+# display flag (direction, dev_addr, freq, mac, payload) are always sent
+FIELD_PROFILES = {
+    'FULL': tuple(field for field, flag, kind in MSG_COLUMNS if flag),
+    'LEAN': ('msg_type', 'fcnt', 'port'),
+    'MAC': ('msg_type', 'fcnt', 'port', 'ack', 'fpending'),
+    'RADIO': ('time', 'msg_type', 'fcnt', 'dr', 'power', 'delay'),
+    }
+
+
+def display_flags(profile):
+    '''
+    Return the display flags showing the fields of a profile
+
+    :param profile: name of FIELD_PROFILES, or iterable of field names
+                    of MSG_COLUMNS
+
+    :return: dictionary of display flag path (DISPLAY_FLAGS) and ON/OFF
+
+    '''
+    if isinstance(profile, str):
+        if profile not in FIELD_PROFILES:
+            raise Exception('Invalid field profile received: {}'
+                            .format(profile))
+        profile = FIELD_PROFILES[profile]
+    fields = set(profile)
+    known = set(field for field, flag, kind in MSG_COLUMNS)
+    if not fields <= known:
+        raise Exception('Invalid message field received: {}'
+                        .format(', '.join(sorted(fields - known))))
+    return dict((flag, 'ON' if field in fields else 'OFF')
+                for field, flag, kind in MSG_COLUMNS if flag)
+
+
+def _convert_name(text):
+    # few distinct values, shared between the records
+    return sys.intern(text)
+
+
+def _convert_int(text):
+    return int(text)
+
+
+def _convert_float(text):
+    return float(text)
+
+
+def _convert_str(text):
+    return text
+
+
+CONVERTERS = {
+    'name': _convert_name,
+    'int': _convert_int,
+    'float': _convert_float,
+    'str': _convert_str,
+    }
+
+
+class RwcLinkMsg:
+    '''
+    .. class:: RwcLinkMsg
+
+    One link analyzer message. Numbers are stored as int or float and
+    repeated names (direction, message type, data rate, ...) are shared
+    between records, so a long capture takes little memory. A field
+    whose column is not displayed is None; columns beyond the known
+    layout are kept in extra.
+
+    '''
+    __slots__ = tuple(field for field, flag, kind in MSG_COLUMNS) \
+        + ('extra',)
+
+    def __init__(self, **fields):
+        '''
+        Class constructor stores the fields of a message
+
+        :param fields: field names of MSG_COLUMNS and extra; missing
+                       fields are None
+
+        '''
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    def __repr__(self):
+        return 'RwcLinkMsg({}, {}, FCnt={}, {})'.format(
+            self.direction, self.msg_type, self.fcnt, self.mac)
+
+    def is_uplink(self):
+        '''
+        Check whether the message was sent by the DUT
+
+        :Parameters: N/A
+
+        :return: True for an uplink message
+
+        '''
+        return bool(self.direction) and self.direction.startswith('U')
+
+    def as_dict(self):
+        '''
+        Return the fields of the message
+
+        :Parameters: N/A
+
+        :return: dictionary of field name and value
+
+        '''
+        return dict((name, getattr(self, name)) for name in self.__slots__)
+
+
+class RwcMsgParser:
+    '''
+    .. class:: RwcMsgParser
+
+    Parser of the READ:LINK:MSG? responses for one setting of the
+    display flags. The column layout is built once, so parsing a
+    message is a single pass over its tab separated fields.
+
+    '''
+
+    def __init__(self, flags = None):
+        '''
+        Class constructor builds the column layout
+
+        :param flags: dictionary of display flag path (DISPLAY_FLAGS)
+                      and ON/OFF; a missing flag counts as ON, the
+                      tester default. None for every flag ON.
+
+        '''
+        flags = flags or {}
+        self.layout = []
+        for field, flag, kind in MSG_COLUMNS:
+            if flag and str(flags.get(flag, 'ON')).strip() == 'OFF':
+                continue
+            self.layout.append((field, CONVERTERS[kind]))
+
+    def fields(self):
+        '''
+        Return the names of the columns sent by the tester
+
+        :Parameters: N/A
+
+        :return: list of field names, in column order
+
+        '''
+        return [field for field, converter in self.layout]
+
+    def parse(self, result):
+        '''
+        Parse one link message
+
+        :param result: response of READ:LINK:MSG?
+
+        :return: RwcLinkMsg object; None when the response carries no
+                 message (NA, NAK or nothing)
+
+        '''
+        if result in EMPTY_RESPONSES:
+            return None
+        columns = str(result).rstrip('\r\n').split('\t')
+
+        fields = {}
+        for (field, converter), text in zip(self.layout, columns):
+            text = text.strip()
+            if not text:
+                continue
+            try:
+                fields[field] = converter(text)
+            except ValueError:
+                fields[field] = text
+        if len(columns) > len(self.layout):
+            fields['extra'] = tuple(columns[len(self.layout):])
+        return RwcLinkMsg(**fields)
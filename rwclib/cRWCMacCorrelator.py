@@ -0,0 +1,239 @@
+##############################################################################
+#
+# Module: cRWCMacCorrelator.py
+#
+# Description:
+#     Pairing of MAC requests with their answers in the link messages
+#
+# Copyright notice:
+#     This file copyright (c) 2026 by
+#
+#         MCCI Corporation
+#         3520 Krums Corners Road
+#         Ithaca, NY  14850
+#
+#     See accompanying LICENSE file for copyright and license information.
+#
+# Author:
+#     Sivaprakash Veluthambi, MCCI   October, 2026
+#
+##############################################################################
+
+# Built-in imports
+import collections
+import re
+import threading
+import time
+
+# Lib imports
+from rwclib.cRWCLatency import RwcLatencyStats
+
+# MAC command shown by the link analyzer for a request, and the command
+# answering it; the answer comes in the other direction
+MAC_ANSWERS = {
+    'LinkADRReq': 'LinkADRAns',
+    'DutyCycleReq': 'DutyCycleAns',
+    'RXParamSetupReq': 'RXParamSetupAns',
+    'DevStatusReq': 'DevStatusAns',
+    'NewChannelReq': 'NewChannelAns',
+    'RXTimingSetupReq': 'RXTimingSetupAns',
+    'TxParamSetupReq': 'TxParamSetupAns',
+    'DlChannelReq': 'DlChannelAns',
+    'ADRParamSetupReq': 'ADRParamSetupAns',
+    'RejoinParamSetupReq': 'RejoinParamSetupAns',
+    'PingSlotChannelReq': 'PingSlotChannelAns',
+    'BeaconFreqReq': 'BeaconFreqAns',
+    'ForceRejoinReq': 'Rejoin-request',
+    'LinkCheckReq': 'LinkCheckAns',
+    'DeviceTimeReq': 'DeviceTimeAns',
+    'DeviceModeInd': 'DeviceModeConf',
+    'ResetInd': 'ResetConf',
+    'EchoRequest': 'EchoResponse',
+    'ActivateTM': 'DlCounter',
+    'TriggerJoinReq': 'Join-request',
+    }
+
+# Upper bounds of the answer latency buckets, in seconds; a DUT answers
+# in its next uplink, so latencies follow its uplink period
+MAC_LATENCY_LIMITS = (
+    1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+# Names of the MAC commands in the MAC column of a link message
+MAC_NAME = re.compile(r'[A-Za-z][\w-]*')
+
+
+class RwcMacCorrelator:
+    '''
+    .. class:: RwcMacCorrelator
+
+    Pairs each MAC request seen in the link messages (e.g. LinkADRReq
+    sent by link_sendmac()) with the first answer of the other side
+    (LinkADRAns), and records the answer latency and the FCnt distance:
+    the number of uplinks the DUT sent before answering, 1 when it
+    answers in its next uplink.
+
+    Messages are fed one by one, e.g. by the link message collector.
+    Only the pending requests are kept, at most limit per command, and
+    a request unanswered after timeout seconds is counted as missed, so
+    memory stays the same however long the capture runs.
+
+    '''
+
+    def __init__(self, timeout = 120, limit = 16, answers = None,
+                 version = None, on_pair = None):
+        '''
+        Class constructor creates a correlator with nothing pending
+
+        :param timeout: seconds after which a request is missed
+        :param limit: pending requests kept per command; the oldest
+                      one is missed when another is sent
+        :param answers: dictionary of request and answer names added to
+                        or replacing MAC_ANSWERS
+        :param version: software version of the tester, recorded with
+                        the latencies
+        :param on_pair: optional callable(request, answer, latency,
+                        distance) called for every pair; request and
+                        answer are RwcLinkMsg objects
+
+        '''
+        self.timeout = timeout
+        self.limit = limit
+        self.answers = dict(MAC_ANSWERS)
+        if answers:
+            self.answers.update(answers)
+        self.version = version
+        self.on_pair = on_pair
+
+        self.lock = threading.Lock()
+        # answer name -> deque of (request name, request, time,
+        # last uplink FCnt)
+        self.pending = collections.defaultdict(
+            lambda: collections.deque(maxlen = self.limit))
+        self.latency = RwcLatencyStats(MAC_LATENCY_LIMITS)
+        self.distance = collections.defaultdict(collections.Counter)
+        self.missed = collections.Counter()
+        self.lastFcnt = None
+
+    def feed(self, record, timestamp = None):
+        '''
+        Take the next link message
+
+        :param record: RwcLinkMsg object
+        :param timestamp: time the message was received; None for now
+
+        :return: list of (request name, latency, FCnt distance) of the
+                 requests it answers
+
+        '''
+        if timestamp is None:
+            timestamp = time.time()
+        uplink = record.is_uplink()
+        names = MAC_NAME.findall(record.mac or '')
+
+        paired = []
+        with self.lock:
+            self._expire(timestamp)
+            for name in names:
+                queue = self.pending.get(name)
+                if not queue or queue[0][1].is_uplink() == uplink:
+                    continue
+                requestName, request, sent, lastFcnt = queue.popleft()
+                latency = timestamp - sent
+                distance = None
+                if uplink and lastFcnt is not None \
+                        and record.fcnt is not None:
+                    distance = record.fcnt - lastFcnt
+                    self.distance[requestName][distance] += 1
+                self.latency.record(requestName, self.version, latency)
+                paired.append((requestName, request, latency, distance))
+
+            for name in names:
+                answer = self.answers.get(name)
+                if answer is None:
+                    continue
+                queue = self.pending[answer]
+                if len(queue) == queue.maxlen:
+                    self.missed[queue[0][0]] += 1
+                queue.append((name, record, timestamp, self.lastFcnt))
+
+            if uplink and record.fcnt is not None:
+                self.lastFcnt = record.fcnt
+
+        if self.on_pair is not None:
+            for requestName, request, latency, distance in paired:
+                self.on_pair(request, record, latency, distance)
+        return [(requestName, latency, distance)
+                for requestName, request, latency, distance in paired]
+
+    def outstanding(self):
+        '''
+        Return the number of pending requests
+
+        :Parameters: N/A
+
+        :return: dictionary of request name and count
+
+        '''
+        with self.lock:
+            counts = collections.Counter()
+            for queue in self.pending.values():
+                for entry in queue:
+                    counts[entry[0]] += 1
+            return dict(counts)
+
+    def stats(self):
+        '''
+        Return the statistics of every request
+
+        :Parameters: N/A
+
+        :return: dictionary of request name and a dictionary with count,
+                 min, max and mean latency in seconds, missed, and
+                 fcnt (dictionary of FCnt distance and count)
+
+        '''
+        with self.lock:
+            self._expire(time.time())
+            result = {}
+            for (name, version), entry in self.latency.summary().items():
+                result[name] = dict(entry)
+            for name in self.missed:
+                result.setdefault(name, {'count': 0})
+            for name, entry in result.items():
+                entry['missed'] = self.missed[name]
+                entry['fcnt'] = dict(self.distance.get(name, {}))
+            return result
+
+    def histogram(self, request):
+        '''
+        Return the latency histogram of a request
+
+        :param request: request name, e.g. 'LinkADRReq'
+
+        :return: list of (upper bound in seconds, count); the bound of
+                 the last bucket is None. None when nothing is paired.
+
+        '''
+        with self.lock:
+            return self.latency.histogram(request, self.version)
+
+    def clear(self):
+        '''
+        Drop the pending requests and the statistics
+
+        :Parameters: N/A
+
+        :return: None
+
+        '''
+        with self.lock:
+            self.pending.clear()
+            self.latency.clear()
+            self.distance.clear()
+            self.missed.clear()
+            self.lastFcnt = None
+
+    def _expire(self, now):
+        for queue in self.pending.values():
+            while queue and now - queue[0][2] > self.timeout:
+                self.missed[queue.popleft()[0]] += 1
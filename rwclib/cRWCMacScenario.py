@@ -0,0 +1,251 @@
+##############################################################################
+#
+# Module: cRWCMacScenario.py
+#
+# Description:
+#     MAC command scenario compiled into one burst of settings
+#
+# Copyright notice:
+#     This file copyright (c) 2026 by
+#
+#         MCCI Corporation
+#         3520 Krums Corners Road
+#         Ithaca, NY  14850
+#
+#     See accompanying LICENSE file for copyright and license information.
+#
+# Author:
+#     Sivaprakash Veluthambi, MCCI   October, 2026
+#
+##############################################################################
+
+# Lib imports
+from rwclib import cRWCParamTable
+from rwclib import cRWCValidator
+from rwclib.cRWCParamTable import RwcConfigError
+
+# Number of MAC commands the tester sends at once
+MAX_MAC_COMMANDS = 3
+
+# First firmware version taking the MAC command number on the echo,
+# CW, beacon and ping slot parameters
+MAC_INDEX_VERSION = 1.17
+
+# Settings of the MAC message, common to every command
+MAC_SETTINGS = (
+    'LINK:MAC_CMD_TYPE',
+    'LINK:MAC_CMD_FIELD',
+    'LINK:MAC_ANS_TO',
+    )
+
+# Parameters of each MAC command; commands not listed take none
+MAC_PARAMS = {
+    'LINK_ADR': (
+        'LINK:ADR_DR', 'LINK:ADR_TXPOW', 'LINK:ADR_CH_MASK',
+        'LINK:ADR_CH_MASK2', 'LINK:ADR_CH_MASK3', 'LINK:ADR_MASK_CTRL',
+        'LINK:ADR_MASK2_CTRL', 'LINK:ADR_MASK3_CTRL', 'LINK:ADR_NB_TRANS'),
+    'DUTY_CYCLE': ('LINK:MAX_DUTY_CYCLE',),
+    'RX_PARAM_SETUP': (
+        'LINK:RX2_DR', 'LINK:RX2_FREQ', 'LINK:RX1_DR_OFFSET'),
+    'TX_PARAM_SETUP': (
+        'LINK:MAX_EIRP', 'LINK:UL_DWELL_TIME', 'LINK:DL_DWELL_TIME'),
+    'NEW_CHANNEL': (
+        'LINK:NEW_CH_MODE', 'LINK:NEW_CH_INDEX', 'LINK:NEW_CH_MAX_DR',
+        'LINK:NEW_CH_MIN_DR'),
+    'DL_CHANNEL': ('LINK:DL_CH_INDEX', 'LINK:DL_CH_FREQ'),
+    'RX_TIMING_SETUP': ('LINK:RECEIVE_DELAY',),
+    'ECHO_REQUEST_TM': ('LINK:ECHO_PAYLOAD', 'LINK:ECHO_LEN'),
+    'ENABLE_CW_MODE_TM': (
+        'LINK:CW_TIMEOUT', 'LINK:CW_FREQ', 'LINK:CW_POW'),
+    'BEACON_FREQ': ('LINK:BEACON_FREQ',),
+    'PING_SLOT_CH': ('LINK:PING_DR', 'LINK:PING_FREQ'),
+    'FORCE_REJOIN': (
+        'LINK:REJOIN_DR', 'LINK:REJOIN_TYPE', 'LINK:REJOIN_RETRY',
+        'LINK:REJOIN_PERIOD'),
+    'REJOIN_SETUP': ('LINK:REJOIN_MAX_TIME_N', 'LINK:REJOIN_MAX_CNT_N'),
+    'ADR_SETUP': ('LINK:ADR_LIMIT_EXP', 'LINK:ADR_DELAY_EXP'),
+    }
+
+
+def link_path(name):
+    '''
+    Return the command path of a LINK parameter
+
+    :param name: parameter name with or without the subsystem, e.g.
+                 'ADR_DR' or 'LINK:ADR_DR'
+
+    :return: command path, e.g. 'LINK:ADR_DR'
+
+    '''
+    path = str(name).upper()
+    if not path.startswith('LINK:'):
+        path = 'LINK:' + path
+    return path
+
+
+class RwcMacScenario:
+    '''
+    .. class:: RwcMacScenario
+
+    Up to three MAC commands sent to the DUT in one message, with their
+    parameters. The scenario is checked without talking to the tester
+    and compiled into the settings of the LINK menu: the number of
+    commands, the command of each slot and the parameters of each slot,
+    in the order the tester needs them.
+
+    E.g.
+        scenario = RwcMacScenario(MAC_CMD_TYPE='CONFIRMED')
+        scenario.add('LINK_ADR', ADR_DR='DR5_SF7BW125', ADR_TXPOW=2)
+        scenario.add('DEV_STATUS')
+
+    '''
+
+    def __init__(self, **settings):
+        '''
+        Class constructor creates an empty scenario
+
+        :param settings: optional message settings, MAC_CMD_TYPE,
+                         MAC_CMD_FIELD and MAC_ANS_TO
+
+        '''
+        self.settings = {}
+        self.commands = []
+        for name, value in settings.items():
+            path = link_path(name)
+            if path not in MAC_SETTINGS:
+                raise Exception('Invalid MAC setting received: {}'
+                                .format(name))
+            self.settings[path] = value
+
+    def __len__(self):
+        return len(self.commands)
+
+    def add(self, command, **params):
+        '''
+        Add a MAC command to the next slot
+
+        :param command: MAC command, one of cRWCParamTable.MAC_COMMANDS
+        :param params: parameters of the command, named by their LINK
+                       path, e.g. ADR_DR='DR5_SF7BW125'
+
+        :return: the scenario, so calls can be chained
+
+        '''
+        command = str(command).upper()
+        if command not in cRWCParamTable.MAC_COMMANDS:
+            raise Exception('Invalid MAC command received: {}'
+                            .format(command))
+        if len(self.commands) >= MAX_MAC_COMMANDS:
+            raise Exception('A scenario holds at most {} MAC commands'
+                            .format(MAX_MAC_COMMANDS))
+
+        allowed = MAC_PARAMS.get(command, ())
+        values = {}
+        for name, value in params.items():
+            path = link_path(name)
+            if path not in allowed:
+                raise Exception('{} is not a parameter of {}'
+                                .format(path, command))
+            values[path] = value
+        self.commands.append((command, values))
+        return self
+
+    def config(self, version = None):
+        '''
+        Return the scenario as a configuration, see RWCTesterApi.apply()
+
+        :param version: software version of the tester; parameters
+                        which take the MAC command number since 1.17
+                        are given without it for an older version.
+                        None for a current firmware.
+
+        :return: dictionary of parameter key and value
+
+        '''
+        indexed = _takes_index(version)
+        config = dict(self.settings)
+        if self.commands:
+            config['LINK:NUM_OF_CMD'] = len(self.commands)
+        for macnum, (command, values) in enumerate(self.commands, 1):
+            config['LINK:INSTANT_MAC_CMD {}'.format(macnum)] = command
+            for path, value in values.items():
+                param = cRWCParamTable.PARAMS[path]
+                if param.index == cRWCParamTable.INDEX_OPTIONAL \
+                        and not indexed:
+                    config[path] = value
+                else:
+                    config['{} {}'.format(path, macnum)] = value
+        return config
+
+    def validate(self, current = None, version = None):
+        '''
+        Check the scenario without talking to the tester, see
+        cRWCValidator.validate_config()
+
+        :param current: optional dictionary of values held by the
+                        tester, e.g. the region
+        :param version: software version of the tester
+
+        :return: list of error descriptions; empty when valid
+
+        '''
+        errors = []
+        if not self.commands:
+            errors.append('The scenario holds no MAC command')
+
+        if not _takes_index(version):
+            for macnum, (command, values) in enumerate(self.commands, 1):
+                for path in values:
+                    param = cRWCParamTable.PARAMS[path]
+                    if param.index == cRWCParamTable.INDEX_OPTIONAL \
+                            and macnum > 1:
+                        errors.append('{} needs software version {} for '
+                                      'MAC command {}'.format(
+                                          path, MAC_INDEX_VERSION, macnum))
+
+        errors.extend(cRWCValidator.validate_config(
+            self.config(version), current))
+        return errors
+
+    def compile(self, current = None, version = None):
+        '''
+        Check the scenario and build its setting commands, in the order
+        the tester needs them: number of commands, message settings,
+        then the command of each slot followed by its parameters
+
+        :param current: optional dictionary of values held by the
+                        tester
+        :param version: software version of the tester
+
+        :return: list of RWC5020A remote commands; raises
+                 RwcConfigError listing every problem
+
+        '''
+        errors = self.validate(current, version)
+        if errors:
+            raise RwcConfigError(errors)
+
+        config = self.config(version)
+        return [cRWCParamTable.set_command(key, config[key])
+                for key in sorted(config, key = _scenario_order)]
+
+
+def _takes_index(version):
+    try:
+        return float(version) >= MAC_INDEX_VERSION
+    except (TypeError, ValueError):
+        return True
+
+
+def _scenario_order(key):
+    # the number of commands resets the LINK menu, so it goes first;
+    # the command of a slot goes before the parameters of the slot
+    param, index = cRWCParamTable.split_key(key)
+    if param.path == 'LINK:NUM_OF_CMD':
+        return (0, 0, 0)
+    if param.path in MAC_SETTINGS:
+        return (1, 0, cRWCParamTable.PARAM_ORDER[param.path])
+    slot = int(index or 1)
+    if param.path == 'LINK:INSTANT_MAC_CMD':
+        return (2, slot, 0)
+    return (2, slot, 1 + cRWCParamTable.PARAM_ORDER[param.path])
@@ -0,0 +1,119 @@
+##############################################################################
+#
+# Module: cRWCMatcher.py
+#
+# Description:
+#     Compiled predicates on link messages
+#
+# Copyright notice:
+#     This file copyright (c) 2026 by
+#
+#         MCCI Corporation
+#         3520 Krums Corners Road
+#         Ithaca, NY  14850
+#
+#     See accompanying LICENSE file for copyright and license information.
+#
+# Author:
+#     Sivaprakash Veluthambi, MCCI   October, 2026
+#
+##############################################################################
+
+# Built-in imports
+import re
+
+# Lib imports
+from rwclib.cRWCLinkMsg import RwcLinkMsg
+
+
+class RwcMatcher:
+    '''
+    .. class:: RwcMatcher
+
+    Predicate on a link message, built once from its conditions so
+    testing a message is a few comparisons and regular expression
+    searches. A message matches when every condition holds, e.g.
+    RwcMatcher(mac = 'DlCounter', uplink = True).
+
+    '''
+
+    def __init__(self, mac = None, msg_type = None, uplink = None,
+                 **fields):
+        '''
+        Class constructor compiles the conditions
+
+        :param mac: MAC command name found in the MAC column, e.g.
+                    'ActivateTM'
+        :param msg_type: message type, or tuple of message types, e.g.
+                         ('ConfUp', 'UnconfUp')
+        :param uplink: True for uplinks, False for downlinks
+        :param fields: regular expression searched in a field of
+                       RwcLinkMsg, e.g. payload = '^01', or a number
+                       compared with it, e.g. fcnt = 3
+
+        '''
+        self.tests = []
+        self.text = []
+        if mac is not None:
+            self._regex('mac', re.escape(mac))
+        if msg_type is not None:
+            if isinstance(msg_type, str):
+                msg_type = (msg_type,)
+            msgTypes = frozenset(msg_type)
+            self.tests.append(lambda record: record.msg_type in msgTypes)
+            self.text.append('msg_type in {}'.format(sorted(msgTypes)))
+        if uplink is not None:
+            uplink = bool(uplink)
+            self.tests.append(lambda record: record.is_uplink() == uplink)
+            self.text.append('uplink={}'.format(uplink))
+        for name in sorted(fields):
+            if name not in RwcLinkMsg.__slots__:
+                raise Exception('Invalid message field received: {}'
+                                .format(name))
+            value = fields[name]
+            if isinstance(value, (int, float)):
+                self._equal(name, value)
+            else:
+                self._regex(name, value)
+
+    def __call__(self, record):
+        for test in self.tests:
+            if not test(record):
+                return False
+        return True
+
+    def __repr__(self):
+        return 'RwcMatcher({})'.format(', '.join(self.text))
+
+    def _equal(self, name, value):
+        self.tests.append(lambda record: getattr(record, name) == value)
+        self.text.append('{}={}'.format(name, value))
+
+    def _regex(self, name, pattern):
+        search = re.compile(pattern).search
+        def test(record):
+            value = getattr(record, name)
+            return value is not None and search(str(value)) is not None
+        self.tests.append(test)
+        self.text.append('{}~{}'.format(name, pattern))
+
+
+def compile_matcher(match):
+    '''
+    Turn a match condition into a predicate on link messages
+
+    :param match: RwcMatcher or callable taking a RwcLinkMsg; str for
+                  a MAC command name, e.g. 'DlCounter'; dictionary of
+                  RwcMatcher conditions, e.g. {'msg_type': 'ConfUp',
+                  'fcnt': 3}
+
+    :return: callable returning True for a matching RwcLinkMsg
+
+    '''
+    if isinstance(match, str):
+        return RwcMatcher(mac = match)
+    if isinstance(match, dict):
+        return RwcMatcher(**match)
+    if callable(match):
+        return match
+    raise Exception('Invalid match condition received: {}'.format(match))
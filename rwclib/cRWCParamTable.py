@@ -0,0 +1,892 @@
+##############################################################################
+#
+# Module: cRWCParamTable.py
+#
+# Description:
+#     Table of the configurable RWC5020x parameters, their value domain
+#     and the order in which they have to be applied
+#
+# Copyright notice:
+#     This file copyright (c) 2026 by
+#
+#         MCCI Corporation
+#         3520 Krums Corners Road
+#         Ithaca, NY  14850
+#
+#     See accompanying LICENSE file for copyright and license information.
+#
+# Author:
+#     Sivaprakash Veluthambi, MCCI   October, 2026
+#
+##############################################################################
+
+# Lib imports
+from rwclib.cRWCShadowState import DEPENDENT_PATHS
+from rwclib.cRWCShadowState import QUERY_ALIASES
+from rwclib.cRWCShadowState import is_volatile
+
+# Apply order: a parameter is only sent after every parameter of a lower
+# rank, since changing those resets it on the tester
+RANK_MODE = 0
+RANK_REGION = 1
+RANK_CHANNEL_PLAN = 2
+RANK_KEYS = 3
+RANK_MAC_COUNT = 4
+RANK_GENERAL = 5
+RANK_MAC_SLOTS = 6
+RANK_MAC_PARAM = 7
+
+# Index argument of a parameter
+INDEX_NONE = 0
+INDEX_MAC = 1
+INDEX_OPTIONAL = 2
+INDEX_CHANNEL = 3
+
+OFF_ON = ('OFF', 'ON')
+
+DR_NAMES = (
+    'DR0_SF12BW125', 'DR1_SF11BW125',
+    'DR2_SF10BW125', 'DR3_SF9BW125',
+    'DR4_SF8BW125', 'DR5_SF7BW125',
+    'DR6_SF7BW250', 'DR7_FSK50')
+
+OLD_DR_NAMES = (
+    'DR_0', 'DR_1', 'DR_2', 'DR_3',
+    'DR_4', 'DR_5', 'DR_6', 'DR_7')
+
+PAYLOAD_TYPES = (
+    '0000_0000', '1111_1111', '1111_0000',
+    '1010_1010', 'PRBS', 'USER')
+
+CODING_RATES = ('4_5', '4_6', '4_7', '4_8', 'NO_CRC')
+
+SPREADING_FACTORS = ('SF7', 'SF8', 'SF9', 'SF10', 'SF11', 'SF12')
+
+DUT_TYPES = ('END_DEVICE', 'GATEWAY', 'UNKNOWN')
+
+MAC_COMMANDS = (
+    'DEV_STATUS', 'LINK_ADR', 'DUTY_CYCLE', 'RX_PARAM_SETUP',
+    'TX_PARAM_SETUP', 'NEW_CHANNEL', 'DL_CHANNEL', 'RX_TIMING_SETUP',
+    'USER_DEFINED', 'ACTIVATE_TM', 'DEACTIVATE_TM', 'CONFIRMED_TM',
+    'UNCONFIRMED_TM', 'ECHO_REQUEST_TM', 'TRIGGER_JOIN_REQ_TM',
+    'ENABLE_CW_MODE_TM', 'BEACON_FREQ', 'PING_SLOT_CH', 'FORCE_REJOIN',
+    'REJOIN_SETUP', 'ADR_SETUP', 'LINK_CHECK', 'DEVICE_TIME',
+    'DEVICE_MODE', 'RESET_IND')
+
+REGIONS = (
+    'EU_868', 'EU_433', 'US_915', 'AU_921', 'CN_470',
+    'KR_922', 'AS_923', 'IN_866', 'RU_864')
+
+CHANNEL_GROUPS = (
+    '00~07,64', '08~15,65', '16~23,66', '24~31,67',
+    '32~39,68', '40~47,69', '48~55,70', '56~63,71',
+    '00~07', '08~15', '16~23', '24~31', '32~39', '40~47',
+    '48~55', '56~63', '64~71', '72~79', '80~87', '88~95')
+
+# Frequency bands accepted by the tester, in MHz
+FREQ_BANDS = ((400, 510), (862, 960))
+
+# (path, kind, domain, rank, index)
+#
+# kind 'enum' takes one of the domain strings, 'int' and 'float' a
+# number in the (min, max) domain, 'hex' an integer of domain bits
+# sent in hex, 'freq' a frequency in FREQ_BANDS
+PARAM_TABLE = (
+    # System Configuration
+    ('TESTER_MODE', 'enum', ('EDT', 'GWT', 'NST_TX', 'NST_RX', 'NST_MFG'),
+        RANK_MODE, INDEX_NONE),
+    ('REMOTE:LOCK', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+
+    # RF
+    ('RF:FREQ', 'freq', None, RANK_GENERAL, INDEX_NONE),
+    ('RF:TX_FREQ', 'freq', None, RANK_GENERAL, INDEX_NONE),
+    ('RF:RX_FREQ', 'freq', None, RANK_GENERAL, INDEX_NONE),
+    ('RF:MFG_FREQ', 'freq', None, RANK_GENERAL, INDEX_NONE),
+    ('RF:TX_POW', 'int', (-150, 10), RANK_GENERAL, INDEX_NONE),
+    ('RF:PATH_LOSS', 'int', (0, 50), RANK_GENERAL, INDEX_NONE),
+    ('RF:SYSCLK_OFFSET', 'int', (-100, 100), RANK_GENERAL, INDEX_NONE),
+    ('RF:FREQ_OFFSET', 'int', (-1000, 1000), RANK_GENERAL, INDEX_NONE),
+    ('RF:TIME_OFFSET', 'int', (-1000, 1000), RANK_GENERAL, INDEX_NONE),
+    ('RF:ICA_CH_MODE', 'enum', ('INTER_FREQ', 'SAME_FREQ'),
+        RANK_CHANNEL_PLAN, INDEX_NONE),
+    ('RF:AS923_CH_MODE', 'enum', ('AS920-923', 'AS923-925'),
+        RANK_CHANNEL_PLAN, INDEX_NONE),
+    ('RF:AS923_CH_GROUP', 'enum', ('AS_923-1', 'AS_923-2', 'AS_923-3'),
+        RANK_CHANNEL_PLAN, INDEX_NONE),
+    ('RF:CN470_CH_PLAN', 'enum', ('20M_A', '20M_B', '26M_A', '26M_B'),
+        RANK_CHANNEL_PLAN, INDEX_NONE),
+    ('RF:CH_GROUP', 'enum', CHANNEL_GROUPS, RANK_CHANNEL_PLAN, INDEX_NONE),
+    ('RF:CH_MASK_0', 'hex', 16, RANK_CHANNEL_PLAN, INDEX_NONE),
+    ('RF:CH_MASK_1', 'hex', 16, RANK_CHANNEL_PLAN, INDEX_NONE),
+    ('RF:CH_MASK_2', 'hex', 16, RANK_CHANNEL_PLAN, INDEX_NONE),
+    ('RF:CH_MASK_3', 'hex', 16, RANK_CHANNEL_PLAN, INDEX_NONE),
+    ('RF:CH_MASK_4', 'hex', 16, RANK_CHANNEL_PLAN, INDEX_NONE),
+    ('RF:CH_MASK_5', 'hex', 16, RANK_CHANNEL_PLAN, INDEX_NONE),
+    ('RF:AS923_FREQ_OFFSET', 'int', (-100, 100), RANK_GENERAL, INDEX_NONE),
+    ('RF:UL_CH', 'freq', None, RANK_GENERAL, INDEX_NONE),
+    ('RF:PING_FREQ', 'freq', None, RANK_GENERAL, INDEX_NONE),
+    ('RF:PING_DR', 'enum', DR_NAMES, RANK_GENERAL, INDEX_NONE),
+    ('RF:BEACON_FREQ', 'freq', None, RANK_GENERAL, INDEX_NONE),
+    ('RF:BEACON_DR', 'enum', DR_NAMES, RANK_GENERAL, INDEX_NONE),
+    ('RF:RX_GAIN', 'enum', ('HIGH', 'MEDIUM', 'LOW', 'LOWER'),
+        RANK_GENERAL, INDEX_NONE),
+
+    # Protocol
+    ('PROTOCOL:OPERATOR', 'enum', ('LoRaWAN', 'SKT'), RANK_REGION,
+        INDEX_NONE),
+    ('PROTOCOL:REGION', 'enum', REGIONS, RANK_REGION, INDEX_NONE),
+    ('PROTOCOL:PROTOCOL_VER', 'enum',
+        ('LoRaWAN1.0.2', 'LoRaWAN1.0.3', 'LoRaWAN1.0.4', 'LoRaWAN1.1'),
+        RANK_REGION, INDEX_NONE),
+    ('PROTOCOL:CLASS', 'enum', ('A', 'B', 'C'), RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:ACTIVATION', 'enum', ('OTAA', 'ABP'), RANK_KEYS,
+        INDEX_NONE),
+    ('PROTOCOL:SET_TEST_MODE', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:BEACON_TIME_OFFSET', 'int', (-1000, 1000), RANK_GENERAL,
+        INDEX_NONE),
+    ('PROTOCOL:APP_KEY', 'hex', 128, RANK_KEYS, INDEX_NONE),
+    ('PROTOCOL:APPS_KEY', 'hex', 128, RANK_KEYS, INDEX_NONE),
+    ('PROTOCOL:NWKS_KEY', 'hex', 128, RANK_KEYS, INDEX_NONE),
+    ('PROTOCOL:NWK_KEY', 'hex', 128, RANK_KEYS, INDEX_NONE),
+    ('PROTOCOL:FNWKS_IKEY', 'hex', 128, RANK_KEYS, INDEX_NONE),
+    ('PROTOCOL:SNWKS_IKEY', 'hex', 128, RANK_KEYS, INDEX_NONE),
+    ('PROTOCOL:NWKS_EKEY', 'hex', 128, RANK_KEYS, INDEX_NONE),
+    ('PROTOCOL:CHECK_EUI', 'enum', ('NO', 'YES'), RANK_KEYS, INDEX_NONE),
+    ('PROTOCOL:DEV_EUI', 'hex', 64, RANK_KEYS, INDEX_NONE),
+    ('PROTOCOL:APP_EUI', 'hex', 64, RANK_KEYS, INDEX_NONE),
+    ('PROTOCOL:JOIN_EUI', 'hex', 64, RANK_KEYS, INDEX_NONE),
+    ('PROTOCOL:DEV_ADDR', 'hex', 32, RANK_KEYS, INDEX_NONE),
+    ('PROTOCOL:NET_ID', 'int', (0, 127), RANK_KEYS, INDEX_NONE),
+    ('PROTOCOL:NWK_ID', 'hex', 7, RANK_KEYS, INDEX_NONE),
+    ('PROTOCOL:NET_ID_MSB', 'hex', 17, RANK_KEYS, INDEX_NONE),
+    ('PROTOCOL:NWK_ADDR', 'hex', 25, RANK_KEYS, INDEX_NONE),
+    ('PROTOCOL:RECEIVE_DELAY', 'int', (1, 10), RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:PERIODIC_UPLINK', 'enum',
+        ('NONE', 'LINK_CHECK_REQ', 'CONFIRMED_UP', 'UNCONFIRMED_UP',
+         'DL_COUNTER'), RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:INTERVAL', 'int', (3, 60), RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:UPDATE_FCNT', 'int', (0, 65535), RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:UPDATE_NFCNT', 'int', (0, 65535), RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:UPDATE_AFCNT', 'int', (0, 65535), RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:ADR', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:YEAR', 'int', (2000, 2100), RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:MONTH', 'int', (1, 12), RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:DAY', 'int', (1, 31), RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:HOUR', 'int', (1, 23), RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:MINUTE', 'int', (0, 59), RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:SECOND', 'int', (0, 59), RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:LINK_MARGIN', 'int', (0, 254), RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:GATEWAY_CNT', 'int', (0, 255), RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:BATTERY', 'int', (0, 255), RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:SNR_MARGIN', 'int', (-32, 31), RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:NETWORK', 'enum', ('PRIVATE', 'PUBLIC'), RANK_GENERAL,
+        INDEX_NONE),
+    ('PROTOCOL:DOWNLINK_SLOT', 'enum', ('RX1', 'RX2', 'RX1&RX2', 'PING'),
+        RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:MAC_RSP_FIELD', 'enum', ('PAYLOAD', 'FOPTS'), RANK_GENERAL,
+        INDEX_NONE),
+    ('PROTOCOL:MAC_RSP_SLOT', 'enum', ('RX1', 'RX2'), RANK_GENERAL,
+        INDEX_NONE),
+    ('PROTOCOL:UPLINK_DR', 'enum', DR_NAMES + OLD_DR_NAMES, RANK_GENERAL,
+        INDEX_NONE),
+    ('PROTOCOL:RX1_DR_OFFSET', 'int', (0, 7), RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:RX2_FREQ', 'freq', None, RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:RX2_DR', 'enum', DR_NAMES + OLD_DR_NAMES, RANK_GENERAL,
+        INDEX_NONE),
+    ('PROTOCOL:PING_PERIODICITY', 'int', (0, 7), RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:PING_TIME_OFFSET', 'int', (-1000, 1000), RANK_GENERAL,
+        INDEX_NONE),
+    ('PROTOCOL:LATITUDE', 'float', (-90, 90), RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:LONGITUDE', 'float', (-180, 180), RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:DUT_TYPE', 'enum', ('END_DEVICE', 'GATEWAY'), RANK_GENERAL,
+        INDEX_NONE),
+    ('PROTOCOL:MAC_FORMAT', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:FCNT', 'int', (0, 65535), RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:FCNT_MODE', 'enum', ('FIXED', 'INCREASING'), RANK_GENERAL,
+        INDEX_NONE),
+    ('PROTOCOL:ACK', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:ADR_ACK_REQ', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:FPENDING', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('PROTOCOL:PERIODIC_DOWNLINK', 'enum',
+        ('NONE', 'CONFIRMED_DOWN', 'UNCONFIRMED_DOWN'), RANK_GENERAL,
+        INDEX_NONE),
+    ('PROTOCOL:CLAA_MODE', 'enum', ('D', 'E'), RANK_GENERAL, INDEX_NONE),
+
+    # Link
+    ('LINK:MAC_CMD_TYPE', 'enum', ('UNCONFIRMED', 'CONFIRMED'),
+        RANK_GENERAL, INDEX_NONE),
+    ('LINK:MAC_ANS_TO', 'int', (1, 100), RANK_GENERAL, INDEX_NONE),
+    ('LINK:MAC_CMD_FIELD', 'enum', ('PAYLOAD', 'FOPTS'), RANK_GENERAL,
+        INDEX_NONE),
+    ('LINK:MIC_ERR_DISPLAY', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('LINK:NUM_OF_CMD', 'int', (1, 3), RANK_MAC_COUNT, INDEX_NONE),
+    ('LINK:INSTANT_MAC_CMD', 'enum', MAC_COMMANDS, RANK_MAC_SLOTS,
+        INDEX_MAC),
+    ('LINK:ADR_DR', 'enum', DR_NAMES + ('0', '1', '2', '3', '4', '5', '6',
+        '7'), RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:ADR_TXPOW', 'int', (0, 7), RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:ADR_CH_MASK', 'hex', 8, RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:ADR_CH_MASK2', 'hex', 8, RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:ADR_CH_MASK3', 'hex', 8, RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:ADR_MASK_CTRL', 'hex', 8, RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:ADR_MASK2_CTRL', 'hex', 8, RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:ADR_MASK3_CTRL', 'hex', 8, RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:ADR_NB_TRANS', 'int', (0, 15), RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:MAX_DUTY_CYCLE', 'int', (0, 15), RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:MAX_EIRP', 'enum', ('8', '10', '12', '13', '14', '16', '18',
+        '20', '21', '24', '26', '27', '29', '30', '33', '36'),
+        RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:UL_DWELL_TIME', 'enum', ('NO_LIMIT', '400ms'), RANK_MAC_PARAM,
+        INDEX_MAC),
+    ('LINK:DL_DWELL_TIME', 'enum', ('NO_LIMIT', '400ms'), RANK_MAC_PARAM,
+        INDEX_MAC),
+    ('LINK:NEW_CH_MODE', 'enum', ('CREATE', 'DELETE'), RANK_MAC_PARAM,
+        INDEX_MAC),
+    ('LINK:NEW_CH_INDEX', 'int', (0, 7), RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:NEW_CH_MAX_DR', 'int', (0, 7), RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:NEW_CH_MIN_DR', 'int', (0, 7), RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:DL_CH_INDEX', 'int', (0, 7), RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:DL_CH_FREQ', 'freq', None, RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:RX2_DR', 'enum', DR_NAMES, RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:RX2_FREQ', 'freq', None, RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:RECEIVE_DELAY', 'int', (1, 10), RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:RX1_DR_OFFSET', 'int', (0, 7), RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:REJOIN_DR', 'enum', DR_NAMES + OLD_DR_NAMES, RANK_MAC_PARAM,
+        INDEX_MAC),
+    ('LINK:REJOIN_TYPE', 'enum', ('TYPE_0', 'TYPE_2'), RANK_MAC_PARAM,
+        INDEX_MAC),
+    ('LINK:REJOIN_RETRY', 'int', (0, 7), RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:REJOIN_PERIOD', 'int', (0, 7), RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:REJOIN_MAX_TIME_N', 'int', (0, 15), RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:REJOIN_MAX_CNT_N', 'int', (0, 15), RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:ADR_LIMIT_EXP', 'int', (0, 15), RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:ADR_DELAY_EXP', 'int', (0, 15), RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:ECHO_PAYLOAD', 'hex', 250, RANK_MAC_PARAM, INDEX_MAC),
+    ('LINK:ECHO_LEN', 'int', (1, 242), RANK_MAC_PARAM, INDEX_OPTIONAL),
+    ('LINK:CW_TIMEOUT', 'int', (1, 255), RANK_MAC_PARAM, INDEX_OPTIONAL),
+    ('LINK:CW_FREQ', 'freq', None, RANK_MAC_PARAM, INDEX_OPTIONAL),
+    ('LINK:CW_POW', 'int', (0, 40), RANK_MAC_PARAM, INDEX_OPTIONAL),
+    ('LINK:BEACON_FREQ', 'freq', None, RANK_MAC_PARAM, INDEX_OPTIONAL),
+    ('LINK:PING_DR', 'enum', DR_NAMES, RANK_MAC_PARAM, INDEX_OPTIONAL),
+    ('LINK:PING_FREQ', 'freq', None, RANK_MAC_PARAM, INDEX_OPTIONAL),
+    ('LINK:BEACON_DR', 'enum', OLD_DR_NAMES, RANK_GENERAL, INDEX_NONE),
+    ('LINK:ADR_MORE_CH_MASK', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('LINK:ADR_CH_MASK_OPT_DR', 'int', (1, 128), RANK_GENERAL, INDEX_NONE),
+    ('LINK:PAYLOAD_TYPE', 'enum', PAYLOAD_TYPES, RANK_GENERAL, INDEX_NONE),
+    ('LINK:FPORT', 'int', (1, 255), RANK_GENERAL, INDEX_NONE),
+    ('LINK:PAYLOAD_SIZE', 'int', (1, 128), RANK_GENERAL, INDEX_NONE),
+    ('LINK:PAYLOAD', 'hex', 250, RANK_GENERAL, INDEX_NONE),
+    ('LINK:FOPTS_SIZE', 'int', (1, 15), RANK_GENERAL, INDEX_NONE),
+    ('LINK:FOPTS', 'hex', 15, RANK_GENERAL, INDEX_NONE),
+    ('LINK:MAC_INTERVAL', 'int', (5, 60), RANK_GENERAL, INDEX_NONE),
+    ('LINK:ABNORMAL', 'enum', ('OFF', 'MIC_ERR', 'NO_RSP', 'INVALID_CMD'),
+        RANK_GENERAL, INDEX_NONE),
+    ('LINK:MALFUNCTION', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('LINK:MIC_ERROR', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('LINK:MHDR_ERROR', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('LINK:XOR_MHDR', 'hex', 8, RANK_GENERAL, INDEX_NONE),
+    ('LINK:FHDR_ERROR', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('LINK:XOR_FHDR', 'hex', 56, RANK_GENERAL, INDEX_NONE),
+    ('LINK:TIME_DISPLAY', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('LINK:FCNT_DISPLAY', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('LINK:ADR_DISPLAY', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('LINK:ACK_DISPLAY', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('LINK:CLASS_B_DISPLAY', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('LINK:PORT_DISPLAY', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('LINK:MSG_TYPE_DISPLAY', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('LINK:POW_DISPLAY', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('LINK:DR_DISPLAY', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('LINK:DELAY_DISPLAY', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('LINK:ADRACKREQ_DISPLAY', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('LINK:FPENDING_DISPLAY', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('LINK:DWELL_DISPLAY', 'enum', OFF_ON, RANK_GENERAL, INDEX_NONE),
+    ('LINK:FRAG_INDEX', 'int', (0, 3), RANK_GENERAL, INDEX_NONE),
+    ('LINK:FRAG_SIZE', 'int', (1, 255), RANK_GENERAL, INDEX_NONE),
+    ('LINK:NB_FRAG', 'int', (1, 65535), RANK_GENERAL, INDEX_NONE),
+    ('LINK:FRAG_PADDING', 'int', (1, 255), RANK_GENERAL, INDEX_NONE),
+    ('LINK:FRAG_DESCRIPTOR', 'hex', 32, RANK_GENERAL, INDEX_NONE),
+    ('LINK:FRAG_ALGO', 'int', (0, 7), RANK_GENERAL, INDEX_NONE),
+    ('LINK:MC_KEY', 'hex', 128, RANK_GENERAL, INDEX_NONE),
+    ('LINK:MC_GROUP_ID', 'int', (0, 3), RANK_GENERAL, INDEX_NONE),
+    ('LINK:MC_ADDR', 'hex', 32, RANK_GENERAL, INDEX_NONE),
+    ('LINK:MC_FREQ', 'freq', None, RANK_GENERAL, INDEX_NONE),
+    ('LINK:MC_DR', 'enum', DR_NAMES, RANK_GENERAL, INDEX_NONE),
+    ('LINK:MC_OPTION', 'int', (0, 1), RANK_GENERAL, INDEX_NONE),
+    ('LINK:MC_INTERVAL', 'int', (1, 10000), RANK_GENERAL, INDEX_NONE),
+    ('LINK:APP_TIME_PERIOD', 'int', (0, 15), RANK_GENERAL, INDEX_NONE),
+    ('LINK:APP_TIME_NB_TRANS', 'int', (0, 7), RANK_GENERAL, INDEX_NONE),
+
+    # Power
+    ('POWER:SCALE', 'enum', ('AUTO', 'MANUAL'), RANK_GENERAL, INDEX_NONE),
+    ('POWER:MAX_Y', 'int', (-60, 40), RANK_GENERAL, INDEX_NONE),
+    ('POWER:MIN_Y', 'int', (-60, 40), RANK_GENERAL, INDEX_NONE),
+    ('POWER:MODE', 'enum', ('SYNC_TO_LINK', 'SCENARIO'), RANK_GENERAL,
+        INDEX_NONE),
+    ('POWER:SCENARIO', 'enum',
+        ('NORMAL_UL', 'CERTI_UL', 'CERTI_CW', 'CERTI_DL_CNT'),
+        RANK_GENERAL, INDEX_NONE),
+    ('POWER:TARGET_CH_MASK', 'int', (0, 255), RANK_GENERAL, INDEX_NONE),
+    ('POWER:TARGET_CH_MASK_OPT', 'int', (1, 128), RANK_GENERAL,
+        INDEX_NONE),
+    ('POWER:ADR_POWER', 'int', (1, 10), RANK_GENERAL, INDEX_NONE),
+    ('POWER:UL_DR', 'enum', DR_NAMES, RANK_GENERAL, INDEX_NONE),
+    ('POWER:PKT_NUM', 'int', (3, 100), RANK_GENERAL, INDEX_NONE),
+    ('POWER:CW_TIMEOUT', 'int', (5, 65535), RANK_GENERAL, INDEX_NONE),
+    ('POWER:CW_FREQ', 'int', (400, 510), RANK_GENERAL, INDEX_NONE),
+    ('POWER:CW_POW', 'int', (0, 40), RANK_GENERAL, INDEX_NONE),
+
+    # Sensitivity
+    ('SENSITIVITY:SCENARIO', 'enum', ('NORMAL_UL', 'CERTI_ECHO'),
+        RANK_GENERAL, INDEX_NONE),
+    ('SENSITIVITY:PACKET_NUM', 'int', (5, 1000), RANK_GENERAL, INDEX_NONE),
+    ('SENSITIVITY:START_POW', 'int', (-143, -10), RANK_GENERAL,
+        INDEX_NONE),
+    ('SENSITIVITY:NUM_POW', 'int', (1, 100), RANK_GENERAL, INDEX_NONE),
+    ('SENSITIVITY:STEP_POW', 'int', (1, 20), RANK_GENERAL, INDEX_NONE),
+    ('SENSITIVITY:TARGET_PER', 'float', (0, 0.999), RANK_GENERAL,
+        INDEX_NONE),
+    ('SENSITIVITY:DOWNLINK_SLOT', 'enum',
+        ('RX1', 'RX2', 'RX1&RX2', 'PING', 'RXC'), RANK_GENERAL, INDEX_NONE),
+    ('SENSITIVITY:TARGET_CH_MASK', 'hex', 8, RANK_GENERAL, INDEX_NONE),
+    ('SENSITIVITY:TARGET_CH_MASK_OPT', 'int', (1, 128), RANK_GENERAL,
+        INDEX_NONE),
+    ('SENSITIVITY:TARGET_DR', 'enum', DR_NAMES[:6], RANK_GENERAL,
+        INDEX_NONE),
+    ('SENSITIVITY:TARGET_DL_CH', 'freq', None, RANK_GENERAL,
+        INDEX_CHANNEL),
+    ('SENSITIVITY:PAYLOAD_TYPE', 'enum', PAYLOAD_TYPES, RANK_GENERAL,
+        INDEX_NONE),
+    ('SENSITIVITY:FPORT', 'int', (1, 255), RANK_GENERAL, INDEX_NONE),
+    ('SENSITIVITY:PAYLOAD_SIZE', 'int', (1, 128), RANK_GENERAL, INDEX_NONE),
+    ('SENSITIVITY:PAYLOAD', 'hex', 128, RANK_GENERAL, INDEX_NONE),
+
+    # Non-signaling TX
+    ('NST:TX:REPEAT_NUM', 'int', (0, 10000), RANK_GENERAL, INDEX_NONE),
+    ('NST:TX:MODULATION', 'enum', ('CW', 'FSK', 'LORA'), RANK_GENERAL,
+        INDEX_NONE),
+    ('NST:TX:INTERVAL', 'float', (0.01, 1000), RANK_GENERAL, INDEX_NONE),
+    ('NST:TX:PACKET_INTERVAL', 'float', (0.01, 1000), RANK_GENERAL,
+        INDEX_NONE),
+    ('NST:TX:BW', 'enum', ('125', '250', '500'), RANK_GENERAL, INDEX_NONE),
+    ('NST:TX:SF', 'enum', SPREADING_FACTORS, RANK_GENERAL, INDEX_NONE),
+    ('NST:TX:CR', 'enum', CODING_RATES, RANK_GENERAL, INDEX_NONE),
+    ('NST:TX:PREAMBLE_SIZE', 'int', (2, 12), RANK_GENERAL, INDEX_NONE),
+    ('NST:TX:PAYLOAD_TYPE', 'enum', PAYLOAD_TYPES, RANK_GENERAL,
+        INDEX_NONE),
+    ('NST:TX:PAYLOAD_SIZE', 'int', (8, 256), RANK_GENERAL, INDEX_NONE),
+    ('NST:TX:PAYLOAD', 'hex', 128, RANK_GENERAL, INDEX_NONE),
+    ('NST:TX:NETWORK', 'enum', ('PRIVATE', 'PUBLIC'), RANK_GENERAL,
+        INDEX_NONE),
+    ('NST:TX:FM_DEVIATION', 'int', (10, 100), RANK_GENERAL, INDEX_NONE),
+    ('NST:TX:DATA_RATE', 'int', (1, 128), RANK_GENERAL, INDEX_NONE),
+    ('NST:TX:SYNC_WORD_SIZE', 'int', (1, 8), RANK_GENERAL, INDEX_NONE),
+    ('NST:TX:SYNC_WORD', 'int', (1, 8), RANK_GENERAL, INDEX_NONE),
+    ('NST:TX:TX_POLARITY', 'enum', ('NORMAL', 'INVERSE'), RANK_GENERAL,
+        INDEX_NONE),
+    ('NST:TX:DUT_TYPE', 'enum', DUT_TYPES, RANK_GENERAL, INDEX_NONE),
+
+    # Non-signaling RX
+    ('NST:RX:MODE', 'enum', ('FSK', 'LORA'), RANK_GENERAL, INDEX_NONE),
+    ('NST:RX:BW', 'enum', ('125', '250', '500'), RANK_GENERAL, INDEX_NONE),
+    ('NST:RX:SF', 'enum', SPREADING_FACTORS + ('ANY',), RANK_GENERAL,
+        INDEX_NONE),
+    ('NST:RX:NETWORK', 'enum', ('PRIVATE', 'PUBLIC'), RANK_GENERAL,
+        INDEX_NONE),
+    ('NST:RX:PREAMBLE_SIZE', 'int', (2, 12), RANK_GENERAL, INDEX_NONE),
+    ('NST:RX:CR', 'enum', CODING_RATES, RANK_GENERAL, INDEX_NONE),
+    ('NST:RX:DATA_RATE', 'int', (1, 128), RANK_GENERAL, INDEX_NONE),
+    ('NST:RX:SYNC_WORD_SIZE', 'int', (1, 8), RANK_GENERAL, INDEX_NONE),
+    ('NST:RX:SYNC_WORD', 'int', (1, 8), RANK_GENERAL, INDEX_NONE),
+    ('NST:RX:TX_POLARITY', 'enum', ('NORMAL', 'INVERSE'), RANK_GENERAL,
+        INDEX_NONE),
+    ('NST:RX:DUT_TYPE', 'enum', DUT_TYPES, RANK_GENERAL, INDEX_NONE),
+
+    # Non-signaling MFG
+    ('NST:MFG:DUT_TYPE', 'enum', DUT_TYPES, RANK_GENERAL, INDEX_NONE),
+    ('NST:MFG:PER_CRITERIA', 'float', (0.001, 1), RANK_GENERAL,
+        INDEX_NONE),
+    ('NST:MFG:POW_CRITERIA_UPPER', 'int', (-150, 30), RANK_GENERAL,
+        INDEX_NONE),
+    ('NST:MFG:POW_CRITERIA_LOWER', 'int', (-150, 30), RANK_GENERAL,
+        INDEX_NONE),
+    ('NST:MFG:TIME_OUT', 'int', (1, 100), RANK_GENERAL, INDEX_NONE),
+    ('NST:MFG:MODE', 'enum', ('FSK', 'LORA'), RANK_GENERAL, INDEX_NONE),
+    ('NST:MFG:INTERVAL', 'float', (0.01, 1000), RANK_GENERAL, INDEX_NONE),
+    ('NST:MFG:PACKET_INTERVAL', 'float', (0.01, 1000), RANK_GENERAL,
+        INDEX_NONE),
+    ('NST:MFG:BW', 'enum', ('125', '250', '500'), RANK_GENERAL, INDEX_NONE),
+    ('NST:MFG:SF', 'enum', SPREADING_FACTORS + ('ANY',), RANK_GENERAL,
+        INDEX_NONE),
+    ('NST:MFG:CR', 'enum', CODING_RATES, RANK_GENERAL, INDEX_NONE),
+    ('NST:MFG:PAYLOAD_SIZE', 'int', (0, 250), RANK_GENERAL, INDEX_NONE),
+    ('NST:MFG:PAYLOAD', 'hex', 128, RANK_GENERAL, INDEX_NONE),
+    ('NST:MFG:PAYLOAD_TYPE', 'enum', PAYLOAD_TYPES, RANK_GENERAL,
+        INDEX_NONE),
+    ('NST:MFG:PREAMBLE_SIZE', 'int', (2, 12), RANK_GENERAL, INDEX_NONE),
+    ('NST:MFG:REPEAT_NUM', 'int', (0, 10000), RANK_GENERAL, INDEX_NONE),
+    ('NST:MFG:NETWORK', 'enum', ('PRIVATE', 'PUBLIC'), RANK_GENERAL,
+        INDEX_NONE),
+    ('NST:MFG:FM_DEVIATION', 'int', (10, 100), RANK_GENERAL, INDEX_NONE),
+    ('NST:MFG:DATA_RATE', 'int', (1, 128), RANK_GENERAL, INDEX_NONE),
+    ('NST:MFG:SYNC_WORD_SIZE', 'int', (1, 8), RANK_GENERAL, INDEX_NONE),
+    ('NST:MFG:SYNC_WORD', 'int', (1, 8), RANK_GENERAL, INDEX_NONE),
+    ('NST:MFG:TX_POLARITY', 'enum', ('NORMAL', 'INVERSE'), RANK_GENERAL,
+        INDEX_NONE),
+    ('NST:MFG:RX_POLARITY', 'enum', ('NORMAL', 'INVERSE'), RANK_GENERAL,
+        INDEX_NONE),
+
+    # System
+    ('SYSTEM:REF_CLK', 'enum', ('INT', 'EXT'), RANK_GENERAL, INDEX_NONE),
+    )
+
+
+# Parameters which can be set but have no getter
+WRITE_ONLY_PATHS = (
+    'LINK:FRAG_INDEX', 'LINK:FRAG_SIZE', 'LINK:NB_FRAG',
+    'LINK:FRAG_PADDING', 'LINK:FRAG_DESCRIPTOR', 'LINK:FRAG_ALGO',
+    'LINK:MC_KEY', 'LINK:MC_GROUP_ID', 'LINK:MC_ADDR', 'LINK:MC_FREQ',
+    'LINK:MC_DR', 'LINK:MC_OPTION', 'LINK:MC_INTERVAL',
+    'LINK:APP_TIME_PERIOD', 'LINK:APP_TIME_NB_TRANS')
+
+# Format of the getter answer per kind; the tester answers an enum as
+# written. Other float and hex parameters are answered in a format not
+# known here.
+KIND_FORMATS = {
+    'int': '{:d}',
+    'freq': '{:.6f}',
+    }
+
+# Getter answers which differ from the format of their kind
+ANSWER_FORMATS = {
+    'RF:TX_POW': '{:.1f}',
+    'RF:PATH_LOSS': '{:.1f}',
+    'RF:FREQ_OFFSET': '{:.1f}',
+    'RF:AS923_FREQ_OFFSET': '{:.4f}',
+    'RF:CH_MASK_0': '0x{:02X}',
+    'RF:CH_MASK_1': '0x{:02X}',
+    'RF:CH_MASK_2': '0x{:02X}',
+    'RF:CH_MASK_3': '0x{:02X}',
+    'RF:CH_MASK_4': '0x{:02X}',
+    'RF:CH_MASK_5': '0x{:02X}',
+    'PROTOCOL:NET_ID': '0x{:06X}',
+    'PROTOCOL:LATITUDE': '{:.6f}',
+    'PROTOCOL:LONGITUDE': '{:.6f}',
+    'PROTOCOL:APP_KEY': '0x{:032x}',
+    'PROTOCOL:APPS_KEY': '0x{:032x}',
+    'PROTOCOL:NWKS_KEY': '0x{:032x}',
+    'PROTOCOL:NWK_KEY': '0x{:032x}',
+    'PROTOCOL:FNWKS_IKEY': '0x{:032x}',
+    'PROTOCOL:SNWKS_IKEY': '0x{:032x}',
+    'PROTOCOL:NWKS_EKEY': '0x{:032x}',
+    'PROTOCOL:DEV_EUI': '0x{:016x}',
+    'PROTOCOL:APP_EUI': '0x{:016x}',
+    'PROTOCOL:JOIN_EUI': '0x{:016x}',
+    'PROTOCOL:DEV_ADDR': '0x{:08X}',
+    'LINK:ADR_CH_MASK': '0x{:02X}',
+    'LINK:XOR_MHDR': '0x{:02X}',
+    'LINK:XOR_FHDR': '0x{:014X}',
+    'LINK:CW_FREQ': '{:.4f}',
+    'POWER:TARGET_CH_MASK': '0x{:02X}',
+    'SENSITIVITY:START_POW': '{:.1f}',
+    'SENSITIVITY:STEP_POW': '{:.1f}',
+    'SENSITIVITY:TARGET_PER': '{:.3f}',
+    'NST:TX:INTERVAL': '{:.3f}',
+    'NST:TX:PACKET_INTERVAL': '{:.3f}',
+    'NST:MFG:INTERVAL': '{:.3f}',
+    'NST:MFG:PACKET_INTERVAL': '{:.3f}',
+    }
+
+# Enumeration values the tester answers under another name
+ANSWER_ALIASES = {
+    'PROTOCOL:REGION': {'AU_921': 'AU_915', 'KR_922': 'KR_920',
+                        'IN_866': 'IN_865'},
+    }
+
+# Read-only parameters: (path, kind, index)
+#
+# kind tells how the answer is decoded, see cRWCDecoder
+#
+# READ:LINK:MSG? and READ:INFO_MSG? are left out, reading them removes
+# the message from the tester queue
+STATUS_TABLE = (
+    ('SYSTEM:SW_VERSION', 'str', INDEX_NONE),
+    ('SYSTEM:SERIAL_NUM', 'str', INDEX_NONE),
+    ('SYSTEM:OPTION_GWT', 'bool', INDEX_NONE),
+    ('SYSTEM:OPTION_EDT', 'bool', INDEX_NONE),
+    ('SYSTEM:OPTION_NST', 'bool', INDEX_NONE),
+    ('SYSTEM:OPTION_CERTI_EU', 'bool', INDEX_NONE),
+    ('SYSTEM:OPTION_CERTI_SKT', 'bool', INDEX_NONE),
+    ('SYSTEM:OPTION_CERTI_US', 'bool', INDEX_NONE),
+    ('SYSTEM:OPTION_CERTI_AS', 'bool', INDEX_NONE),
+    ('SYSTEM:OPTION_CERTI_KR', 'bool', INDEX_NONE),
+    ('SYSTEM:IP_TYPE', 'enum', INDEX_NONE),
+    ('SYSTEM:IP_ADDR', 'str', INDEX_NONE),
+    ('RF:MEASURED_FREQ', 'float', INDEX_NONE),
+    ('RF:MEASURED_FREQ_MAX', 'float', INDEX_NONE),
+    ('RF:MEASURED_FREQ_AVG', 'float', INDEX_NONE),
+    ('RF:MEASURED_FREQ_MIN', 'float', INDEX_NONE),
+    ('RF:DL_CH', 'str', INDEX_NONE),
+    ('PROTOCOL:REAL_KEY', 'hex', INDEX_NONE),
+    ('PROTOCOL:ACTIVATION_STATUS', 'enum', INDEX_NONE),
+    ('PROTOCOL:UL_DWELL_TIME', 'enum', INDEX_NONE),
+    ('PROTOCOL:DL_DWELL_TIME', 'enum', INDEX_NONE),
+    ('LINK:STATUS', 'enum', INDEX_NONE),
+    ('LINK:ACTIVATION_STATUS', 'enum', INDEX_NONE),
+    ('LINK:MAC_SEND_STATUS', 'enum', INDEX_NONE),
+    ('LINK:MAC_SENDL_RESULT', 'str', INDEX_MAC),
+    ('LINK:DUTY_CYCLE', 'float', INDEX_NONE),
+    ('LINK:FRAG_PROGRESS', 'float', INDEX_NONE),
+    ('LINK:FUOTA_FILE_LEN', 'int', INDEX_NONE),
+    ('LINK:FUOTA_FILE_NAME', 'str', INDEX_NONE),
+    ('POWER:ALL:NUM', 'float', INDEX_NONE),
+    ('POWER:ALL:MAX', 'float', INDEX_NONE),
+    ('POWER:ALL:AVG', 'float', INDEX_NONE),
+    ('POWER:ALL:MIN', 'float', INDEX_NONE),
+    ('POWER:RX2:NUM', 'float', INDEX_NONE),
+    ('POWER:RX2:MAX', 'float', INDEX_NONE),
+    ('POWER:RX2:AVG', 'float', INDEX_NONE),
+    ('POWER:RX2:MIN', 'float', INDEX_NONE),
+    ('SENSITIVITY:STOP_POW', 'float', INDEX_NONE),
+    ('SENSITIVITY:STATUS', 'enum', INDEX_NONE),
+    ('SENSITIVITY:PROGRESS', 'float', INDEX_NONE),
+    ('SENSITIVITY:LEVEL', 'float', INDEX_NONE),
+    ('SENSITIVITY:PER', 'float', INDEX_NONE),
+    ('SENSITIVITY:RX2_FREQ', 'float', INDEX_NONE),
+    ('NST:TX:STATUS', 'enum', INDEX_NONE),
+    ('NST:RX:POW_NUM', 'int', INDEX_NONE),
+    ('NST:RX:POW_MAX', 'float', INDEX_NONE),
+    ('NST:RX:POW_AVG', 'float', INDEX_NONE),
+    ('NST:RX:POW_MIN', 'float', INDEX_NONE),
+    ('NST:RX:CW_POW', 'float', INDEX_NONE),
+    ('NST:RX:CW_FREQ', 'float', INDEX_NONE),
+    ('NST:MFG:PER', 'float', INDEX_NONE),
+    ('NST:MFG:POW', 'float', INDEX_NONE),
+    ('NST:MFG:STATUS', 'enum', INDEX_NONE),
+    ('NST:MFG:DUT_INFO', 'str', INDEX_NONE),
+    )
+
+SUBSYSTEMS = ('SYSTEM', 'RF', 'PROTOCOL', 'LINK', 'POWER', 'SENSITIVITY',
+              'NST')
+
+# Highest MAC command number and the channels read by a snapshot
+MAC_INDEXES = ('1', '2', '3')
+CHANNEL_INDEXES = ('0', '1', '2', '3', '4', '5', '6', '7')
+
+
+class RwcConfigError(Exception):
+    '''
+    .. class:: RwcConfigError
+
+    Raised when a configuration has invalid entries; errors holds the
+    description of every problem found
+
+    '''
+
+    def __init__(self, errors):
+        Exception.__init__(self, 'Invalid configuration: {}'
+                           .format('; '.join(errors)))
+        self.errors = list(errors)
+
+
+class RwcParam:
+    '''
+    .. class:: RwcParam
+
+    One configurable parameter of the tester
+
+    '''
+    __slots__ = ('path', 'kind', 'domain', 'rank', 'index')
+
+    def __init__(self, path, kind, domain, rank, index):
+        '''
+        Class constructor stores one PARAM_TABLE row
+
+        :param path: command path, e.g. 'PROTOCOL:REGION'
+        :param kind: 'enum', 'int', 'float', 'hex' or 'freq'
+        :param domain: allowed values, (min, max) range or bit width
+        :param rank: apply order (RANK_*)
+        :param index: index argument (INDEX_*)
+
+        '''
+        self.path = path
+        self.kind = kind
+        self.domain = domain
+        self.rank = rank
+        self.index = index
+
+    def format_value(self, value):
+        '''
+        Validate a value and convert it to the form sent to the tester
+
+        :param value: parameter value; strings and numbers are accepted
+
+        :return: value string for the CONF command
+
+        '''
+        try:
+            if self.kind == 'enum':
+                cmdValue = str(value)
+                if cmdValue in self.domain:
+                    return cmdValue
+            elif self.kind == 'int':
+                number = float(value)
+                cmdValue = int(number)
+                if cmdValue == number and self.in_range(cmdValue):
+                    return str(cmdValue)
+            elif self.kind == 'freq':
+                number = float(value)
+                if self.in_range(number):
+                    if number == int(number):
+                        return str(int(number))
+                    return str(number)
+            elif self.kind == 'float':
+                cmdValue = float(value)
+                if self.in_range(cmdValue):
+                    return str(cmdValue)
+            elif self.kind == 'hex':
+                if isinstance(value, str):
+                    cmdValue = int(value, 16)
+                else:
+                    cmdValue = int(value)
+                if cmdValue >= 0 and cmdValue <= 2**self.domain - 1:
+                    return hex(cmdValue)
+        except (TypeError, ValueError):
+            pass
+        raise Exception('Invalid parameter received for {}: {}'
+                        .format(self.path, value))
+
+    def in_range(self, number):
+        '''
+        Check a number against the range of an int, float or freq
+        parameter
+
+        :param number: value to check
+
+        :return: True when inside the range
+
+        '''
+        if self.kind == 'freq':
+            ranges = FREQ_BANDS
+        else:
+            ranges = (self.domain,)
+        for low, high in ranges:
+            if number >= low and number <= high:
+                return True
+        return False
+
+
+PARAMS = dict((row[0], RwcParam(*row)) for row in PARAM_TABLE)
+
+# Getter path -> setting path
+SETTING_PATHS = dict((query, path) for path, query in QUERY_ALIASES.items())
+
+PARAM_ORDER = dict((row[0], position)
+                   for position, row in enumerate(PARAM_TABLE))
+
+# Parameters whose change resets other parameters on the tester
+RESET_TRIGGERS = tuple(DEPENDENT_PATHS)
+
+
+def split_key(key):
+    '''
+    Split a parameter key into the parameter and its index
+
+    :param key: parameter path with optional index, e.g. 'LINK:ADR_DR 1'
+
+    :return: tuple of (RwcParam, index string or None)
+
+    '''
+    fields = str(key).split()
+    if not fields or fields[0] not in PARAMS:
+        raise Exception('Unknown parameter: {}'.format(key))
+    param = PARAMS[fields[0]]
+    args = fields[1:]
+
+    if len(args) > 1:
+        raise Exception('Invalid parameter index: {}'.format(key))
+    if param.index == INDEX_NONE and args:
+        raise Exception('Parameter takes no index: {}'.format(key))
+    if param.index in (INDEX_MAC, INDEX_CHANNEL) and not args:
+        raise Exception('Parameter index missing: {}'.format(key))
+    if args:
+        if param.index == INDEX_CHANNEL:
+            low, high = (0, 95)
+        else:
+            low, high = (1, 3)
+        if not args[0].isdigit() or not low <= int(args[0]) <= high:
+            raise Exception('Invalid parameter index: {}'.format(key))
+        return (param, str(int(args[0])))
+    return (param, None)
+
+
+def command_key(key):
+    '''
+    Return the key a parameter has in the shadow state and in query
+    commands: the getter path with the index, if any
+
+    :param key: parameter key, e.g. 'NST:TX:MODULATION'
+
+    :return: getter key, e.g. 'NST:TX:MODE'
+
+    '''
+    param, index = split_key(key)
+    path = QUERY_ALIASES.get(param.path, param.path)
+    return ' '.join([path] + ([index] if index else []))
+
+
+def answer_value(key, value):
+    '''
+    Convert the value of a setting to the answer its getter gives,
+    e.g. '870' of RF:FREQ to '870.000000'
+
+    :param key: getter key (path and index), e.g. 'RF:FREQ'
+    :param value: value string of the setting command
+
+    :return: value in the format of the tester; None when the
+             parameter or its answer format is unknown
+
+    '''
+    path = key.split(' ')[0]
+    param = PARAMS.get(SETTING_PATHS.get(path, path))
+    if param is None:
+        return None
+    if param.kind == 'enum':
+        return ANSWER_ALIASES.get(path, {}).get(value, value)
+
+    answerFormat = ANSWER_FORMATS.get(path, KIND_FORMATS.get(param.kind))
+    if answerFormat is None:
+        return None
+    try:
+        if param.kind == 'hex' or value.lower().startswith('0x'):
+            number = int(value, 16)
+        else:
+            number = float(value)
+            if param.kind == 'int':
+                number = int(number)
+        return answerFormat.format(number)
+    except (TypeError, ValueError):
+        return None
+
+
+def set_command(key, value):
+    '''
+    Build the setting command of a parameter
+
+    :param key: parameter path with optional index
+    :param value: parameter value
+
+    :return: RWC5020A remote command
+
+    '''
+    param, index = split_key(key)
+    cmdValue = param.format_value(value)
+    if index is None:
+        return 'CONF:' + param.path + ' ' + cmdValue + '\n'
+    return 'CONF:' + param.path + ' ' + index + ' ' + cmdValue + '\n'
+
+
+def stage_order(key):
+    '''
+    Sort key of a parameter in a bulk configuration. Parameters whose
+    change resets others (mode, region, channel plan, ...) get a stage
+    of their own, the others are grouped per rank.
+
+    :param key: parameter path with optional index
+
+    :return: tuple of (rank, stage, position, index)
+
+    '''
+    param, index = split_key(key)
+    position = PARAM_ORDER[param.path]
+    if param.path in RESET_TRIGGERS:
+        stage = position
+    else:
+        stage = len(PARAM_ORDER)
+    return (param.rank, stage, position, int(index or 0))
+
+
+def check_values(config):
+    '''
+    Check every key and value of a configuration against the parameter
+    table, without talking to the tester
+
+    :param config: dictionary of parameter key and value
+
+    :return: list of error descriptions; empty when valid
+
+    '''
+    errors = []
+    for key, value in config.items():
+        try:
+            param, index = split_key(key)
+            param.format_value(value)
+        except Exception as err:
+            errors.append(str(err))
+    return errors
+
+
+def is_readable(key):
+    '''
+    Check whether the current value of a parameter can be read back
+    and compared
+
+    :param key: parameter key (path and index)
+
+    :return: False for write-only and volatile parameters
+
+    '''
+    if key.split(' ')[0] in WRITE_ONLY_PATHS:
+        return False
+    return not is_volatile(key)
+
+
+def subsystem_of(path):
+    '''
+    Return the subsystem a command path belongs to
+
+    :param path: command path, e.g. 'RF:TX_POW'
+
+    :return: subsystem name, one of SUBSYSTEMS
+
+    '''
+    head = path.split(':')[0]
+    if head in SUBSYSTEMS:
+        return head
+    return 'SYSTEM'
+
+
+def query_keys(subsystems = None):
+    '''
+    List the keys of every parameter which can be read, setting and
+    read-only ones, of the given subsystems
+
+    :param subsystems: names from SUBSYSTEMS; None for all
+
+    :return: list of parameter keys (path and index)
+
+    '''
+    if subsystems is None:
+        subsystems = SUBSYSTEMS
+    else:
+        subsystems = [name.upper() for name in subsystems]
+        for name in subsystems:
+            if name not in SUBSYSTEMS:
+                raise Exception('Invalid subsystem received: {}'
+                                .format(name))
+
+    rows = [(param.path, param.index) for param in PARAMS.values()
+            if param.path not in WRITE_ONLY_PATHS]
+    rows.extend((path, index) for path, kind, index in STATUS_TABLE)
+
+    keys = []
+    for path, index in rows:
+        if subsystem_of(path) not in subsystems:
+            continue
+        path = QUERY_ALIASES.get(path, path)
+        if index == INDEX_NONE:
+            keys.append(path)
+        elif index == INDEX_CHANNEL:
+            keys.extend(path + ' ' + chnum for chnum in CHANNEL_INDEXES)
+        else:
+            keys.extend(path + ' ' + macnum for macnum in MAC_INDEXES)
+    return keys
@@ -0,0 +1,251 @@
+##############################################################################
+#
+# Module: cRWCPcap.py
+#
+# Description:
+#     Streaming export of link messages to pcap files for Wireshark
+#
+# Copyright notice:
+#     This file copyright (c) 2026 by
+#
+#         MCCI Corporation
+#         3520 Krums Corners Road
+#         Ithaca, NY  14850
+#
+#     See accompanying LICENSE file for copyright and license information.
+#
+# Author:
+#     Sivaprakash Veluthambi, MCCI   October, 2026
+#
+##############################################################################
+
+# Built-in imports
+import re
+import struct
+import threading
+import time
+
+# Lib imports
+from rwclib.cRWCTrace import RwcTraceReader
+
+# Link type of LoRaTap encapsulated LoRaWAN frames
+LINKTYPE_LORATAP = 270
+
+PCAP_HEADER = struct.Struct('<IHHiIII')
+PCAP_MAGIC = 0xa1b2c3d4
+PCAP_SNAPLEN = 65535
+
+# Record header: seconds, microseconds, saved and original length
+RECORD_HEADER = struct.Struct('<IIII')
+
+# LoRaTap version 0: version, padding, length, frequency (Hz),
+# bandwidth (125 kHz units), spreading factor, packet, max and current
+# RSSI, SNR, sync word
+LORATAP_HEADER = struct.Struct('>BBHIBBBBBbB')
+LORATAP_SYNC_WORD = 0x34
+RSSI_OFFSET = 139
+
+# MHDR, DevAddr, FCtrl, FCnt of a data frame
+FRAME_HEADER = struct.Struct('<BIBH')
+
+# The MIC is not shown by the link analyzer
+MIC_UNKNOWN = b'\0\0\0\0'
+
+# LoRaWAN MType of the message types of the link analyzer
+MESSAGE_TYPES = {
+    'JoinReq': 0, 'Join-request': 0,
+    'JoinAccept': 1, 'Join-accept': 1,
+    'UnconfUp': 2, 'UnconfDown': 3,
+    'ConfUp': 4, 'ConfDown': 5,
+    'RejoinReq': 6, 'Rejoin-request': 6,
+    'Proprietary': 7,
+    }
+
+MODULATION = re.compile(r'SF(\d+)BW(\d+)')
+
+
+def _modulation(dr):
+    match = MODULATION.search(str(dr or ''))
+    if match is None:
+        return (0, 0)
+    return (int(match.group(1)), int(match.group(2)) // 125)
+
+
+def _dev_addr(text):
+    try:
+        return int(str(text), 16) & 0xffffffff
+    except ValueError:
+        return 0
+
+
+def _payload(text):
+    try:
+        return bytes.fromhex(str(text).replace(' ', ''))
+    except ValueError:
+        return b''
+
+
+def _flag(value):
+    return value == 'ON'
+
+
+class RwcPcapWriter:
+    '''
+    .. class:: RwcPcapWriter
+
+    Writes link messages one at a time to a pcap file of LoRaTap
+    encapsulated LoRaWAN frames, which Wireshark dissects. The link
+    analyzer shows decoded fields only, so each frame is rebuilt from
+    them: MHDR, DevAddr, FCtrl flags, FCnt, FPort and payload; the
+    MAC commands (names only) are not encoded and the MIC is zero.
+
+    It takes the place of a trace in the link message collector
+    (start_collector(trace = ...)), since both append(record,
+    timestamp).
+
+    '''
+
+    def __init__(self, filename):
+        '''
+        Class constructor creates the file and writes its header
+
+        :param filename: pcap file name
+
+        '''
+        self.filename = filename
+        self.lock = threading.Lock()
+        self.count = 0
+        # the converted DR, DevAddr and MType texts; few distinct
+        # values in a capture
+        self.modulations = {}
+        self.addresses = {}
+        self.mtypes = {}
+
+        self.pcapFile = open(filename, 'wb', buffering = 1 << 20)
+        self.pcapFile.write(PCAP_HEADER.pack(
+            PCAP_MAGIC, 2, 4, 0, 0, PCAP_SNAPLEN, LINKTYPE_LORATAP))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def append(self, record, timestamp = None):
+        '''
+        Write a link message as one packet
+
+        :param record: RwcLinkMsg object
+        :param timestamp: receive time; None for now
+
+        :return: None
+
+        '''
+        if timestamp is None:
+            timestamp = time.time()
+        data = self.encode(record)
+        seconds = int(timestamp)
+        with self.lock:
+            self.pcapFile.write(RECORD_HEADER.pack(
+                seconds, int((timestamp - seconds) * 1000000),
+                len(data), len(data)) + data)
+            self.count += 1
+
+    def extend(self, records):
+        '''
+        Write link messages
+
+        :param records: iterable of (receive time, RwcLinkMsg object),
+                        e.g. a RwcTraceReader
+
+        :return: None
+
+        '''
+        for timestamp, record in records:
+            self.append(record, timestamp)
+
+    def encode(self, record):
+        '''
+        Build the LoRaTap header and LoRaWAN frame of a link message
+
+        :param record: RwcLinkMsg object
+
+        :return: bytes of the packet
+
+        '''
+        modulation = self.modulations.get(record.dr)
+        if modulation is None:
+            modulation = self.modulations[record.dr] = _modulation(record.dr)
+        uplink = record.is_uplink()
+        rssi = 0
+        if record.power is not None:
+            rssi = min(255, max(0, int(round(record.power + RSSI_OFFSET))))
+        freq = record.freq
+        try:
+            freq = int(round(float(freq) * 1000000))
+        except (TypeError, ValueError):
+            freq = 0
+        header = LORATAP_HEADER.pack(
+            0, 0, LORATAP_HEADER.size, freq, modulation[1], modulation[0],
+            rssi, rssi, rssi, 0, LORATAP_SYNC_WORD)
+
+        mtypeKey = (record.msg_type, uplink)
+        mtype = self.mtypes.get(mtypeKey)
+        if mtype is None:
+            mtype = MESSAGE_TYPES.get(record.msg_type, 2 if uplink else 3)
+            self.mtypes[mtypeKey] = mtype
+        payload = _payload(record.payload) if record.payload else b''
+        if mtype in (0, 1, 6, 7):
+            return header + bytes((mtype << 5,)) + payload + MIC_UNKNOWN
+
+        address = self.addresses.get(record.dev_addr)
+        if address is None:
+            address = self.addresses[record.dev_addr] = \
+                _dev_addr(record.dev_addr)
+        fctrl = ((_flag(record.adr) << 7) | (_flag(record.ack) << 5))
+        if uplink:
+            fctrl |= ((_flag(record.adr_ack_req) << 6)
+                      | (_flag(record.class_b) << 4))
+        else:
+            fctrl |= _flag(record.fpending) << 4
+        fcnt = record.fcnt if isinstance(record.fcnt, int) else 0
+        frame = FRAME_HEADER.pack(mtype << 5, address, fctrl, fcnt & 0xffff)
+        if isinstance(record.port, int):
+            frame += bytes((record.port & 0xff,)) + payload
+        return header + frame + MIC_UNKNOWN
+
+    def close(self):
+        '''
+        Flush and close the pcap file
+
+        :Parameters: N/A
+
+        :return: None
+
+        '''
+        with self.lock:
+            self.pcapFile.close()
+
+
+def export_trace(trace, filename, t0 = None, t1 = None):
+    '''
+    Export a trace file to pcap, one message at a time
+
+    :param trace: trace file name or RwcTraceReader, see cRWCTrace
+    :param filename: pcap file name
+    :param t0: earliest receive time; None from the first message
+    :param t1: latest receive time; None up to the last message
+
+    :return: number of messages written
+
+    '''
+    reader = trace
+    if not isinstance(trace, RwcTraceReader):
+        reader = RwcTraceReader(trace)
+    try:
+        with RwcPcapWriter(filename) as writer:
+            writer.extend(reader.records(t0, t1))
+            return writer.count
+    finally:
+        if reader is not trace:
+            reader.close()
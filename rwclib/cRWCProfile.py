@@ -0,0 +1,174 @@
+##############################################################################
+#
+# Module: cRWCProfile.py
+#
+# Description:
+#     Tester profiles loaded from JSON or TOML files
+#
+# Copyright notice:
+#     This file copyright (c) 2026 by
+#
+#         MCCI Corporation
+#         3520 Krums Corners Road
+#         Ithaca, NY  14850
+#
+#     See accompanying LICENSE file for copyright and license information.
+#
+# Author:
+#     Sivaprakash Veluthambi, MCCI   October, 2026
+#
+##############################################################################
+
+# Built-in imports
+import json
+import os
+
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+# Lib imports
+from rwclib import cRWCValidator
+from rwclib.cRWCParamTable import RwcConfigError
+
+# Profile sections and the command path prefix of their parameters
+PROFILE_GROUPS = {
+    'tester': '',
+    'rf': 'RF:',
+    'protocol': 'PROTOCOL:',
+    'link': 'LINK:',
+    'power': 'POWER:',
+    'sensitivity': 'SENSITIVITY:',
+    'nst': 'NST:',
+    }
+
+# Top level entries which are not parameters
+PROFILE_INFO = ('name', 'description')
+
+# Parsed profiles, keyed by file name, modification time and size
+_profileCache = {}
+
+
+class RwcProfile:
+    '''
+    .. class:: RwcProfile
+
+    A validated tester profile. The configuration is a dictionary of
+    parameter key and value as accepted by RWCTesterApi.apply().
+
+    '''
+    __slots__ = ('name', 'description', 'config')
+
+    def __init__(self, name, description, config):
+        '''
+        Class constructor stores the profile
+
+        :param name: profile name
+        :param description: free text
+        :param config: dictionary of parameter key and value
+
+        '''
+        self.name = name
+        self.description = description
+        self.config = config
+
+    def __repr__(self):
+        return 'RwcProfile({!r}, {} parameters)'.format(self.name,
+                                                       len(self.config))
+
+
+def parse_profile(data, name = None):
+    '''
+    Convert the content of a profile file to a validated profile.
+
+    A profile has one section per parameter group; the keys of a
+    section are command paths without the group prefix, nested
+    sections are joined with ':'. The 'tester' section takes full
+    paths (TESTER_MODE, REMOTE:LOCK, SYSTEM:REF_CLK). E.g.
+
+    {"name": "EDT IN866",
+     "tester": {"TESTER_MODE": "EDT"},
+     "protocol": {"REGION": "IN_866", "APP_KEY": "0x01"},
+     "link": {"NUM_OF_CMD": 2, "INSTANT_MAC_CMD 1": "DEV_STATUS"},
+     "nst": {"TX": {"BW": 125}}}
+
+    Every value and the rules between them are checked before the
+    profile is returned, all problems are reported together.
+
+    :param data: dictionary read from a JSON or TOML file
+    :param name: profile name if the data has none
+
+    :return: RwcProfile object
+
+    '''
+    if not isinstance(data, dict):
+        raise RwcConfigError(['Profile must be a table of groups'])
+
+    errors = []
+    config = {}
+    for group, section in data.items():
+        if group in PROFILE_INFO:
+            continue
+        if group.lower() not in PROFILE_GROUPS:
+            errors.append('Unknown profile group: {}'.format(group))
+            continue
+        if not isinstance(section, dict):
+            errors.append('Profile group must be a table: {}'
+                          .format(group))
+            continue
+        _flatten(PROFILE_GROUPS[group.lower()], section, config)
+
+    errors.extend(cRWCValidator.validate_config(config))
+    if errors:
+        raise RwcConfigError(errors)
+
+    return RwcProfile(data.get('name', name), data.get('description'),
+                      config)
+
+
+def load_profile(filename):
+    '''
+    Read and validate a profile file (.json or .toml). A file is only
+    parsed again when it changed on disk.
+
+    :param filename: path of the profile file
+
+    :return: RwcProfile object
+
+    '''
+    filename = os.path.abspath(filename)
+    stat = os.stat(filename)
+    cacheKey = (filename, stat.st_mtime_ns, stat.st_size)
+    profile = _profileCache.get(cacheKey)
+    if profile is not None:
+        return profile
+
+    if filename.lower().endswith('.toml'):
+        if tomllib is None:
+            raise Exception('TOML profiles need Python 3.11 or tomli')
+        with open(filename, 'rb') as profileFile:
+            data = tomllib.load(profileFile)
+    else:
+        with open(filename, 'r') as profileFile:
+            data = json.load(profileFile)
+
+    name = os.path.splitext(os.path.basename(filename))[0]
+    profile = parse_profile(data, name)
+
+    for key in [k for k in _profileCache if k[0] == filename]:
+        del _profileCache[key]
+    _profileCache[cacheKey] = profile
+    return profile
+
+
+def _flatten(prefix, section, config):
+    for key, value in section.items():
+        path = prefix + str(key).strip().upper()
+        if isinstance(value, dict):
+            _flatten(path + ':', value, config)
+        else:
+            config[path] = value
@@ -0,0 +1,327 @@
+##############################################################################
+#
+# Module: cRWCRegion.py
+#
+# Description:
+#     Regional channel plans, data rates and RX2 defaults of LoRaWAN
+#
+# Copyright notice:
+#     This file copyright (c) 2026 by
+#
+#         MCCI Corporation
+#         3520 Krums Corners Road
+#         Ithaca, NY  14850
+#
+#     See accompanying LICENSE file for copyright and license information.
+#
+# Author:
+#     Sivaprakash Veluthambi, MCCI   October, 2026
+#
+##############################################################################
+
+# Built-in imports
+import array
+
+# Lib imports
+from rwclib import cRWCParamTable
+
+# Data rates of the LoRaWAN regional parameters, (spreading factor,
+# bandwidth in kHz); spreading factor 0 is the FSK data rate. None is
+# a data rate not defined in the region.
+EU_DATA_RATES = (
+    (12, 125), (11, 125), (10, 125), (9, 125), (8, 125), (7, 125),
+    (7, 250), (0, 50))
+
+US_DATA_RATES = (
+    (10, 125), (9, 125), (8, 125), (7, 125), (8, 500), None, None, None,
+    (12, 500), (11, 500), (10, 500), (9, 500), (8, 500), (7, 500))
+
+AU_DATA_RATES = (
+    (12, 125), (11, 125), (10, 125), (9, 125), (8, 125), (7, 125),
+    (8, 500), None, (12, 500), (11, 500), (10, 500), (9, 500), (8, 500),
+    (7, 500))
+
+CN_DATA_RATES = EU_DATA_RATES[:6]
+
+KR_DATA_RATES = EU_DATA_RATES[:6]
+
+IN_DATA_RATES = EU_DATA_RATES[:6] + (None, (0, 50))
+
+# Channel plans selected on the tester: AS923 channel modes and groups,
+# CN470 channel plans
+AS923_CHANNEL_MODES = cRWCParamTable.PARAMS['RF:AS923_CH_MODE'].domain
+AS923_CHANNEL_GROUPS = cRWCParamTable.PARAMS['RF:AS923_CH_GROUP'].domain
+CN470_CHANNEL_PLANS = cRWCParamTable.PARAMS['RF:CN470_CH_PLAN'].domain
+
+# Channel groups of the tester (RF:CH_GROUP)
+US_CHANNEL_GROUPS = cRWCParamTable.CHANNEL_GROUPS[:8]
+CN_CHANNEL_GROUPS = cRWCParamTable.CHANNEL_GROUPS[8:]
+
+
+class RwcRegion:
+    '''
+    .. class:: RwcRegion
+
+    Regional parameters of one LoRaWAN region: band, uplink and
+    downlink channel frequencies, channel groups, data rates and RX2
+    defaults. Channel frequencies are kept in arrays indexed by the
+    channel number and a frequency table gives the channel of a
+    frequency, so every lookup is a single index.
+
+    Regions with a dynamic channel plan only list their default
+    channels; the other channels are set on the tester (RF:UL_CH).
+
+    '''
+    __slots__ = ('name', 'band', 'uplink', 'downlink', 'groups',
+                 'data_rates', 'max_dr', 'rx2_freq', 'rx2_dr', 'channels')
+
+    def __init__(self, name, band, uplink, downlink, groups, data_rates,
+                 max_dr, rx2_freq, rx2_dr):
+        '''
+        Class constructor stores the regional parameters
+
+        :param name: region name, e.g. 'EU_868'
+        :param band: (lowest, highest) frequency in MHz
+        :param uplink: uplink channel frequencies in MHz
+        :param downlink: RX1 downlink frequencies in MHz; the downlink
+                         channel of uplink channel n is n modulo their
+                         number
+        :param groups: channel groups of the tester; empty if none
+        :param data_rates: (spreading factor, bandwidth) of each data
+                           rate
+        :param max_dr: highest uplink data rate the tester takes
+        :param rx2_freq: default RX2 frequency in MHz
+        :param rx2_dr: default RX2 data rate
+
+        '''
+        setField = object.__setattr__
+        setField(self, 'name', name)
+        setField(self, 'band', band)
+        setField(self, 'uplink', array.array('d', uplink))
+        setField(self, 'downlink', array.array('d', downlink))
+        setField(self, 'groups', tuple(groups))
+        setField(self, 'data_rates', tuple(data_rates))
+        setField(self, 'max_dr', max_dr)
+        setField(self, 'rx2_freq', rx2_freq)
+        setField(self, 'rx2_dr', rx2_dr)
+        setField(self, 'channels', dict(
+            (freq_key(freq), channel) for channel, freq in enumerate(uplink)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('RwcRegion is read-only')
+
+    def __repr__(self):
+        return 'RwcRegion({}, {} channels)'.format(self.name,
+                                                   len(self.uplink))
+
+    def in_band(self, freq):
+        '''
+        Check whether a frequency lies in the band of the region
+
+        :param freq: frequency in MHz
+
+        :return: True when inside the band
+
+        '''
+        return self.band[0] <= float(freq) <= self.band[1]
+
+    def is_channel(self, channel):
+        '''
+        Check whether a channel number exists in the region
+
+        :param channel: uplink channel number
+
+        :return: True when the channel has a known frequency
+
+        '''
+        return 0 <= int(channel) < len(self.uplink)
+
+    def channel_frequency(self, channel):
+        '''
+        Return the frequency of an uplink channel
+
+        :param channel: uplink channel number, e.g. 0 ~ 71 (US/AU)
+
+        :return: frequency in MHz
+
+        '''
+        if not self.is_channel(channel):
+            raise Exception('Invalid channel received for {}: {}'
+                            .format(self.name, channel))
+        return self.uplink[int(channel)]
+
+    def channel_of(self, freq):
+        '''
+        Return the uplink channel of a frequency
+
+        :param freq: frequency in MHz
+
+        :return: channel number; None if no channel uses the frequency
+
+        '''
+        return self.channels.get(freq_key(freq))
+
+    def downlink_frequency(self, channel):
+        '''
+        Return the RX1 downlink frequency of an uplink channel
+
+        :param channel: uplink channel number
+
+        :return: frequency in MHz
+
+        '''
+        if not self.is_channel(channel):
+            raise Exception('Invalid channel received for {}: {}'
+                            .format(self.name, channel))
+        return self.downlink[int(channel) % len(self.downlink)]
+
+    def group_of(self, channel):
+        '''
+        Return the channel group holding an uplink channel
+
+        :param channel: uplink channel number
+
+        :return: channel group name, e.g. '08~15,65'; None if the
+                 region has no channel groups
+
+        '''
+        if not self.groups:
+            return None
+        channel = int(channel)
+        if not self.is_channel(channel):
+            raise Exception('Invalid channel received for {}: {}'
+                            .format(self.name, channel))
+        if channel >= 8 * len(self.groups):
+            return self.groups[channel - 8 * len(self.groups)]
+        return self.groups[channel // 8]
+
+    def data_rate(self, dr):
+        '''
+        Return the modulation of a data rate
+
+        :param dr: data rate number
+
+        :return: (spreading factor, bandwidth in kHz); spreading factor
+                 0 is FSK
+
+        '''
+        dr = int(dr)
+        if not 0 <= dr < len(self.data_rates) \
+                or self.data_rates[dr] is None:
+            raise Exception('Invalid data rate received for {}: {}'
+                            .format(self.name, dr))
+        return self.data_rates[dr]
+
+    def dr_of(self, sf, bw):
+        '''
+        Return the uplink data rate of a modulation
+
+        :param sf: spreading factor; 0 for FSK
+        :param bw: bandwidth in kHz
+
+        :return: data rate number; None if not an uplink data rate
+
+        '''
+        try:
+            dr = self.data_rates.index((int(sf), int(bw)))
+        except ValueError:
+            return None
+        if dr > self.max_dr:
+            return None
+        return dr
+
+
+def freq_key(freq):
+    '''
+    Return the key of a frequency in the channel tables, in units of
+    100 Hz so two spellings of the same frequency match
+
+    :param freq: frequency in MHz
+
+    :return: integer key
+
+    '''
+    return int(round(float(freq) * 10000))
+
+
+def _grid(first, step, count):
+    return [round(first + step * index, 4) for index in range(count)]
+
+
+REGIONS = dict((region.name, region) for region in (
+    RwcRegion('EU_868', (863, 870), (868.1, 868.3, 868.5),
+              (868.1, 868.3, 868.5), (), EU_DATA_RATES, 7, 869.525, 0),
+    RwcRegion('EU_433', (433, 435), (433.175, 433.375, 433.575),
+              (433.175, 433.375, 433.575), (), EU_DATA_RATES, 7, 434.665,
+              0),
+    RwcRegion('US_915', (902, 928),
+              _grid(902.3, 0.2, 64) + _grid(903.0, 1.6, 8),
+              _grid(923.3, 0.6, 8), US_CHANNEL_GROUPS, US_DATA_RATES, 4,
+              923.3, 8),
+    RwcRegion('AU_921', (915, 928),
+              _grid(915.2, 0.2, 64) + _grid(915.9, 1.6, 8),
+              _grid(923.3, 0.6, 8), US_CHANNEL_GROUPS, AU_DATA_RATES, 6,
+              923.3, 8),
+    RwcRegion('CN_470', (470, 510), _grid(470.3, 0.2, 96),
+              _grid(500.3, 0.2, 48), CN_CHANNEL_GROUPS, CN_DATA_RATES, 5,
+              505.3, 0),
+    RwcRegion('KR_922', (920, 924), (922.1, 922.3, 922.5),
+              (922.1, 922.3, 922.5), (), KR_DATA_RATES, 5, 921.9, 0),
+    RwcRegion('AS_923', (915, 928), (923.2, 923.4), (923.2, 923.4), (),
+              EU_DATA_RATES, 7, 923.2, 2),
+    RwcRegion('IN_866', (865, 867), (865.0625, 865.4025, 865.985),
+              (865.0625, 865.4025, 865.985), (), IN_DATA_RATES, 7, 866.55,
+              2),
+    RwcRegion('RU_864', (864, 870), (868.9, 869.1), (868.9, 869.1), (),
+              EU_DATA_RATES, 7, 869.1, 0),
+    ))
+
+
+def get_region(name):
+    '''
+    Return the regional parameters of a region
+
+    :param name: region name, one of cRWCParamTable.REGIONS
+
+    :return: RwcRegion object
+
+    '''
+    region = REGIONS.get(str(name).strip())
+    if region is None:
+        raise Exception('Invalid region received: {}'.format(name))
+    return region
+
+
+def in_tester_band(freq):
+    '''
+    Check whether the tester can tune to a frequency, whatever the 
+    region
+
+    :param freq: frequency in MHz
+
+    :return: True when inside one of cRWCParamTable.FREQ_BANDS
+
+    '''
+    for low, high in cRWCParamTable.FREQ_BANDS:
+        if low <= float(freq) <= high:
+            return True
+    return False
+
+
+def channel_group(name, first):
+    '''
+    Return the channel group of the tester starting at a channel
+
+    :param name: region name (US_915, AU_921 or CN_470)
+    :param first: first channel of the group, 0, 8, 16, ...
+
+    :return: channel group name, e.g. '08~15,65'
+
+    '''
+    region = REGIONS.get(str(name).strip())
+    if region is None or not region.groups:
+        raise Exception('Invalid Channel Group Region received.')
+    first = int(first)
+    if first % 8 or not 0 <= first // 8 < len(region.groups):
+        raise Exception('Invalid Channel Group Parameter received.')
+    return region.groups[first // 8]
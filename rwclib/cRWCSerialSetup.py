@@ -20,16 +20,40 @@
 ##############################################################################
 
 # Built-in imports
+import functools
 import logging
 import os
 import re
 import socket
 import sys
+import threading
 import time
 
 # Lib imports
 import serial
 
+from rwclib.cRWCDecoder import decode
+from rwclib.cRWCShadowState import parse_command
+from rwclib.cRWCTransaction import is_deferred
+
+
+def port_locked(method):
+    '''
+    Decorator holding the port lock of the tester while a method runs,
+    so commands of another thread (see start_collector) never get in 
+    between a command and its response
+
+    :param method: method writing to and reading from the port
+
+    :return: wrapped method
+
+    '''
+    @functools.wraps(method)
+    def locked(self, *args, **kwargs):
+        with self.port_lock:
+            return method(self, *args, **kwargs)
+    return locked
+
 class RwcSerialSetup:
     '''
     This is a class file consists common attributes to access by 
@@ -63,6 +87,28 @@ class RwcSerialSetup:
         self.udpport = port
         self.udpipaddr = addr
 
+        # Optional shadow of the tester configuration (see enable_shadow)
+        self.shadow = None
+
+        # Number of commands in flight during transceive_batch
+        self.batch_window = 16
+
+        # Return query responses as RwcValue objects (see enable_typed)
+        self.typed = False
+
+        # Open RwcTransaction, commands are queued (see transaction)
+        self.txn = None
+
+        # Cached RwcIdentity of the tester (see load_identity)
+        self.identity = None
+
+        # Held while a command or a batch is on the port
+        self.port_lock = threading.RLock()
+
+        # Running RwcMsgCollector of the link messages (see 
+        # start_collector)
+        self.collector = None
+
         self.log_dir = os.path.join(os.path.normpath(
             os.getcwd() + os.sep + os.pardir), 'logs')
         self.log_fname = os.path.join(self.log_dir, 'rwcapi.log')
@@ -113,7 +159,52 @@ class RwcSerialSetup:
     
     def transceive(self, rwccmd, sec = 0):
         '''
-        Write the commands to the tester and return received response
+        Write the commands to the tester and return received response.
+        Identity queries held by the identity cache and queries already
+        held by the shadow state are answered from memory, everything 
+        else goes to the tester. In typed mode the
+        response of a query is decoded to an RwcValue object.
+
+        Inside a transaction settings and other commands are queued and
+        QUEUED is returned; queries of a queued setting get its value.
+
+        :param rwccmd: RWC5020A remote commands
+        
+        '''
+        result = None
+        if self.txn is not None:
+            if is_deferred(rwccmd):
+                return self.txn.queue(rwccmd)
+            result = self.txn.lookup(rwccmd)
+
+        if self.identity and result is None:
+            result = self.identity.lookup(rwccmd)
+            if result is not None:
+                self.logger.info('Identity Response: {} {}'
+                                 .format(rwccmd.strip(), result))
+
+        if self.shadow and result is None:
+            result = self.shadow.lookup(rwccmd)
+            if result is None and self.shadow.is_redundant(rwccmd):
+                result = 'ACK'
+            if result is not None:
+                self.logger.info('Shadow Response: {} {}'
+                                 .format(rwccmd.strip(), result))
+
+        if result is None:
+            result = self.transceive_port(rwccmd, sec)
+            if self.shadow:
+                self.shadow.update(rwccmd, result)
+
+        if self.typed:
+            return decode(rwccmd, result)
+        return result
+
+    @port_locked
+    def transceive_port(self, rwccmd, sec = 0):
+        '''
+        Write the commands to the serial or udp port and return 
+        received response
 
         :param rwccmd: RWC5020A remote commands
         
@@ -148,6 +239,121 @@ class RwcSerialSetup:
                     'Error Send/Receive in IP Communication: {}'
                     .format(err))
         
+        return self.decode_response(readResult)
+
+    def transceive_batch(self, rwccmds):
+        '''
+        Write a list of commands to the tester and return the list of 
+        received responses, in the same order. Commands are pipelined,
+        up to batch_window of them are in flight before the first 
+        response is read, so a batch costs about one round trip.
+
+        Queries held by the shadow state are answered from memory until
+        the first setting in the batch; later queries go to the tester
+        so they see the effect of the settings before them. Settings 
+        found redundant by the shadow state are acknowledged without 
+        being sent.
+
+        :param rwccmds: list of RWC5020A remote commands
+
+        :return: list of responses; None for unanswered commands
+
+        '''
+        results = [None] * len(rwccmds)
+        pending = []
+        changed = False
+
+        for index, rwccmd in enumerate(rwccmds):
+            if self.shadow and not changed:
+                result = self.shadow.lookup(rwccmd)
+                if result is None and self.shadow.is_redundant(rwccmd):
+                    result = 'ACK'
+                if result is not None:
+                    self.logger.info('Shadow Response: {} {}'
+                                     .format(rwccmd.strip(), result))
+                    results[index] = result
+                    continue
+            if parse_command(rwccmd)[0] != 'QUERY':
+                changed = True
+            pending.append(index)
+
+        responses = self.transceive_port_batch(
+            [rwccmds[index] for index in pending])
+
+        for index, result in zip(pending, responses):
+            results[index] = result
+            if self.shadow:
+                self.shadow.update(rwccmds[index], result)
+        return results
+
+    @port_locked
+    def transceive_port_batch(self, rwccmds):
+        '''
+        Write a list of commands to the serial or udp port without 
+        waiting for each response. The batch stops at the first 
+        command left unanswered, the remaining commands get None.
+
+        :param rwccmds: list of RWC5020A remote commands
+
+        :return: list of responses
+
+        '''
+        results = []
+        sent = 0
+
+        if rwccmds and not self.udpipaddr:
+            if not self.myport.in_waiting is 0:
+                self.myport.reset_input_buffer()
+
+            try:
+                while len(results) < len(rwccmds):
+                    while (sent < len(rwccmds) 
+                            and sent - len(results) < self.batch_window):
+                        self.myport.write(rwccmds[sent].encode())
+                        self.logger.info('Tx Command: {}'
+                                         .format(rwccmds[sent]))
+                        sent += 1
+                    readResult = self.myport.readline()
+                    self.logger.info('Rx Response: {}'.format(readResult))
+                    if not readResult:
+                        break
+                    results.append(self.decode_response(readResult))
+            except Exception as err:
+                self.logger.error(
+                    'Error Send/Receive in Serial Communication: {}'
+                    .format(err))
+
+        if rwccmds and self.udpport and self.udpipaddr:
+            try:
+                while len(results) < len(rwccmds):
+                    while (sent < len(rwccmds) 
+                            and sent - len(results) < self.batch_window):
+                        self.clientsock.sendto(
+                            rwccmds[sent].encode(),
+                            (self.udpipaddr, self.udpport))
+                        self.logger.info('Tx Command: {}'
+                                         .format(rwccmds[sent]))
+                        sent += 1
+                    readResult, ip = self.clientsock.recvfrom(1024)
+                    self.logger.info('Rx Response: {}'.format(readResult))
+                    results.append(self.decode_response(readResult))
+            except Exception as err:
+                self.logger.error(
+                    'Error Send/Receive in IP Communication: {}'
+                    .format(err))
+
+        results.extend([None] * (len(rwccmds) - len(results)))
+        return results
+
+    def decode_response(self, readResult):
+        '''
+        Convert the raw response of the tester to a string
+
+        :param readResult: bytes received from the tester
+
+        :return: response without line terminators; None if empty
+
+        '''
         if readResult:
             result = readResult.decode()
             result = re.sub('\r|\n', '', result)
@@ -163,6 +369,9 @@ class RwcSerialSetup:
         :Parameters: N/A
 
         '''
+        if self.collector is not None:
+            self.collector.stop()
+
         if not self.udpipaddr:
             if self.myport.is_open:
                 self.myport.close()
@@ -0,0 +1,458 @@
+##############################################################################
+#
+# Module: cRWCShadowState.py
+#
+# Description:
+#     Write-through shadow of the RWC5020x tester configuration
+#
+# Copyright notice:
+#     This file copyright (c) 2026 by
+#
+#         MCCI Corporation
+#         3520 Krums Corners Road
+#         Ithaca, NY  14850
+#
+#     See accompanying LICENSE file for copyright and license information.
+#
+# Author:
+#     Sivaprakash Veluthambi, MCCI   October, 2026
+#
+##############################################################################
+
+# Built-in imports
+import time
+
+# Commands which make every remembered value meaningless
+RESET_COMMANDS = ('*RST', '*RECALL', '*FACTORY_RST', '*REBOOT')
+
+# Setting paths whose getter uses a different path
+QUERY_ALIASES = {
+    'NST:TX:MODULATION': 'NST:TX:MODE',
+    }
+
+# Getters which the tester answers with the CONF verb
+CONF_QUERY_PATHS = (
+    'NST:TX:FM_DEVIATION',
+    'NST:TX:DATA_RATE',
+    'NST:TX:SYNC_WORD_SIZE',
+    'NST:TX:SYNC_WORD',
+    'NST:TX:TX_POLARITY',
+    'NST:TX:DUT_TYPE',
+    'NST:RX:DATA_RATE',
+    'NST:RX:SYNC_WORD_SIZE',
+    'NST:RX:SYNC_WORD',
+    'NST:RX:TX_POLARITY',
+    'NST:RX:DUT_TYPE',
+    'NST:MFG:DUT_TYPE',
+    'NST:MFG:FM_DEVIATION',
+    'NST:MFG:DATA_RATE',
+    'NST:MFG:SYNC_WORD_SIZE',
+    'NST:MFG:SYNC_WORD',
+    'NST:MFG:TX_POLARITY',
+    'NST:MFG:RX_POLARITY',
+    )
+
+# Parameters which change on their own or are never read back.
+# A trailing ':' matches the whole subtree.
+VOLATILE_PATHS = (
+    'MOVE_SCREEN',
+    'PROTOCOL:UPDATE_FCNT',
+    'PROTOCOL:UPDATE_NFCNT',
+    'PROTOCOL:UPDATE_AFCNT',
+    'PROTOCOL:YEAR',
+    'PROTOCOL:MONTH',
+    'PROTOCOL:DAY',
+    'PROTOCOL:HOUR',
+    'PROTOCOL:MINUTE',
+    'PROTOCOL:SECOND',
+    'PROTOCOL:FCNT',
+    'PROTOCOL:ACTIVATION_STATUS',
+    'PROTOCOL:REAL_KEY',
+    'RF:MEASURED_FREQ',
+    'RF:MEASURED_FREQ_',
+    'RF:DL_CH',
+    'LINK:STATUS',
+    'LINK:MSG',
+    'LINK:MAC_SEND',
+    'LINK:DUTY_CYCLE',
+    'LINK:FUOTA_',
+    'LINK:FRAG_PROGRESS',
+    'POWER:ALL:',
+    'POWER:SF',
+    'POWER:CH_',
+    'POWER:RX2:',
+    'SENSITIVITY:STOP_POW',
+    'SENSITIVITY:STATUS',
+    'SENSITIVITY:PROGRESS',
+    'SENSITIVITY:LEVEL',
+    'SENSITIVITY:PER',
+    'NST:RX:POW_',
+    'NST:RX:CW_',
+    'NST:MFG:PER',
+    'NST:MFG:POW',
+    'NST:MFG:STATUS',
+    'NST:MFG:DUT_INFO',
+    'INFO_MSG',
+    )
+
+# A change of the key clears the listed parameters as well
+DEPENDENT_PATHS = {
+    'TESTER_MODE': ('RF:', 'PROTOCOL:', 'LINK:', 'POWER:', 'SENSITIVITY:',
+                    'NST:'),
+    'PROTOCOL:REGION': ('RF:', 'PROTOCOL:OPERATOR', 'PROTOCOL:UPLINK_DR',
+                        'PROTOCOL:RX1_DR_OFFSET', 'PROTOCOL:RX2_',
+                        'PROTOCOL:PING_', 'PROTOCOL:DOWNLINK_SLOT',
+                        'PROTOCOL:CLAA_MODE', 'LINK:', 'POWER:',
+                        'SENSITIVITY:'),
+    'PROTOCOL:OPERATOR': ('PROTOCOL:REGION', 'RF:', 'LINK:'),
+    'PROTOCOL:PROTOCOL_VER': ('PROTOCOL:', 'LINK:'),
+    'RF:AS923_CH_GROUP': ('RF:', 'PROTOCOL:RX2_', 'PROTOCOL:PING_'),
+    'RF:AS923_CH_MODE': ('RF:', 'PROTOCOL:RX2_', 'PROTOCOL:PING_'),
+    'RF:CN470_CH_PLAN': ('RF:', 'PROTOCOL:RX2_', 'PROTOCOL:PING_'),
+    'RF:CH_GROUP': ('RF:CH_MASK', 'RF:UL_CH'),
+    'LINK:NUM_OF_CMD': ('LINK:',),
+    }
+
+
+def parse_command(rwccmd):
+    '''
+    Split a remote command into its verb, parameter key and value
+
+    The key of a setting is its path followed by any index arguments,
+    which is the same key its getter produces, e.g. both
+    'CONF:LINK:ADR_DR 1 DR0_SF12BW125' and 'READ:LINK:ADR_DR? 1' give
+    'LINK:ADR_DR 1'.
+
+    :param rwccmd: RWC5020A remote command
+
+    :return: tuple of (verb, key, value); verb is 'SET', 'QUERY',
+             'EXEC' or the common command (e.g. '*RST')
+
+    '''
+    cmdText = rwccmd.strip()
+    if cmdText.startswith('*'):
+        return (cmdText.split(' ')[0].upper(), None, None)
+
+    verb, sep, body = cmdText.partition(':')
+    if not sep:
+        return (None, None, None)
+
+    fields = body.split()
+    if not fields:
+        return (None, None, None)
+    path = fields[0]
+    args = fields[1:]
+
+    if verb == 'EXEC':
+        return ('EXEC', path, None)
+
+    if path.endswith('?'):
+        path = path[:-1]
+        return ('QUERY', ' '.join([path] + args), None)
+
+    if verb == 'CONF' and args:
+        path = QUERY_ALIASES.get(path, path)
+        return ('SET', ' '.join([path] + args[:-1]), args[-1])
+
+    return (None, None, None)
+
+
+def query_command(key):
+    '''
+    Build the getter command of a parameter key
+
+    :param key: parameter key (path and index), e.g. 'LINK:ADR_DR 1'
+
+    :return: RWC5020A remote command, e.g. 'READ:LINK:ADR_DR? 1\\n'
+
+    '''
+    fields = key.split(' ')
+    path = fields[0]
+    verb = 'CONF' if path in CONF_QUERY_PATHS else 'READ'
+    return ' '.join([verb + ':' + path + '?'] + fields[1:]) + '\n'
+
+
+def values_match(first, second):
+    '''
+    Compare two parameter values the way the tester treats them:
+    numbers by value, hex strings by value, enums without case
+
+    :param first: first value string
+    :param second: second value string
+
+    :return: True when both values are equivalent
+
+    '''
+    if first is None or second is None:
+        return first is second
+
+    first = str(first).strip()
+    second = str(second).strip()
+    if first.upper() == second.upper():
+        return True
+
+    try:
+        return float(first) == float(second)
+    except ValueError:
+        pass
+    try:
+        return int(first, 16) == int(second, 16)
+    except ValueError:
+        return False
+
+
+def is_volatile(key):
+    '''
+    Check whether a parameter changes on its own and must never be 
+    served from memory
+
+    :param key: parameter key (path and index)
+
+    :return: True for volatile parameters
+
+    '''
+    return path_matches(key, VOLATILE_PATHS)
+
+
+def path_matches(key, prefixes):
+    '''
+    Check whether a parameter key lies under one of the given paths
+
+    :param key: parameter key (path and index)
+    :param prefixes: paths; an entry ending in ':' or '_' matches the
+                     whole subtree
+
+    :return: True when the key matches
+
+    '''
+    for prefix in prefixes:
+        if key == prefix or key.startswith(prefix + ' '):
+            return True
+        if prefix.endswith((':', '_')) and key.startswith(prefix):
+            return True
+    return False
+
+
+class RwcShadowState:
+    '''
+    .. class:: RwcShadowState
+
+    In-memory copy of the tester configuration. Every acknowledged
+    setting is recorded and its getter is answered from memory. The
+    formatter converts the value written to the format of the tester
+    (e.g. '870.000000' rather than the '870' written); a setting it
+    cannot convert is served only once read back from the tester.
+    Commands that change the tester behind our back (reset, recall,
+    mode or region changes) drop the affected entries. verify_shadow()
+    of the tester API compares the shadow against the hardware.
+
+    With a ttl set, a setting of the value already held is not sent
+    again while the value is younger than ttl seconds; suppressed 
+    counts the settings skipped.
+
+    '''
+
+    def __init__(self, formatter = None):
+        '''
+        Class constructor creates an empty shadow
+
+        :param formatter: function of (key, value) returning the value
+                          as the tester answers its getter, None when
+                          unknown; see cRWCParamTable.answer_value
+
+        '''
+        self.formatter = formatter
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.ttl = None
+        self.suppressed = 0
+
+    def lookup(self, rwccmd):
+        '''
+        Answer a query command from memory
+
+        :param rwccmd: RWC5020A remote command
+
+        :return: the remembered value; None when the command has to
+                 go to the tester
+
+        '''
+        verb, key, value = parse_command(rwccmd)
+        if verb != 'QUERY':
+            return None
+
+        entry = self.entries.get(key)
+        if entry is None or not entry[2]:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[0]
+
+    def is_redundant(self, rwccmd):
+        '''
+        Check whether a setting can be skipped: the same value was 
+        acknowledged by (or read from) the tester less than ttl seconds
+        ago. Every skipped setting is counted in suppressed.
+
+        :param rwccmd: RWC5020A remote command
+
+        :return: True when the command need not be sent
+
+        '''
+        if self.ttl is None:
+            return False
+
+        verb, key, value = parse_command(rwccmd)
+        if verb != 'SET':
+            return False
+
+        entry = self.entries.get(key)
+        if entry is None or time.time() - entry[1] > self.ttl:
+            return False
+        if not values_match(entry[0], value):
+            return False
+        self.suppressed += 1
+        return True
+
+    def update(self, rwccmd, response):
+        '''
+        Record the outcome of a command sent to the tester
+
+        :param rwccmd: RWC5020A remote command
+        :param response: response received from the tester
+
+        :return: None
+
+        '''
+        verb, key, value = parse_command(rwccmd)
+
+        if verb in RESET_COMMANDS:
+            if response != 'NAK':
+                self.clear()
+            return
+
+        if verb == 'QUERY':
+            # read-back of a setting: keep the value as the tester
+            # formats it
+            if key in self.entries and response not in (None, 'NAK'):
+                self.entries[key] = (response, time.time(), True)
+            return
+
+        if verb != 'SET':
+            return
+
+        if response != 'ACK':
+            self.entries.pop(key, None)
+            return
+
+        previous = self.entries.get(key)
+        if previous is None or not values_match(previous[0], value):
+            self.invalidate(DEPENDENT_PATHS.get(key, ()))
+        elif previous[2] and self.answer(key, value) is None:
+            # same value as read back; keep the format of the tester
+            self.entries[key] = (previous[0], time.time(), True)
+            return
+
+        self.seed(key, value, False)
+
+    def seed(self, key, value, confirmed = True):
+        '''
+        Record a value known to be held by the tester
+
+        :param key: parameter key (path and index)
+        :param value: parameter value
+        :param confirmed: True for a value read back from hardware;
+                          False for a value as written, which is
+                          converted to the format of the tester
+
+        :return: None
+
+        '''
+        if self.is_volatile(key):
+            return
+        if not confirmed:
+            answer = self.answer(key, value)
+            if answer is not None:
+                value = answer
+                confirmed = True
+        self.entries[key] = (value, time.time(), confirmed)
+
+    def answer(self, key, value):
+        '''
+        Convert a value as written to the answer of its getter
+
+        :param key: parameter key (path and index)
+        :param value: value string of the setting
+
+        :return: value in the format of the tester; None when unknown
+
+        '''
+        if self.formatter is None:
+            return None
+        return self.formatter(key, value)
+
+    def get(self, key):
+        '''
+        Return the remembered value of a parameter key
+
+        :param key: parameter key (path and index)
+
+        :return: remembered value; None if unknown
+
+        '''
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        return entry[0]
+
+    def values(self):
+        '''
+        Return every remembered value
+
+        :Parameters: N/A
+
+        :return: dictionary of parameter key and value
+
+        '''
+        return dict((key, entry[0]) for key, entry in self.entries.items())
+
+    def invalidate(self, prefixes):
+        '''
+        Forget every parameter under the given paths
+
+        :param prefixes: paths; an entry ending in ':' or '_' matches
+                         the whole subtree
+
+        :return: number of entries dropped
+
+        '''
+        if not prefixes:
+            return 0
+        dropped = [key for key in self.entries
+                   if path_matches(key, prefixes)]
+        for key in dropped:
+            del self.entries[key]
+        return len(dropped)
+
+    def clear(self):
+        '''
+        Forget everything
+
+        :Parameters: N/A
+
+        :return: None
+
+        '''
+        self.entries.clear()
+
+    def is_volatile(self, key):
+        '''
+        Check whether a parameter must never be served from memory
+
+        :param key: parameter key (path and index)
+
+        :return: True for volatile parameters
+
+        '''
+        return is_volatile(key)
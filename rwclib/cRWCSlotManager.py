@@ -0,0 +1,260 @@
+##############################################################################
+#
+# Module: cRWCSlotManager.py
+#
+# Description:
+#     Keeps tester profiles in the *SAVE/*RECALL memory slots
+#
+# Copyright notice:
+#     This file copyright (c) 2026 by
+#
+#         MCCI Corporation
+#         3520 Krums Corners Road
+#         Ithaca, NY  14850
+#
+#     See accompanying LICENSE file for copyright and license information.
+#
+# Author:
+#     Sivaprakash Veluthambi, MCCI   October, 2026
+#
+##############################################################################
+
+# Built-in imports
+import collections
+import hashlib
+import json
+import os
+
+# Lib imports
+from rwclib import cRWCParamTable
+from rwclib import cRWCProfile
+from rwclib.cRWCProfile import RwcProfile
+
+# Memory slots of the tester
+SLOT_INDEXES = tuple(range(10))
+
+
+def fingerprint(config):
+    '''
+    Compute a fingerprint of a configuration. Equivalent values give
+    the same fingerprint, e.g. 0x01 and '0x01', or 870 and '870.0'.
+
+    :param config: dictionary of parameter key and value
+
+    :return: hex digest string
+
+    '''
+    entries = []
+    for key, value in config.items():
+        param, index = cRWCParamTable.split_key(key)
+        cmdKey = cRWCParamTable.command_key(key)
+        cmdValue = param.format_value(value).upper()
+        try:
+            cmdValue = repr(float(cmdValue))
+        except ValueError:
+            pass
+        entries.append(cmdKey + '=' + cmdValue)
+
+    digest = hashlib.sha1('\n'.join(sorted(entries)).encode())
+    return digest.hexdigest()
+
+
+def save_command(index, version):
+    '''
+    Build the *SAVE command of a slot for the tester firmware
+
+    :param index: slot number (0 ~ 9)
+    :param version: tester software version, e.g. '1.310'
+
+    :return: RWC5020A remote command
+
+    '''
+    if float(version) >= 1.310:
+        return '*SAVE SAVE_' + str(index) + '\n'
+    return '*SAVE ' + str(index) + '\n'
+
+
+def recall_command(index, version):
+    '''
+    Build the *RECALL command of a slot for the tester firmware
+
+    :param index: slot number (0 ~ 9)
+    :param version: tester software version, e.g. '1.310'
+
+    :return: RWC5020A remote command
+
+    '''
+    if float(version) >= 1.310:
+        return '*RECALL SAVE_' + str(index) + '\n'
+    return '*RECALL ' + str(index) + '\n'
+
+
+class RwcSlotManager:
+    '''
+    .. class:: RwcSlotManager
+
+    Tracks which profile is stored in each tester memory slot. A
+    profile already held by a slot is selected with a single *RECALL;
+    any other profile is applied with RWCTesterApi.apply() and saved to
+    a free slot, or to the least recently used one.
+
+    The manager owns the slots it is given: saving to them by other
+    means makes its table wrong, call forget() in that case. The table
+    can be kept in a JSON file so it survives between sessions.
+
+    '''
+
+    def __init__(self, tester, slots = SLOT_INDEXES, filename = None):
+        '''
+        Class constructor attaches the manager to a tester
+
+        :param tester: RWCTesterApi object, port already open
+        :param slots: slot numbers the manager may use (0 ~ 9)
+        :param filename: optional JSON file holding the slot table
+
+        '''
+        for index in slots:
+            if int(index) not in SLOT_INDEXES:
+                raise Exception('Invalid slot received: {}'.format(index))
+
+        self.tester = tester
+        self.slots = tuple(int(index) for index in slots)
+        self.filename = filename
+        self.version = None
+
+        # slot number -> (fingerprint, profile name), oldest use first
+        self.table = collections.OrderedDict()
+        if filename and os.path.exists(filename):
+            self.load()
+
+    def select(self, profile, save = True):
+        '''
+        Bring the tester to a profile
+
+        :param profile: RwcProfile object, profile file name or
+                        dictionary of parameter key and value
+        :param save: save an applied profile to a slot
+
+        :return: dictionary with the action taken (RECALLED, APPLIED,
+                 SAVED), the slot used and the apply() report
+
+        '''
+        name, config = self._profile_config(profile)
+        fprint = fingerprint(config)
+
+        index = self.find(fprint)
+        if index is not None:
+            result = self.tester.transceive(
+                recall_command(index, self._version()))
+            if result == 'ACK':
+                self.table.move_to_end(index)
+                self._seed_shadow(config)
+                self._store()
+                return {'action': 'RECALLED', 'slot': index,
+                        'report': None}
+            self.forget(index)
+
+        report = self.tester.apply(config)
+        action = {'action': 'APPLIED', 'slot': None, 'report': report}
+        failed = [key for key in report
+                  if report[key]['status'] == 'FAILED']
+        if not save or failed:
+            return action
+
+        index = self._free_slot()
+        result = self.tester.transceive(save_command(index, self._version()))
+        if result == 'ACK':
+            self.table.pop(index, None)
+            self.table[index] = (fprint, name)
+            self._store()
+            action['action'] = 'SAVED'
+            action['slot'] = index
+        return action
+
+    def find(self, fprint):
+        '''
+        Return the slot holding a profile fingerprint
+
+        :param fprint: fingerprint of the configuration
+
+        :return: slot number; None when no slot holds it
+
+        '''
+        for index, entry in self.table.items():
+            if entry[0] == fprint:
+                return index
+        return None
+
+    def forget(self, index = None):
+        '''
+        Drop a slot from the table, e.g. after it was overwritten with
+        RWCTesterApi.save()
+
+        :param index: slot number; None drops every slot
+
+        :return: None
+
+        '''
+        if index is None:
+            self.table.clear()
+        else:
+            self.table.pop(int(index), None)
+        self._store()
+
+    def load(self):
+        '''
+        Read the slot table from the JSON file
+
+        :Parameters: N/A
+
+        :return: None
+
+        '''
+        with open(self.filename, 'r') as slotFile:
+            data = json.load(slotFile)
+
+        self.table.clear()
+        for entry in data:
+            if entry['slot'] in self.slots:
+                self.table[entry['slot']] = (entry['fingerprint'],
+                                             entry['name'])
+
+    def _store(self):
+        if not self.filename:
+            return
+        data = [{'slot': index, 'fingerprint': entry[0], 'name': entry[1]}
+                for index, entry in self.table.items()]
+        with open(self.filename, 'w') as slotFile:
+            json.dump(data, slotFile, indent = 4)
+
+    def _free_slot(self):
+        for index in self.slots:
+            if index not in self.table:
+                return index
+        return next(iter(self.table))
+
+    def _version(self):
+        if self.version is None:
+            version = self.tester.query_sysversion()
+            if version is None or version == 'NAK':
+                raise Exception('Unable to read the tester version')
+            self.version = version
+        return self.version
+
+    def _seed_shadow(self, config):
+        if not self.tester.shadow:
+            return
+        for key, value in config.items():
+            param, index = cRWCParamTable.split_key(key)
+            self.tester.shadow.seed(cRWCParamTable.command_key(key),
+                                    param.format_value(value), False)
+
+    def _profile_config(self, profile):
+        if isinstance(profile, dict):
+            errors = cRWCParamTable.check_values(profile)
+            if errors:
+                raise cRWCParamTable.RwcConfigError(errors)
+            return (None, profile)
+        if not isinstance(profile, RwcProfile):
+            profile = cRWCProfile.load_profile(profile)
+        return (profile.name, profile.config)
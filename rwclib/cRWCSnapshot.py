@@ -0,0 +1,129 @@
+##############################################################################
+#
+# Module: cRWCSnapshot.py
+#
+# Description:
+#     Immutable record of the tester parameters read at one moment
+#
+# Copyright notice:
+#     This file copyright (c) 2026 by
+#
+#         MCCI Corporation
+#         3520 Krums Corners Road
+#         Ithaca, NY  14850
+#
+#     See accompanying LICENSE file for copyright and license information.
+#
+# Author:
+#     Sivaprakash Veluthambi, MCCI   October, 2026
+#
+##############################################################################
+
+# Built-in imports
+import types
+
+# Lib imports
+from rwclib.cRWCShadowState import is_volatile
+from rwclib.cRWCShadowState import values_match
+
+
+class RwcSnapshot:
+    '''
+    .. class:: RwcSnapshot
+
+    Values of the tester parameters read by RWCTesterApi.snapshot().
+    The record cannot be changed once created; the values are kept as
+    the tester sent them, None for a parameter left unanswered.
+
+    '''
+    __slots__ = ('timestamp', 'duration', 'subsystems', 'idn', 'values')
+
+    def __init__(self, timestamp, duration, subsystems, idn, values):
+        '''
+        Class constructor stores the snapshot
+
+        :param timestamp: time the reading started (time.time())
+        :param duration: seconds spent reading
+        :param subsystems: names of the subsystems read
+        :param idn: identification string of the tester
+        :param values: dictionary of parameter key and value
+
+        '''
+        setField = object.__setattr__
+        setField(self, 'timestamp', timestamp)
+        setField(self, 'duration', duration)
+        setField(self, 'subsystems', tuple(subsystems))
+        setField(self, 'idn', idn)
+        setField(self, 'values', types.MappingProxyType(dict(values)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('RwcSnapshot is read-only')
+
+    def __delattr__(self, name):
+        raise AttributeError('RwcSnapshot is read-only')
+
+    def __getitem__(self, key):
+        return self.values[key]
+
+    def __contains__(self, key):
+        return key in self.values
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __repr__(self):
+        return 'RwcSnapshot({}, {} parameters)'.format(
+            ','.join(self.subsystems), len(self.values))
+
+    def get(self, key, default = None):
+        '''
+        Return the value of a parameter key
+
+        :param key: parameter key (path and index), e.g. 'RF:TX_POW'
+        :param default: value returned when the key was not read
+
+        :return: value string as sent by the tester
+
+        '''
+        return self.values.get(key, default)
+
+    def diff(self, other, volatile = True):
+        '''
+        Compare with a later snapshot, e.g. the one taken after a
+        certification run
+
+        :param other: RwcSnapshot object
+        :param volatile: False to skip the parameters which change on
+                         their own (clock, counters, measurements)
+
+        :return: dictionary of the keys which differ,
+                 {key: (value in self, value in other)}
+
+        '''
+        changes = {}
+        for key in sorted(set(self.values) | set(other.values)):
+            if not volatile and is_volatile(key):
+                continue
+            first = self.values.get(key)
+            second = other.values.get(key)
+            if not values_match(first, second):
+                changes[key] = (first, second)
+        return changes
+
+    def as_dict(self):
+        '''
+        Convert the snapshot to plain types, e.g. to store it as JSON
+
+        :Parameters: N/A
+
+        :return: dictionary of the snapshot fields
+
+        '''
+        return {'timestamp': self.timestamp,
+                'duration': self.duration,
+                'subsystems': list(self.subsystems),
+                'idn': self.idn,
+                'values': dict(self.values)}
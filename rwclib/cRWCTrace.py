@@ -0,0 +1,459 @@
+##############################################################################
+#
+# Module: cRWCTrace.py
+#
+# Description:
+#     Append-only binary trace file of link messages, with its index
+#
+# Copyright notice:
+#     This file copyright (c) 2026 by
+#
+#         MCCI Corporation
+#         3520 Krums Corners Road
+#         Ithaca, NY  14850
+#
+#     See accompanying LICENSE file for copyright and license information.
+#
+# Author:
+#     Sivaprakash Veluthambi, MCCI   October, 2026
+#
+##############################################################################
+
+# Built-in imports
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+
+# Lib imports
+from rwclib.cRWCLinkMsg import RwcLinkMsg
+from rwclib.cRWCValidator import dr_number
+
+TRACE_MAGIC = b'RWCTRC01'
+INDEX_MAGIC = b'RWCIDX02'
+
+# Record: text length, receive time, FCnt, port, uplink, DR number,
+# power, delay and frequency, followed by the text fields
+RECORD_HEADER = struct.Struct('<Idqhbbddd')
+
+# Index entry: record offset, receive time, FCnt, message type number
+INDEX_ENTRY = struct.Struct('<QdqH')
+
+# Message types of the link analyzer numbered in the index; number 0 is
+# any other type, read from its record. New types are only added at the
+# end, so existing indexes keep their meaning.
+MSG_TYPES = (
+    None, 'JoinReq', 'Join-request', 'JoinAccept', 'Join-accept',
+    'UnconfUp', 'UnconfDown', 'ConfUp', 'ConfDown', 'RejoinReq',
+    'Rejoin-request', 'Proprietary')
+MSG_TYPE_IDS = dict((name, number) for number, name in enumerate(MSG_TYPES)
+                    if name)
+
+# Fields of RwcLinkMsg kept as text, tab separated
+TEXT_FIELDS = (
+    'direction', 'time', 'msg_type', 'dev_addr', 'adr', 'adr_ack_req',
+    'ack', 'fpending', 'class_b', 'dr', 'dwell', 'mic_err', 'mac',
+    'payload')
+
+INDEX_SUFFIX = '.idx'
+
+MSG_TYPE_FIELD = TEXT_FIELDS.index('msg_type')
+
+
+def _number(value, convert, missing):
+    if value is None:
+        return missing
+    try:
+        return convert(value)
+    except (TypeError, ValueError):
+        return missing
+
+
+def _msg_type_id(msgType):
+    return MSG_TYPE_IDS.get(msgType, 0)
+
+
+def _text_msg_type(text):
+    fields = bytes(text).split(b'\t', MSG_TYPE_FIELD + 1)
+    if len(fields) <= MSG_TYPE_FIELD:
+        return None
+    return fields[MSG_TYPE_FIELD].decode('utf-8') or None
+
+
+def encode_record(record, timestamp):
+    '''
+    Encode a link message as a trace record
+
+    :param record: RwcLinkMsg object
+    :param timestamp: receive time (time.time() seconds)
+
+    :return: bytes of the record
+
+    '''
+    text = '\t'.join('' if getattr(record, name) is None
+                     else str(getattr(record, name))
+                     for name in TEXT_FIELDS).encode('utf-8')
+    dr = _number(record.dr, dr_number, None)
+    header = RECORD_HEADER.pack(
+        len(text), timestamp,
+        _number(record.fcnt, int, -1),
+        _number(record.port, int, -1),
+        int(record.is_uplink()) if record.direction else -1,
+        -1 if dr is None else dr,
+        _number(record.power, float, math.nan),
+        _number(record.delay, float, math.nan),
+        _number(record.freq, float, math.nan))
+    return header + text
+
+
+def decode_record(data, offset):
+    '''
+    Decode the trace record at an offset
+
+    :param data: trace file contents (bytes or mmap)
+    :param offset: offset of the record
+
+    :return: tuple of (receive time, RwcLinkMsg object)
+
+    '''
+    (textLen, timestamp, fcnt, port, uplink, dr, power, delay,
+     freq) = RECORD_HEADER.unpack_from(data, offset)
+    start = offset + RECORD_HEADER.size
+    texts = bytes(data[start:start + textLen]).decode('utf-8').split('\t')
+
+    # fields set one by one; faster than RwcLinkMsg(**fields) when a
+    # whole trace is read
+    record = RwcLinkMsg.__new__(RwcLinkMsg)
+    for name, text in zip(TEXT_FIELDS, texts):
+        setattr(record, name, text or None)
+    record.fcnt = fcnt if fcnt >= 0 else None
+    record.port = port if port >= 0 else None
+    record.power = None if math.isnan(power) else power
+    record.delay = None if math.isnan(delay) else delay
+    record.freq = None if math.isnan(freq) else freq
+    record.extra = None
+    return (timestamp, record)
+
+
+class RwcTraceWriter:
+    '''
+    .. class:: RwcTraceWriter
+
+    Appends link messages to a binary trace file and their receive
+    time, FCnt and message type to the index file next to it (name
+    plus .idx). Every message is flushed once written, so a trace
+    stays readable when the test script stops. An existing trace is
+    continued; its index is rebuilt first if it is behind.
+
+    '''
+
+    def __init__(self, filename):
+        '''
+        Class constructor opens the trace for appending
+
+        :param filename: trace file name
+
+        '''
+        self.filename = filename
+        self.lock = threading.Lock()
+
+        if not os.path.exists(filename) or os.path.getsize(filename) == 0:
+            with open(filename, 'wb') as traceFile:
+                traceFile.write(TRACE_MAGIC)
+            with open(filename + INDEX_SUFFIX, 'wb') as indexFile:
+                indexFile.write(INDEX_MAGIC)
+        elif not _index_valid(filename):
+            rebuild_index(filename)
+
+        self.traceFile = open(filename, 'ab')
+        self.indexFile = open(filename + INDEX_SUFFIX, 'ab')
+        self.count = ((os.path.getsize(filename + INDEX_SUFFIX)
+                       - len(INDEX_MAGIC)) // INDEX_ENTRY.size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def append(self, record, timestamp = None):
+        '''
+        Write a link message to the trace
+
+        :param record: RwcLinkMsg object
+        :param timestamp: receive time; None for now
+
+        :return: index of the message in the trace
+
+        '''
+        if timestamp is None:
+            timestamp = time.time()
+        data = encode_record(record, timestamp)
+        with self.lock:
+            offset = self.traceFile.tell()
+            self.traceFile.write(data)
+            self.traceFile.flush()
+            self.indexFile.write(INDEX_ENTRY.pack(
+                offset, timestamp, _number(record.fcnt, int, -1),
+                _msg_type_id(record.msg_type)))
+            self.indexFile.flush()
+            self.count += 1
+            return self.count - 1
+
+    def close(self):
+        '''
+        Close the trace and index files
+
+        :Parameters: N/A
+
+        :return: None
+
+        '''
+        with self.lock:
+            self.traceFile.close()
+            self.indexFile.close()
+
+
+class RwcTraceReader:
+    '''
+    .. class:: RwcTraceReader
+
+    Read-only view of a trace file. The trace and its index are mapped
+    in memory, so only the messages looked at are decoded; a time
+    window is found by binary search of the index, which is in receive
+    time order.
+
+    '''
+
+    def __init__(self, filename):
+        '''
+        Class constructor maps the trace and its index
+
+        :param filename: trace file name
+
+        '''
+        self.filename = filename
+        if not _index_valid(filename):
+            rebuild_index(filename)
+        self.traceFile = open(filename, 'rb')
+        self.indexFile = open(filename + INDEX_SUFFIX, 'rb')
+        self.trace = _map(self.traceFile)
+        self.index = _map(self.indexFile)
+        if bytes(self.trace[:len(TRACE_MAGIC)]) != TRACE_MAGIC:
+            self.close()
+            raise Exception('Invalid trace file received: {}'
+                            .format(filename))
+        self.count = ((len(self.index) - len(INDEX_MAGIC))
+                      // INDEX_ENTRY.size)
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def __iter__(self):
+        return self.records()
+
+    def entry(self, position):
+        '''
+        Return the index entry of a message
+
+        :param position: index of the message
+
+        :return: tuple of (offset, receive time, FCnt, message type)
+
+        '''
+        if not 0 <= position < self.count:
+            raise IndexError(position)
+        offset, timestamp, fcnt, msgId = INDEX_ENTRY.unpack_from(
+            self.index, len(INDEX_MAGIC) + position * INDEX_ENTRY.size)
+        if 0 < msgId < len(MSG_TYPES):
+            return (offset, timestamp, fcnt, MSG_TYPES[msgId])
+        return (offset, timestamp, fcnt, self._msg_type(offset))
+
+    def record(self, position):
+        '''
+        Decode one message
+
+        :param position: index of the message
+
+        :return: tuple of (receive time, RwcLinkMsg object)
+
+        '''
+        return decode_record(self.trace, self.entry(position)[0])
+
+    def records(self, t0 = None, t1 = None):
+        '''
+        Decode the messages of a time window in order, walking the trace
+        from the first one
+
+        :param t0: earliest receive time; None from the first message
+        :param t1: latest receive time; None up to the last message
+
+        :return: yields tuples of (receive time, RwcLinkMsg object)
+
+        '''
+        window = self.between(t0, t1)
+        if not window:
+            return
+        offset = self.entry(window.start)[0]
+        for position in window:
+            yield decode_record(self.trace, offset)
+            offset += (RECORD_HEADER.size
+                       + RECORD_HEADER.unpack_from(self.trace, offset)[0])
+
+    def between(self, t0 = None, t1 = None):
+        '''
+        Find the messages received in a time window
+
+        :param t0: earliest receive time; None from the first message
+        :param t1: latest receive time; None up to the last message
+
+        :return: range of message indexes
+
+        '''
+        first = 0 if t0 is None else self._search(t0, False)
+        last = self.count if t1 is None else self._search(t1, True)
+        return range(first, max(first, last))
+
+    def find(self, fcnt = None, msg_type = None, t0 = None, t1 = None):
+        '''
+        Find the messages with a frame counter and/or message type,
+        scanning only the index
+
+        :param fcnt: frame counter
+        :param msg_type: message type, e.g. 'ConfUp'; a type not in 
+                         MSG_TYPES is compared with the records whose 
+                         index holds no type number
+        :param t0: earliest receive time
+        :param t1: latest receive time
+
+        :return: list of message indexes
+
+        '''
+        window = self.between(t0, t1)
+        msgId = None
+        if msg_type is not None:
+            msgId = _msg_type_id(msg_type)
+        start = len(INDEX_MAGIC) + window.start * INDEX_ENTRY.size
+        end = len(INDEX_MAGIC) + window.stop * INDEX_ENTRY.size
+
+        found = []
+        position = window.start
+        for offset, timestamp, entryFcnt, entryId in \
+                INDEX_ENTRY.iter_unpack(self.index[start:end]):
+            if ((fcnt is None or entryFcnt == fcnt)
+                    and (msgId is None or entryId == msgId)
+                    and (msgId != 0
+                         or self._msg_type(offset) == msg_type)):
+                found.append(position)
+            position += 1
+        return found
+
+    def close(self):
+        '''
+        Release the mapped files
+
+        :Parameters: N/A
+
+        :return: None
+
+        '''
+        for mapped in (self.trace, self.index):
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+        self.traceFile.close()
+        self.indexFile.close()
+
+    def _msg_type(self, offset):
+        start = offset + RECORD_HEADER.size
+        end = start + RECORD_HEADER.unpack_from(self.trace, offset)[0]
+        return _text_msg_type(self.trace[start:end])
+
+    def _search(self, timestamp, after):
+        # first position whose time is above (after) or not below
+        # timestamp
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            value = self.entry(middle)[1]
+            if value < timestamp or (after and value == timestamp):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+
+def _map(fileObject):
+    if os.fstat(fileObject.fileno()).st_size == 0:
+        return b''
+    return mmap.mmap(fileObject.fileno(), 0, access = mmap.ACCESS_READ)
+
+
+def _index_valid(filename):
+    indexName = filename + INDEX_SUFFIX
+    if not os.path.exists(indexName):
+        return False
+    size = os.path.getsize(indexName) - len(INDEX_MAGIC)
+    if size < 0 or size % INDEX_ENTRY.size:
+        return False
+    with open(indexName, 'rb') as indexFile:
+        if indexFile.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+            return False
+        if size == 0:
+            return os.path.getsize(filename) == len(TRACE_MAGIC)
+        indexFile.seek(-INDEX_ENTRY.size, os.SEEK_END)
+        offset = INDEX_ENTRY.unpack(indexFile.read(INDEX_ENTRY.size))[0]
+    with open(filename, 'rb') as traceFile:
+        traceFile.seek(offset)
+        header = traceFile.read(RECORD_HEADER.size)
+    if len(header) < RECORD_HEADER.size:
+        return False
+    end = offset + RECORD_HEADER.size + RECORD_HEADER.unpack(header)[0]
+    return end == os.path.getsize(filename)
+
+
+def rebuild_index(filename):
+    '''
+    Write the index of a trace again from the trace itself, reading one
+    record at a time; a record cut short at the end of the trace (e.g.
+    by a power loss) is dropped
+
+    :param filename: trace file name
+
+    :return: number of messages in the trace
+
+    '''
+    count = 0
+    offset = len(TRACE_MAGIC)
+    with open(filename, 'rb', buffering = 1 << 20) as traceFile:
+        if traceFile.read(len(TRACE_MAGIC)) != TRACE_MAGIC:
+            raise Exception('Invalid trace file received: {}'
+                            .format(filename))
+        with open(filename + INDEX_SUFFIX, 'wb',
+                  buffering = 1 << 20) as indexFile:
+            indexFile.write(INDEX_MAGIC)
+            while True:
+                header = traceFile.read(RECORD_HEADER.size)
+                if len(header) < RECORD_HEADER.size:
+                    break
+                textLen, timestamp, fcnt = RECORD_HEADER.unpack(header)[:3]
+                text = traceFile.read(textLen)
+                if len(text) < textLen:
+                    break
+                indexFile.write(INDEX_ENTRY.pack(
+                    offset, timestamp, fcnt,
+                    _msg_type_id(_text_msg_type(text))))
+                offset += RECORD_HEADER.size + textLen
+                count += 1
+
+    if offset < os.path.getsize(filename):
+        with open(filename, 'r+b') as traceFile:
+            traceFile.truncate(offset)
+    return count
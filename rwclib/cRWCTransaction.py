@@ -0,0 +1,164 @@
+##############################################################################
+#
+# Module: cRWCTransaction.py
+#
+# Description:
+#     Deferred settings sent to the tester in one burst
+#
+# Copyright notice:
+#     This file copyright (c) 2026 by
+#
+#         MCCI Corporation
+#         3520 Krums Corners Road
+#         Ithaca, NY  14850
+#
+#     See accompanying LICENSE file for copyright and license information.
+#
+# Author:
+#     Sivaprakash Veluthambi, MCCI   October, 2026
+#
+##############################################################################
+
+# Lib imports
+from rwclib.cRWCShadowState import DEPENDENT_PATHS
+from rwclib.cRWCShadowState import RESET_COMMANDS
+from rwclib.cRWCShadowState import parse_command
+from rwclib.cRWCShadowState import path_matches
+
+# Response returned by a setter inside a transaction
+QUEUED = 'QUEUED'
+
+
+class RwcTransactionError(Exception):
+    '''
+    .. class:: RwcTransactionError
+
+    Raised when commands of a transaction are not acknowledged. failed
+    lists every (command, response) pair that went wrong.
+
+    '''
+
+    def __init__(self, failed):
+        self.failed = failed
+        Exception.__init__(self, 'Transaction failed: ' + '; '.join(
+            '{} -> {}'.format(rwccmd.strip(), result)
+            for rwccmd, result in failed))
+
+
+class RwcTransaction:
+    '''
+    .. class:: RwcTransaction
+
+    Queue of the commands written during RWCTesterApi.transaction().
+    Settings of the same parameter collapse to the last value, sent at
+    the place of the first one, so a mode or region change stays ahead
+    of the settings it resets. A setting that resets others (mode,
+    region, number of MAC commands, ...) is never merged, and settings
+    it resets are not merged across it: set X, set REGION, set X sends
+    all three. Any other command (EXEC, *RST, ...) is kept in place and
+    settings are not merged across it.
+
+    '''
+
+    def __init__(self):
+        '''
+        Class constructor creates an empty queue
+
+        :Parameters: N/A
+
+        '''
+        self.commands = []
+        self.results = []
+
+        # key -> position of its setting since the last other command
+        self.keys = {}
+
+        # key -> last value queued
+        self.values = {}
+
+    def queue(self, rwccmd):
+        '''
+        Add a command to the queue
+
+        :param rwccmd: RWC5020A remote command
+
+        :return: QUEUED
+
+        '''
+        verb, key, value = parse_command(rwccmd)
+        if verb == 'SET':
+            prefixes = DEPENDENT_PATHS.get(key)
+            if prefixes is not None:
+                self.keys = dict(
+                    (other, position) for other, position in self.keys.items()
+                    if other != key and not path_matches(other, prefixes))
+                for other in [other for other in self.values
+                              if path_matches(other, prefixes)]:
+                    del self.values[other]
+            self.values[key] = value
+            position = self.keys.get(key)
+            if position is not None:
+                self.commands[position] = rwccmd
+                return QUEUED
+            self.keys[key] = len(self.commands)
+        else:
+            self.keys = {}
+            if verb in RESET_COMMANDS:
+                self.values = {}
+        self.commands.append(rwccmd)
+        return QUEUED
+
+    def lookup(self, rwccmd):
+        '''
+        Answer a query with a value queued in the transaction
+
+        :param rwccmd: RWC5020A remote command
+
+        :return: queued value; None when the command has to go to the
+                 tester
+
+        '''
+        verb, key, value = parse_command(rwccmd)
+        if verb != 'QUERY':
+            return None
+        return self.values.get(key)
+
+    def pending(self):
+        '''
+        Return the queued commands in order
+
+        :Parameters: N/A
+
+        :return: list of RWC5020A remote commands
+
+        '''
+        return list(self.commands)
+
+    def clear(self):
+        '''
+        Drop every queued command
+
+        :Parameters: N/A
+
+        :return: None
+
+        '''
+        self.commands = []
+        self.keys = {}
+        self.values = {}
+
+
+def is_deferred(rwccmd):
+    '''
+    Check whether a command is queued inside a transaction; queries
+    still go to the tester
+
+    :param rwccmd: RWC5020A remote command
+
+    :return: True for settings, EXEC and common commands
+
+    '''
+    verb, key, value = parse_command(rwccmd)
+    if verb is None or verb == 'QUERY':
+        return False
+    return not verb.endswith('?')
@@ -0,0 +1,297 @@
+##############################################################################
+#
+# Module: cRWCValidator.py
+#
+# Description:
+#     Offline validation of a complete tester configuration
+#
+# Copyright notice:
+#     This file copyright (c) 2026 by
+#
+#         MCCI Corporation
+#         3520 Krums Corners Road
+#         Ithaca, NY  14850
+#
+#     See accompanying LICENSE file for copyright and license information.
+#
+# Author:
+#     Sivaprakash Veluthambi, MCCI   October, 2026
+#
+##############################################################################
+
+# Lib imports
+from rwclib import cRWCParamTable
+from rwclib.cRWCParamTable import RwcConfigError
+from rwclib.cRWCRegion import REGIONS
+from rwclib.cRWCShadowState import DEPENDENT_PATHS
+from rwclib.cRWCShadowState import path_matches
+
+# Channel groups of the regions with more than 16 channels
+REGION_CHANNEL_GROUPS = dict((name, region.groups)
+                             for name, region in REGIONS.items()
+                             if region.groups)
+
+# Parameters which only exist in one region
+REGION_ONLY_PATHS = {
+    'RF:AS923_CH_MODE': 'AS_923',
+    'RF:AS923_CH_GROUP': 'AS_923',
+    'RF:AS923_FREQ_OFFSET': 'AS_923',
+    'RF:CN470_CH_PLAN': 'CN_470',
+    'RF:ICA_CH_MODE': 'CN_470',
+    }
+
+# Highest uplink data rate of each region
+REGION_MAX_DR = dict((name, region.max_dr)
+                     for name, region in REGIONS.items())
+
+# Uplink data rate parameters
+UPLINK_DR_PATHS = (
+    'PROTOCOL:UPLINK_DR',
+    'LINK:ADR_DR',
+    'LINK:REJOIN_DR',
+    'POWER:UL_DR',
+    'SENSITIVITY:TARGET_DR',
+    )
+
+# Frequency band of each region, in MHz
+REGION_BANDS = dict((name, region.band) for name, region in REGIONS.items())
+
+# Channel frequencies of the LoRaWAN link which must lie in the band
+REGION_FREQ_PATHS = (
+    'RF:UL_CH',
+    'RF:PING_FREQ',
+    'RF:BEACON_FREQ',
+    'PROTOCOL:RX2_FREQ',
+    'LINK:DL_CH_FREQ',
+    'LINK:RX2_FREQ',
+    'LINK:BEACON_FREQ',
+    'LINK:PING_FREQ',
+    )
+
+# Parameters which only exist in LoRaWAN 1.1
+LORAWAN11_PATHS = (
+    'PROTOCOL:NWK_KEY',
+    'PROTOCOL:FNWKS_IKEY',
+    'PROTOCOL:SNWKS_IKEY',
+    'PROTOCOL:NWKS_EKEY',
+    'PROTOCOL:JOIN_EUI',
+    'PROTOCOL:UPDATE_NFCNT',
+    'PROTOCOL:UPDATE_AFCNT',
+    )
+
+# (lower, upper) parameter pairs
+ORDERED_PAIRS = (
+    ('POWER:MIN_Y', 'POWER:MAX_Y'),
+    ('NST:MFG:POW_CRITERIA_LOWER', 'NST:MFG:POW_CRITERIA_UPPER'),
+    ('LINK:NEW_CH_MIN_DR', 'LINK:NEW_CH_MAX_DR'),
+    )
+
+
+def validate_config(config, current = None):
+    '''
+    Check a complete configuration without talking to the tester: every
+    key and value against the parameter table, then the rules between
+    parameters (channel group and data rates against the region, region
+    specific settings, LoRaWAN 1.1 keys against the protocol version,
+    MAC command parameters against the number of MAC commands, ...).
+
+    Values missing from the configuration are taken from current, e.g.
+    the shadow state; a rule is skipped when a value it needs is
+    unknown. Only rules involving a key of the configuration report.
+
+    :param config: dictionary of parameter key and value
+    :param current: optional dictionary of parameter key (path and
+                    index) and value held by the tester
+
+    :return: list of error descriptions; empty when valid
+
+    '''
+    errors = cRWCParamTable.check_values(config)
+    if errors:
+        return errors
+
+    values = {}
+    for key, value in (current or {}).items():
+        if value is not None and value != 'NAK':
+            values[key] = str(value)
+    changed = set()
+    for key, value in config.items():
+        param, index = cRWCParamTable.split_key(key)
+        changed.add(cRWCParamTable.command_key(key))
+
+    # Current values reset by a mode, region, ... change are not known
+    for key in changed:
+        prefixes = DEPENDENT_PATHS.get(key, ())
+        for stale in [k for k in values if path_matches(k, prefixes)]:
+            del values[stale]
+
+    for key, value in config.items():
+        param, index = cRWCParamTable.split_key(key)
+        values[cRWCParamTable.command_key(key)] = param.format_value(value)
+
+    for rule in RULES:
+        rule(values, changed, errors)
+    return errors
+
+
+def check_config(config, current = None):
+    '''
+    Validate a configuration, see validate_config()
+
+    :param config: dictionary of parameter key and value
+    :param current: optional dictionary of values held by the tester
+
+    :return: None; raises RwcConfigError listing every problem
+
+    '''
+    errors = validate_config(config, current)
+    if errors:
+        raise RwcConfigError(errors)
+
+
+def dr_number(value):
+    '''
+    Return the number of a data rate value
+
+    :param value: data rate, e.g. 'DR3_SF9BW125', 'DR_3' or '3'
+
+    :return: data rate number; None if not a data rate
+
+    '''
+    text = str(value).upper()
+    if text.startswith('DR'):
+        text = text[2:].lstrip('_').split('_')[0]
+    if text.isdigit():
+        return int(text)
+    return None
+
+
+def _path_keys(values, path):
+    return [key for key in values
+            if key == path or key.startswith(path + ' ')]
+
+
+def _check_channel_group(values, changed, errors):
+    key = 'RF:CH_GROUP'
+    region = values.get('PROTOCOL:REGION')
+    if key not in values or region is None:
+        return
+    if key not in changed and 'PROTOCOL:REGION' not in changed:
+        return
+    if values[key] not in REGION_CHANNEL_GROUPS.get(region, ()):
+        errors.append('{} {} is not available in region {}'
+                      .format(key, values[key], region))
+
+
+def _check_region_only(values, changed, errors):
+    region = values.get('PROTOCOL:REGION')
+    if region is None:
+        return
+    for path, only in REGION_ONLY_PATHS.items():
+        if path in changed and region != only:
+            errors.append('{} is only available in region {}, not {}'
+                          .format(path, only, region))
+
+
+def _check_operator(values, changed, errors):
+    key = 'PROTOCOL:OPERATOR'
+    region = values.get('PROTOCOL:REGION')
+    if values.get(key) != 'SKT' or region is None:
+        return
+    if key not in changed and 'PROTOCOL:REGION' not in changed:
+        return
+    if region != 'KR_922':
+        errors.append('{} SKT needs region KR_922, not {}'
+                      .format(key, region))
+
+
+def _check_data_rates(values, changed, errors):
+    region = values.get('PROTOCOL:REGION')
+    if region not in REGION_MAX_DR:
+        return
+    regionChanged = 'PROTOCOL:REGION' in changed
+    for path in UPLINK_DR_PATHS:
+        for key in _path_keys(values, path):
+            if key not in changed and not regionChanged:
+                continue
+            number = dr_number(values[key])
+            if number is None:
+                continue
+            if (number > REGION_MAX_DR[region]
+                    or REGIONS[region].data_rates[number] is None):
+                errors.append('{} {} is not available in region {}'
+                              .format(key, values[key], region))
+
+
+def _check_frequencies(values, changed, errors):
+    region = values.get('PROTOCOL:REGION')
+    if region not in REGION_BANDS:
+        return
+    low, high = REGION_BANDS[region]
+    for path in REGION_FREQ_PATHS:
+        for key in _path_keys(values, path):
+            if key not in changed:
+                continue
+            try:
+                freq = float(values[key])
+            except ValueError:
+                continue
+            if freq < low or freq > high:
+                errors.append('{} {} is outside the {} band ({} ~ {} MHz)'
+                              .format(key, values[key], region, low, high))
+
+
+def _check_protocol_version(values, changed, errors):
+    version = values.get('PROTOCOL:PROTOCOL_VER')
+    if version is None or version == 'LoRaWAN1.1':
+        return
+    for path in LORAWAN11_PATHS:
+        if path in changed:
+            errors.append('{} needs PROTOCOL:PROTOCOL_VER LoRaWAN1.1, not {}'
+                          .format(path, version))
+
+
+def _check_mac_slots(values, changed, errors):
+    try:
+        count = int(values['LINK:NUM_OF_CMD'])
+    except (KeyError, ValueError):
+        return
+    for key in sorted(changed):
+        fields = key.split(' ')
+        param = cRWCParamTable.PARAMS.get(fields[0])
+        if param is None or param.index != cRWCParamTable.INDEX_MAC:
+            continue
+        if not fields[0].startswith('LINK:'):
+            continue
+        if int(fields[1]) > count:
+            errors.append('{} needs LINK:NUM_OF_CMD {} or more, not {}'
+                          .format(key, fields[1], count))
+
+
+def _check_ordered_pairs(values, changed, errors):
+    for lowPath, highPath in ORDERED_PAIRS:
+        for lowKey in _path_keys(values, lowPath):
+            highKey = highPath + lowKey[len(lowPath):]
+            if highKey not in values:
+                continue
+            if lowKey not in changed and highKey not in changed:
+                continue
+            try:
+                if float(values[lowKey]) > float(values[highKey]):
+                    errors.append('{} {} is above {} {}'
+                                  .format(lowKey, values[lowKey],
+                                          highKey, values[highKey]))
+            except ValueError:
+                continue
+
+
+RULES = (
+    _check_channel_group,
+    _check_region_only,
+    _check_operator,
+    _check_data_rates,
+    _check_frequencies,
+    _check_protocol_version,
+    _check_mac_slots,
+    _check_ordered_pairs,
+    )
@@ -19,6 +19,7 @@
 #
 ##############################################################################
 
+import datetime
 import os
 import sys
 import time
@@ -29,6 +30,14 @@ import serial
 sys.path.insert(0, os.path.abspath('..'))
 
 from rwclib.cRWC5020x import RWCTesterApi
+from rwclib.cRWCSlotManager import RwcSlotManager
+from rwclib.cRWCCapture import RwcCapture
+from rwclib.cRWCMacScenario import RwcMacScenario
+from rwclib.cRWCPcap import RwcPcapWriter
+from rwclib.cRWCTrace import RwcTraceReader, RwcTraceWriter, rebuild_index
+from rwclib.cRWCLinkMsg import RwcLinkMsg
+from rwclib.cRWCParamTable import RwcConfigError
+from rwclib.cRWCValidator import dr_number
 
 class RwcApiTest(unittest.TestCase):
 
@@ -1406,7 +1415,275 @@ class RwcApiTest(unittest.TestCase):
         self.assertEqual(self.rwctest.sys_getiptype(), 'STATIC', 'Read IP type Failed.')
         self.assertEqual(self.rwctest.sys_setiptype('DYNAMIC'), 'ACK', 'Set IP type Failed.')
         self.assertEqual(self.rwctest.sys_getiptype(), 'DYNAMIC', 'Read IP type Failed.')
-    
+
+    # Test cases for Bulk Configuration Methods
+    def test_applyconfig(self):
+        config = {'TESTER_MODE': 'EDT', 'PROTOCOL:REGION': 'EU_868', 'RF:TX_POW': -50}
+        report = self.rwctest.apply(config)
+        self.assertNotIn('FAILED', [item['status'] for item in report.values()], 'Applying configuration Failed.')
+        report = self.rwctest.apply(config)
+        self.assertEqual([item['status'] for item in report.values()], ['UNCHANGED'] * 3, 'Configuration not applied.')
+
+    def test_applyprofile(self):
+        profile = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples', 'profiles', 'edt_in866_otaa.json')
+        report = self.rwctest.apply_profile(profile)
+        self.assertNotIn('FAILED', [item['status'] for item in report.values()], 'Applying profile Failed.')
+        self.assertEqual(self.rwctest.protocol_getregion(), 'IN_866', 'Profile region not applied.')
+
+    def test_applyorder(self):
+        sent = []
+        sendBatch = self.rwctest.transceive_port_batch
+        def record(rwccmds):
+            sent.extend(rwccmds)
+            return sendBatch(rwccmds)
+        self.rwctest.transceive_port_batch = record
+        try:
+            self.assertEqual(self.rwctest.reset(), 'ACK', 'Reset Operation Failed')
+            report = self.rwctest.apply({'LINK:NUM_OF_CMD': 2, 'LINK:INSTANT_MAC_CMD 1': 'DEV_STATUS', 'LINK:MAC_CMD_TYPE': 'CONFIRMED', 'LINK:MAC_CMD_FIELD': 'FOPTS'})
+        finally:
+            del self.rwctest.transceive_port_batch
+        self.assertNotIn('FAILED', [item['status'] for item in report.values()], 'Applying configuration Failed.')
+        links = [cmd.strip() for cmd in sent if cmd.startswith('CONF:LINK:')]
+        self.assertEqual(links[0], 'CONF:LINK:NUM_OF_CMD 2', 'Number of MAC Commands not sent first.')
+        self.assertEqual(self.rwctest.link_getmaccmdtype(), 'CONFIRMED', 'MAC Command Type reset by Number of MAC Commands.')
+
+    # Test cases for Shadow State Methods
+    def test_discover(self):
+        caps = self.rwctest.discover()
+        self.assertEqual(caps.serial, '0x1760009', 'Discovering Serial Number Failed.')
+        self.assertTrue(caps.has_option('EDT'), 'Discovering EDT Option Failed.')
+        self.assertEqual(self.rwctest.query_sysversion(), caps.version, 'Discovered Software Version Failed.')
+        self.rwctest.clear_identity()
+
+    def test_identitycache(self):
+        values = self.rwctest.load_identity(refresh = True)
+        self.assertEqual(self.rwctest.load_identity(), values, 'Loading Identity Cache Failed.')
+        self.assertEqual(self.rwctest.query_sysversion(), values['SYSTEM:SW_VERSION'], 'Cached Software Version Failed.')
+        self.rwctest.clear_identity()
+
+    def test_shadowstate(self):
+        self.rwctest.enable_shadow()
+        self.assertEqual(self.rwctest.rf_settxpower(-50), 'ACK', 'Setting TX Power Failed.')
+        self.assertEqual(self.rwctest.rf_gettxpower(), '-50.0', 'Reading TX Power from shadow Failed.')
+        self.assertEqual(self.rwctest.shadow.misses, 0, 'TX Power not served from shadow.')
+        self.assertEqual(self.rwctest.verify_shadow(), {}, 'Shadow state differs from tester.')
+        self.assertEqual(self.rwctest.reset(), 'ACK', 'Reset Operation Failed')
+        self.assertEqual(self.rwctest.shadow.entries, {}, 'Shadow state not cleared by reset.')
+        self.rwctest.disable_shadow()
+
+    def test_snapshot(self):
+        snap = self.rwctest.snapshot(['RF', 'PROTOCOL'])
+        self.assertIn('RWC5020', snap.idn, 'Snapshot Identification Failed.')
+        self.assertEqual(snap['RF:TX_POW'], self.rwctest.rf_gettxpower(), 'Snapshot TX Power Failed.')
+        self.assertEqual(snap.diff(self.rwctest.snapshot(['RF', 'PROTOCOL']), volatile = False), {}, 'Snapshot Comparison Failed.')
+
+    def test_setsuppression(self):
+        shadow = self.rwctest.enable_set_suppression(ttl = 30)
+        self.assertEqual(self.rwctest.link_setmaccmdtype('CONFIRMED'), 'ACK', 'Setting MAC Command Type Failed.')
+        suppressed = shadow.suppressed
+        self.assertEqual(self.rwctest.link_setmaccmdtype('CONFIRMED'), 'ACK', 'Suppressing MAC Command Type Failed.')
+        self.assertEqual(shadow.suppressed, suppressed + 1, 'Counting Suppressed Settings Failed.')
+        self.rwctest.disable_set_suppression()
+        self.rwctest.disable_shadow()
+
+    def test_typedresponse(self):
+        self.rwctest.enable_typed()
+        self.assertEqual(self.rwctest.rf_settxpower(-50), 'ACK', 'Setting TX Power Failed.')
+        txPower = self.rwctest.rf_gettxpower()
+        self.assertEqual(txPower.value, -50, 'Decoding TX Power Failed.')
+        self.assertEqual(txPower.raw, '-50.0', 'Raw TX Power Failed.')
+        self.rwctest.disable_typed()
+
+    def test_transaction(self):
+        with self.rwctest.transaction() as txn:
+            self.assertEqual(self.rwctest.link_setnumofmaccmd(1), 'QUEUED', 'Queueing Num of MAC Command Failed.')
+            self.rwctest.link_setinstantmaccmd(1, 'LINK_ADR')
+            self.rwctest.link_setinstantmaccmd(1, 'DEV_STATUS')
+        self.assertEqual(len(txn.results), 2, 'Collapsing Transaction Settings Failed.')
+        self.assertEqual(self.rwctest.link_getinstantmaccmd(1), 'DEV_STATUS', 'Transaction MAC Command Failed.')
+
+    def test_transactionreset(self):
+        with self.rwctest.transaction() as txn:
+            self.rwctest.link_setmaccmdtype('UNCONFIRMED')
+            self.rwctest.link_setnumofmaccmd(2)
+            self.rwctest.link_setmaccmdtype('CONFIRMED')
+        self.assertEqual([rwccmd.strip() for rwccmd, result in txn.results], ['CONF:LINK:MAC_CMD_TYPE UNCONFIRMED', 'CONF:LINK:NUM_OF_CMD 2', 'CONF:LINK:MAC_CMD_TYPE CONFIRMED'], 'Transaction Setting merged across reset.')
+        self.assertEqual(self.rwctest.link_getmaccmdtype(), 'CONFIRMED', 'Transaction MAC Command Type reset.')
+
+    def test_linkmsgrecord(self):
+        self.assertEqual(self.rwctest.link_settimedisplay('OFF'), 'ACK', 'Setting Time Display Failed.')
+        parser = self.rwctest.link_msgparser()
+        self.assertNotIn('time', parser.fields(), 'Link Message Layout Failed.')
+        self.assertEqual(self.rwctest.link_settimedisplay('ON'), 'ACK', 'Setting Time Display Failed.')
+        self.assertIn('time', self.rwctest.link_msgparser().fields(), 'Link Message Layout Failed.')
+        record = self.rwctest.link_readmsgrecord(parser)
+        if record is not None:
+            self.assertIsNotNone(record.direction, 'Parsing Link Message Failed.')
+
+    def test_iterlinkmessages(self):
+        startTime = time.time()
+        records = list(self.rwctest.iter_link_messages(timeout = 2))
+        self.assertLess(time.time() - startTime, 4, 'Link Message Deadline Failed.')
+        for record in records:
+            self.assertIsNotNone(record.direction, 'Streaming Link Message Failed.')
+
+    def test_collector(self):
+        collector = self.rwctest.start_collector(capacity = 16)
+        self.assertTrue(collector.is_running(), 'Starting Link Message Collector Failed.')
+        self.assertEqual(self.rwctest.rf_settxpower(-30), 'ACK', 'Sharing the Port with the Collector Failed.')
+        self.assertEqual(self.rwctest.rf_gettxpower(), '-30.0', 'Sharing the Port with the Collector Failed.')
+        self.rwctest.stop_collector()
+        self.assertFalse(collector.is_running(), 'Stopping Link Message Collector Failed.')
+        self.assertLessEqual(collector.stats()['buffered'], 16, 'Collector Capacity Failed.')
+
+    def test_dutycyclemonitor(self):
+        capture = RwcCapture()
+        monitor = self.rwctest.duty_cycle_monitor(window = 60)
+        self.rwctest.start_collector(capture = capture)
+        time.sleep(2)
+        self.rwctest.stop_collector()
+        self.assertLessEqual(monitor.update(capture), len(capture), 'Duty Cycle Update Failed.')
+        self.assertEqual(monitor.update(capture), 0, 'Incremental Duty Cycle Update Failed.')
+        for freq, dutyCycle in monitor.channels().items():
+            self.assertTrue(0 <= dutyCycle <= 1, 'Channel Duty Cycle Failed.')
+
+    def test_fieldprofile(self):
+        parser = self.rwctest.link_setfieldprofile('LEAN')
+        self.assertEqual(self.rwctest.link_getfcntdisplay(), 'ON', 'Lean Profile FCnt Display Failed.')
+        self.assertEqual(self.rwctest.link_getdrdisplay(), 'OFF', 'Lean Profile DR Display Failed.')
+        self.assertEqual(self.rwctest.link_msgparser().fields(), parser.fields(), 'Lean Profile Layout Failed.')
+        self.rwctest.link_setfieldprofile('FULL')
+        self.assertEqual(self.rwctest.link_getdrdisplay(), 'ON', 'Full Profile DR Display Failed.')
+
+    def test_pcap(self):
+        pcapName = os.path.join('logs', 'test_link.pcap')
+        with RwcPcapWriter(pcapName) as pcap:
+            self.rwctest.start_collector(trace = pcap)
+            time.sleep(2)
+            self.rwctest.stop_collector()
+            written = pcap.count
+        with open(pcapName, 'rb') as pcapFile:
+            self.assertEqual(pcapFile.read(4), bytes.fromhex('d4c3b2a1'), 'Writing pcap Header Failed.')
+        self.assertGreaterEqual(os.path.getsize(pcapName), 24 + 16 * written, 'Writing pcap Records Failed.')
+
+    def test_maccorrelator(self):
+        correlator = self.rwctest.mac_correlator(timeout = 30)
+        self.rwctest.start_collector(correlator = correlator)
+        self.assertEqual(self.rwctest.link_setnumofmaccmd(1), 'ACK', 'Num of MAC Command Failed.')
+        self.assertEqual(self.rwctest.link_setinstantmaccmd(1, 'DEV_STATUS'), 'ACK', 'Instant MAC Command Failed.')
+        self.assertEqual(self.rwctest.link_sendmac(), 'ACK', 'Sending MAC Command Failed.')
+        time.sleep(2)
+        self.rwctest.stop_collector()
+        for name, entry in correlator.stats().items():
+            self.assertLessEqual(sum(entry['fcnt'].values()), entry['count'], 'MAC Answer FCnt Distance Failed.')
+            if entry['count']:
+                self.assertLessEqual(entry['min'], entry['max'], 'MAC Answer Latency Failed.')
+
+    def test_waitfor(self):
+        startTime = time.time()
+        record = self.rwctest.wait_for({'uplink': True}, timeout = 2)
+        self.assertLess(time.time() - startTime, 4, 'Wait for Link Message Deadline Failed.')
+        if record is not None:
+            self.assertTrue(record.is_uplink(), 'Wait for Uplink Message Failed.')
+        self.assertIsNone(self.rwctest.wait_for_sequence(['ActivateTM', 'NoSuchCommand'], timeout = 1), 'Wait for Sequence Timeout Failed.')
+
+    def test_trace(self):
+        traceName = os.path.join('logs', 'test_trace.trc')
+        for fileName in (traceName, traceName + '.idx'):
+            if os.path.exists(fileName):
+                os.remove(fileName)
+        with RwcTraceWriter(traceName) as trace:
+            self.rwctest.start_collector(trace = trace)
+            time.sleep(2)
+            self.rwctest.stop_collector()
+            written = trace.count
+        with RwcTraceReader(traceName) as trace:
+            self.assertEqual(len(trace), written, 'Reopening Trace Failed.')
+            for index in trace.between(t1 = time.time()):
+                timestamp, record = trace.record(index)
+                self.assertIn(index, trace.find(fcnt = record.fcnt, msg_type = record.msg_type), 'Trace Index Query Failed.')
+
+    def test_traceindex(self):
+        traceName = os.path.join('logs', 'test_traceindex.trc')
+        for fileName in (traceName, traceName + '.idx'):
+            if os.path.exists(fileName):
+                os.remove(fileName)
+        with RwcTraceWriter(traceName) as trace:
+            trace.append(RwcLinkMsg(direction = 'UL', msg_type = 'ProprietaryUp1', fcnt = 1), 100.0)
+            trace.append(RwcLinkMsg(direction = 'UL', msg_type = 'ProprietaryUp2', fcnt = 2), 101.0)
+            trace.append(RwcLinkMsg(direction = 'UL', msg_type = 'ConfUp', fcnt = 3), 102.0)
+        os.remove(traceName + '.idx')
+        self.assertEqual(rebuild_index(traceName), 3, 'Rebuilding Trace Index Failed.')
+        with RwcTraceReader(traceName) as trace:
+            self.assertEqual(trace.find(msg_type = 'ProprietaryUp2'), [1], 'Trace Message Type Query Failed.')
+            self.assertEqual(trace.find(msg_type = 'ConfUp'), [2], 'Trace Message Type Query Failed.')
+            self.assertEqual(trace.entry(0)[3], 'ProprietaryUp1', 'Trace Index Entry Failed.')
+
+    def test_capture(self):
+        capture = RwcCapture(self.rwctest.query_regioninfo())
+        startTime = time.time()
+        self.rwctest.start_collector(capture = capture)
+        time.sleep(2)
+        self.rwctest.stop_collector()
+        uplinks = capture.select(uplink = True, t0 = startTime, t1 = time.time())
+        self.assertLessEqual(len(uplinks), len(capture), 'Capture Query Failed.')
+        for index in uplinks:
+            self.assertTrue(capture.record(index).is_uplink(), 'Capture Uplink Query Failed.')
+            record = capture.record(index)
+            if record.dr is not None:
+                self.assertIn(index, capture.select(dr = dr_number(record.dr)), 'Capture Data Rate Failed.')
+
+    def test_regioninfo(self):
+        region = self.rwctest.query_regioninfo('US_915')
+        self.assertEqual(region.channel_frequency(64), 903.0, 'US915 Channel Frequency Failed.')
+        self.assertEqual(region.channel_of(902.5), 1, 'US915 Channel of Frequency Failed.')
+        self.assertEqual(region.group_of(65), '08~15,65', 'US915 Channel Group Failed.')
+        self.assertEqual(self.rwctest.query_regioninfo().name, self.rwctest.protocol_getregion(), 'Tester Region Info Failed.')
+
+    def test_modewait(self):
+        self.assertEqual(self.rwctest.set_mode('GWT', wait = True), 'ACK', 'GWT change mode failed.')
+        self.assertEqual(self.rwctest.query_mode(), 'GWT', 'Failed to wait for the mode change.')
+        self.assertEqual(self.rwctest.set_mode('EDT', wait = True), 'ACK', 'EDT change mode failed.')
+        self.assertEqual(self.rwctest.query_mode(), 'EDT', 'Failed to wait for the mode change.')
+        self.assertTrue(self.rwctest.mode_latency(), 'Recording Mode Switch Latency Failed.')
+        latency = self.rwctest.mode_latency()
+        self.assertEqual(self.rwctest.set_mode('EDT', wait = True), 'ACK', 'EDT change mode failed.')
+        self.assertEqual(self.rwctest.mode_latency(), latency, 'Latency recorded without a mode change.')
+
+    def test_setdatetime(self):
+        report = self.rwctest.protocol_setdatetime(datetime.datetime(2026, 10, 19, 12, 30, 15))
+        self.assertIsNotNone(report['tester'], 'Reading Date and Time Failed.')
+        self.assertLess(abs(report['offset']), 2, 'Setting Date and Time Failed.')
+        self.assertEqual(self.rwctest.protocol_getyear(), '2026', 'Setting Year Failed.')
+
+    def test_setdatetimerollover(self):
+        self.assertEqual(self.rwctest.protocol_sethour('12'), 'ACK', 'Set Hour Value Failed')
+        with self.assertRaises(Exception):
+            self.rwctest.protocol_setdatetime(datetime.datetime(2026, 10, 19, 23, 59, 59))
+        self.assertEqual(self.rwctest.protocol_gethour(), '12', 'Rolled over Date and Time sent.')
+
+    def test_macscenario(self):
+        scenario = RwcMacScenario(MAC_CMD_TYPE = 'UNCONFIRMED')
+        scenario.add('LINK_ADR', ADR_TXPOW = 2).add('DEV_STATUS')
+        results = self.rwctest.run_scenario(scenario)
+        self.assertEqual(len(results), 5, 'Compiling MAC Scenario Failed.')
+        self.assertEqual(self.rwctest.link_getnumofmaccmd(), '2', 'Scenario Num of MAC Command Failed.')
+        self.assertEqual(self.rwctest.link_getinstantmaccmd(2), 'DEV_STATUS', 'Scenario MAC Command Failed.')
+
+    def test_validateconfig(self):
+        region = self.rwctest.protocol_getregion()
+        config = {'PROTOCOL:REGION': 'US_915', 'RF:CH_GROUP': '00~07', 'PROTOCOL:UPLINK_DR': 'DR5_SF7BW125'}
+        with self.assertRaises(RwcConfigError):
+            self.rwctest.apply(config)
+        self.assertEqual(self.rwctest.protocol_getregion(), region, 'Invalid configuration was sent to the tester.')
+
+    def test_slotmanager(self):
+        slots = RwcSlotManager(self.rwctest, slots = [8, 9])
+        self.assertEqual(slots.select({'RF:TX_POW': -30})['action'], 'SAVED', 'Saving Profile to Slot Failed.')
+        self.assertEqual(slots.select({'RF:TX_POW': -40})['action'], 'SAVED', 'Saving Profile to Slot Failed.')
+        self.assertEqual(slots.select({'RF:TX_POW': -30})['action'], 'RECALLED', 'Recalling Profile from Slot Failed.')
+        self.assertEqual(self.rwctest.rf_gettxpower(), '-30.0', 'Recalled TX Power Failed.')
+
     @classmethod
     def tearDownClass(self):
         self.assertTrue(self.rwctest.close_port(), 'Failed to close the port')